@@ -6,6 +6,7 @@ pragma experimental ABIEncoderV2;
 import "OpenZeppelin/openzeppelin-contracts-upgradeable@3.4.0/contracts/utils/AddressUpgradeable.sol";
 import "OpenZeppelin/openzeppelin-contracts-upgradeable@3.4.0/contracts/math/MathUpgradeable.sol";
 import "OpenZeppelin/openzeppelin-contracts-upgradeable@3.4.0/contracts/math/SafeMathUpgradeable.sol";
+import "OpenZeppelin/openzeppelin-contracts-upgradeable@3.4.0/contracts/utils/SafeCastUpgradeable.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/IERC20.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC20.sol";
 import "OpenZeppelin/openzeppelin-contracts-upgradeable@3.4.0/contracts/token/ERC20/ERC20Upgradeable.sol";
@@ -13,6 +14,7 @@ import "OpenZeppelin/openzeppelin-contracts-upgradeable@3.4.0/contracts/utils/Re
 import "../../interfaces/IFund.sol";
 import "../../interfaces/IFundProxy.sol";
 import "../../interfaces/IStrategy.sol";
+import "../../interfaces/IStrategyRoles.sol";
 import "../utils/Governable.sol";
 import "./FundStorage.sol";
 
@@ -26,6 +28,7 @@ contract Fund is
     using SafeERC20 for IERC20;
     using AddressUpgradeable for address;
     using SafeMathUpgradeable for uint256;
+    using SafeCastUpgradeable for uint256;
     using SafeMathUpgradeable for uint8;
 
     event Withdraw(address indexed beneficiary, uint256 amount);
@@ -43,6 +46,36 @@ contract Fund is
         uint256 platformFee
     );
     event HardWorkDone(uint256 totalValueLocked, uint256 pricePerShare);
+    event HardWorkRangeDone(
+        uint256 start,
+        uint256 end,
+        uint256 totalValueLocked,
+        uint256 pricePerShare
+    );
+    event NavCacheUpdated(uint256 strategiesBalance, uint256 timestamp);
+    event StrategyHardWorkFailed(address indexed strategy, bytes reason);
+    event DepositQueued(
+        address indexed beneficiary,
+        uint256 indexed epoch,
+        uint256 amount
+    );
+    event WithdrawalQueued(
+        address indexed beneficiary,
+        uint256 indexed epoch,
+        uint256 numberOfShares
+    );
+    event BufferStatus(
+        uint256 idleBalance,
+        uint256 targetBalance,
+        uint256 withdrawalsFromBuffer,
+        uint256 withdrawalsFromStrategies
+    );
+    event QueueSettled(
+        uint256 indexed epoch,
+        uint256 pricePerShare,
+        uint256 sharesMinted,
+        uint256 sharesBurned
+    );
 
     event StrategyAdded(
         address indexed strategy,
@@ -57,7 +90,12 @@ contract Fund is
         address indexed strategy,
         uint256 newPerformanceFeeStrategy
     );
+    event StrategyMovementCostUpdated(
+        address indexed strategy,
+        uint256 newMovementCost
+    );
     event StrategyRemoved(address indexed strategy);
+    event FeesClaimed(address indexed beneficiary, uint256 shares);
 
     address internal constant ZERO_ADDRESS = address(0);
 
@@ -68,7 +106,9 @@ contract Fund is
     uint256 internal constant MAX_PERFORMANCE_FEE_FUND = 1000; // 10% on profits, goes to fund manager
     uint256 internal constant MAX_PERFORMANCE_FEE_STRATEGY = 1000; // 10% on profits, goes to strategy creator
 
-    uint256 internal constant MAX_ACTIVE_STRATEGIES = 10; // To save on potential out of gas issues
+    uint256 internal constant MAX_ACTIVE_STRATEGIES = 30; // To save on potential out of gas issues, funds with many strategies can use doHardWorkRange
+
+    uint256 internal constant MAX_NAV_CACHE_AGE = 7 days; // Cached strategy valuation can not be older than this
 
     struct StrategyParams {
         uint256 weightage; // weightage of total assets in fund this strategy can access (in BPS) (5000 for 50%)
@@ -78,9 +118,33 @@ contract Fund is
         uint256 indexInList;
     }
 
-    mapping(address => StrategyParams) public strategies;
+    // Replaced by strategyParams. Kept for the storage layout, and read only to migrate funds deployed before.
+    mapping(address => StrategyParams) internal legacyStrategies;
     address[] public strategyList;
 
+    struct QueuedRequest {
+        uint256 epoch; // epoch in which the request was made, settled at the hard work closing this epoch
+        uint256 depositAmount; // underlying waiting to be converted to shares
+        uint256 withdrawShares; // shares waiting to be converted to underlying
+    }
+
+    mapping(address => QueuedRequest) public queuedRequests;
+    mapping(uint256 => uint256) public epochPricePerShare; // price per share each epoch was settled at
+    mapping(address => uint256) public strategyMovementCost; // relative cost of moving capital in or out of a strategy
+
+    // Same as StrategyParams, packed in a single slot to read and update each strategy with a single sload and sstore.
+    struct PackedStrategyParams {
+        uint16 weightage;
+        uint16 performanceFeeStrategy;
+        uint16 indexInList;
+        uint64 activation;
+        uint128 lastBalance;
+    }
+
+    mapping(address => PackedStrategyParams) internal strategyParams;
+
+    mapping(address => uint256) public claimableFeeShares; // fee shares held by the fund until claimed by the beneficiary
+
     // solhint-disable-next-line no-empty-blocks
     constructor() public {}
 
@@ -141,6 +205,16 @@ contract Fund is
         _;
     }
 
+    modifier whenQueueModeActive() {
+        require(_queueModeEnabled(), "Queue mode is not active");
+        _;
+    }
+
+    modifier whenQueueModeNotActive() {
+        require(!_queueModeEnabled(), "Queue mode is active");
+        _;
+    }
+
     function fundManager() external view override returns (address) {
         return _fundManager();
     }
@@ -179,14 +253,66 @@ contract Fund is
         view
         returns (StrategyParams memory)
     {
-        return strategies[strategy];
+        PackedStrategyParams memory params = strategyParams[strategy];
+        return
+            StrategyParams({
+                weightage: params.weightage,
+                performanceFeeStrategy: params.performanceFeeStrategy,
+                activation: params.activation,
+                lastBalance: params.lastBalance,
+                indexInList: params.indexInList
+            });
+    }
+
+    /*
+     * Same as the getter of the strategies mapping, which was replaced by the packed strategy params.
+     */
+    function strategies(address strategy)
+        external
+        view
+        returns (
+            uint256 weightage,
+            uint256 performanceFeeStrategy,
+            uint256 activation,
+            uint256 lastBalance,
+            uint256 indexInList
+        )
+    {
+        PackedStrategyParams memory params = strategyParams[strategy];
+        return (
+            params.weightage,
+            params.performanceFeeStrategy,
+            params.activation,
+            params.lastBalance,
+            params.indexInList
+        );
+    }
+
+    /*
+     * Removes the underlying that belongs to queued deposits and settled withdrawals.
+     * This underlying is held by the fund, but it is not part of the fund's assets.
+     */
+    function _withoutQueuedUnderlying(uint256 underlyingBalance)
+        internal
+        view
+        returns (uint256)
+    {
+        uint256 queuedUnderlying =
+            _pendingDeposits().add(_reservedWithdrawals());
+        return
+            underlyingBalance > queuedUnderlying
+                ? underlyingBalance - queuedUnderlying
+                : 0;
     }
 
     /*
      * Returns the underlying balance currently in the fund.
      */
     function underlyingBalanceInFund() internal view returns (uint256) {
-        return IERC20(_underlying()).balanceOf(address(this));
+        return
+            _withoutQueuedUnderlying(
+                IERC20(_underlying()).balanceOf(address(this))
+            );
     }
 
     /*
@@ -194,25 +320,125 @@ contract Fund is
      * the invested amount (if DAI is invested elsewhere by the strategies).
      */
     function underlyingBalanceWithInvestment() internal view returns (uint256) {
-        uint256 underlyingBalance = underlyingBalanceInFund();
-        for (uint256 i; i < _getStrategyCount(); i++) {
+        address[] memory list = strategyList;
+        uint256 underlyingBalance =
+            IERC20(_underlying()).balanceOf(address(this));
+        for (uint256 i; i < list.length; i++) {
             underlyingBalance = underlyingBalance.add(
-                IStrategy(strategyList[i]).investedUnderlyingBalance()
+                IStrategy(list[i]).investedUnderlyingBalance()
+            );
+        }
+        return _withoutQueuedUnderlying(underlyingBalance);
+    }
+
+    /*
+     * Reads the invested balance of every given strategy once. The hard work uses this snapshot
+     * for fees, rebalance targets and the final event instead of querying the strategies again.
+     */
+    function _getStrategyBalances(address[] memory list)
+        internal
+        returns (uint256[] memory)
+    {
+        uint256[] memory strategyBalances = new uint256[](list.length);
+        for (uint256 i; i < list.length; i++) {
+            strategyBalances[i] = _strategyBalance(list[i]);
+        }
+        return strategyBalances;
+    }
+
+    /*
+     * In resilient mode, a strategy whose balance can not be read (e.g. its protocol is paused)
+     * is reported and valued at its balance from the last hard work.
+     */
+    function _strategyBalance(address strategy) internal returns (uint256) {
+        if (!_resilientHardWork()) {
+            return IStrategy(strategy).investedUnderlyingBalance();
+        }
+        try IStrategy(strategy).investedUnderlyingBalance() returns (
+            uint256 strategyBalance
+        ) {
+            return strategyBalance;
+        } catch (bytes memory reason) {
+            emit StrategyHardWorkFailed(strategy, reason);
+            return strategyParams[strategy].lastBalance;
+        }
+    }
+
+    /*
+     * Same as underlyingBalanceWithInvestment, but uses a snapshot of the strategy balances.
+     */
+    function _underlyingBalanceWithSnapshot(uint256[] memory strategyBalances)
+        internal
+        view
+        returns (uint256)
+    {
+        return _underlyingBalanceWithSnapshot(0, strategyBalances);
+    }
+
+    /*
+     * Same as above for a snapshot of some of the strategies,
+     * with the last known balance of all the other strategies.
+     */
+    function _underlyingBalanceWithSnapshot(
+        uint256 otherStrategiesBalance,
+        uint256[] memory strategyBalances
+    ) internal view returns (uint256) {
+        uint256 underlyingBalance =
+            IERC20(_underlying()).balanceOf(address(this)).add(
+                otherStrategiesBalance
             );
+        for (uint256 i; i < strategyBalances.length; i++) {
+            underlyingBalance = underlyingBalance.add(strategyBalances[i]);
+        }
+        return _withoutQueuedUnderlying(underlyingBalance);
+    }
+
+    /*
+     * Returns true if the cached strategy valuation can be used to price deposits and withdrawals.
+     * The cache is only valid in cached NAV mode and within the allowed age since the last hard work.
+     */
+    function _isNavCacheValid() internal view returns (bool) {
+        uint256 navCacheTimestamp = _navCacheTimestamp();
+        return
+            _navCacheEnabled() &&
+            navCacheTimestamp > 0 &&
+            // solhint-disable-next-line not-rely-on-time
+            block.timestamp <= navCacheTimestamp.add(_navCacheMaxAge());
+    }
+
+    /*
+     * Returns the total underlying used to price the shares.
+     * In cached NAV mode, the strategy valuation stored at the last hard work is used instead of
+     * calling every strategy. The fund balance is always read live, so deposits are included as they arrive.
+     */
+    function _totalUnderlying() internal view returns (uint256) {
+        if (_isNavCacheValid()) {
+            return
+                _withoutQueuedUnderlying(
+                    IERC20(_underlying()).balanceOf(address(this)).add(
+                        _cachedStrategiesBalance()
+                    )
+                );
         }
-        return underlyingBalance;
+        return underlyingBalanceWithInvestment();
     }
 
     /*
      * Returns price per share, scaled by underlying unit (10 ** decimals) to keep everything in uint256.
      */
     function _getPricePerShare() internal view returns (uint256) {
+        return _getPricePerShare(_totalUnderlying());
+    }
+
+    function _getPricePerShare(uint256 totalUnderlying)
+        internal
+        view
+        returns (uint256)
+    {
         return
             totalSupply() == 0
                 ? _underlyingUnit()
-                : _underlyingUnit().mul(underlyingBalanceWithInvestment()).div(
-                    totalSupply()
-                );
+                : _underlyingUnit().mul(totalUnderlying).div(totalSupply());
     }
 
     function getPricePerShare() external view override returns (uint256) {
@@ -236,8 +462,7 @@ contract Fund is
         view
         returns (uint256)
     {
-        return
-            underlyingBalanceWithInvestment().mul(numShares).div(totalSupply());
+        return _totalUnderlying().mul(numShares).div(totalSupply());
     }
 
     /*
@@ -256,7 +481,7 @@ contract Fund is
     }
 
     function isActiveStrategy(address strategy) internal view returns (bool) {
-        return strategies[strategy].weightage > 0;
+        return strategyParams[strategy].weightage > 0;
     }
 
     function addStrategy(
@@ -289,14 +514,18 @@ contract Fund is
             "Performance fee too high"
         );
 
-        strategies[newStrategy].weightage = weightage;
+        strategyParams[newStrategy] = PackedStrategyParams({
+            weightage: weightage.toUint16(),
+            performanceFeeStrategy: performanceFeeStrategy.toUint16(),
+            indexInList: _getStrategyCount().toUint16(),
+            // solhint-disable-next-line not-rely-on-time
+            activation: block.timestamp.toUint64(),
+            lastBalance: 0
+        });
         _setTotalWeightInStrategies(totalWeightInStrategies);
-        // solhint-disable-next-line not-rely-on-time
-        strategies[newStrategy].activation = block.timestamp;
-        strategies[newStrategy].indexInList = _getStrategyCount();
-        strategies[newStrategy].performanceFeeStrategy = performanceFeeStrategy;
         strategyList.push(newStrategy);
         _setShouldRebalance(true);
+        _syncStrategyRoles(newStrategy);
 
         emit StrategyAdded(newStrategy, weightage, performanceFeeStrategy);
     }
@@ -314,21 +543,31 @@ contract Fund is
             "This strategy is not active in this fund"
         );
 
+        PackedStrategyParams memory params = strategyParams[activeStrategy];
         _setTotalWeightInStrategies(
-            _totalWeightInStrategies().sub(strategies[activeStrategy].weightage)
+            _totalWeightInStrategies().sub(params.weightage)
         );
         uint256 totalStrategies = _getStrategyCount();
         if (totalStrategies > 1) {
-            uint256 i = strategies[activeStrategy].indexInList;
+            uint256 i = params.indexInList;
             if (i != (totalStrategies - 1)) {
-                strategyList[i] = strategyList[totalStrategies - 1];
-                strategies[strategyList[i]].indexInList = i;
+                address lastStrategy = strategyList[totalStrategies - 1];
+                strategyList[i] = lastStrategy;
+                strategyParams[lastStrategy].indexInList = params.indexInList;
             }
         }
         strategyList.pop();
-        delete strategies[activeStrategy];
+        uint256 totalInvested = _totalInvested();
+        _setTotalInvested(
+            totalInvested > params.lastBalance
+                ? totalInvested - params.lastBalance
+                : 0
+        ); // the balance of this strategy moves to the fund
+        delete strategyParams[activeStrategy];
+        delete strategyMovementCost[activeStrategy];
         IStrategy(activeStrategy).withdrawAllToFund();
         _setShouldRebalance(true);
+        _setNavCacheTimestamp(0); // valuation of the remaining strategies is unknown until the next hard work
 
         emit StrategyRemoved(activeStrategy);
     }
@@ -348,7 +587,7 @@ contract Fund is
         require(newWeightage > 0, "The weightage should be greater than 0");
         uint256 totalWeightInStrategies =
             _totalWeightInStrategies()
-                .sub(strategies[activeStrategy].weightage)
+                .sub(strategyParams[activeStrategy].weightage)
                 .add(newWeightage);
         require(
             totalWeightInStrategies <= _maxInvestmentInStrategies(),
@@ -356,7 +595,7 @@ contract Fund is
         );
 
         _setTotalWeightInStrategies(totalWeightInStrategies);
-        strategies[activeStrategy].weightage = newWeightage;
+        strategyParams[activeStrategy].weightage = newWeightage.toUint16();
         _setShouldRebalance(true);
 
         emit StrategyWeightageUpdated(activeStrategy, newWeightage);
@@ -379,8 +618,8 @@ contract Fund is
             "Performance fee too high"
         );
 
-        strategies[activeStrategy]
-            .performanceFeeStrategy = newPerformanceFeeStrategy;
+        strategyParams[activeStrategy]
+            .performanceFeeStrategy = newPerformanceFeeStrategy.toUint16();
 
         emit StrategyPerformanceFeeUpdated(
             activeStrategy,
@@ -388,6 +627,28 @@ contract Fund is
         );
     }
 
+    /*
+     * The movement cost is only used to order the strategies when the rebalance movement is capped.
+     * It can be any relative measure, e.g. the exit and entry slippage in BPS.
+     */
+    function updateStrategyMovementCost(
+        address activeStrategy,
+        uint256 newMovementCost
+    ) external onlyFundManager {
+        require(
+            activeStrategy != ZERO_ADDRESS,
+            "current strategy cannot be empty"
+        );
+        require(
+            isActiveStrategy(activeStrategy),
+            "This strategy is not active in this fund"
+        );
+
+        strategyMovementCost[activeStrategy] = newMovementCost;
+
+        emit StrategyMovementCostUpdated(activeStrategy, newMovementCost);
+    }
+
     /**
      *** This checks for all the three fees,
      *** strategy creator fee (on profit) for each strategy,
@@ -397,79 +658,60 @@ contract Fund is
      *** Fund shares are minted for the same using current price per share of the fund.
      *** This is same as getting the fee in underlying and
      *** then depositing the underlying back in the fund.
+     *** Strategy balances are taken from the snapshot read at the start of the hard work,
+     *** for the given strategies (all of them for the full hard work).
+     *** The platform fee is accrued for the whole fund since the last hard work of any range.
      **/
-    function processFees() internal {
-        uint256 totalStrategies = _getStrategyCount();
-        uint256[] memory strategyCreatorFees = new uint256[](totalStrategies);
-        uint256[] memory strategyProfits = new uint256[](totalStrategies);
-        uint256 profitToFund = 0; // Profit to fund is the profit from each strategy minus the fee paid out to strategy creators.
-        uint256 totalFee = 0; // This will represent the total fee in underlying and will be used to mint fund shares.
-
-        for (uint256 i; i < totalStrategies; i++) {
-            address strategy = strategyList[i];
-
-            uint256 profit = 0; // Profit for this strategy
-            uint256 strategyCreatorFee = 0;
-
-            if (
-                // If there is profit
-                IStrategy(strategy).investedUnderlyingBalance() >
-                strategies[strategy].lastBalance
-            ) {
-                profit =
-                    IStrategy(strategy).investedUnderlyingBalance() -
-                    strategies[strategy].lastBalance; // Profit for this strategy
-                strategyCreatorFee = profit
-                    .mul(strategies[strategy].performanceFeeStrategy)
-                    .div(MAX_BPS); // Fee to be paid to the creator based on the profit it made in the last cycle
-                strategyProfits[i] = profit;
-                strategyCreatorFees[i] = strategyCreatorFee;
-                totalFee = totalFee.add(strategyCreatorFee);
-                profitToFund = profitToFund.add(profit).sub(strategyCreatorFee);
-            }
-            strategies[strategy].lastBalance = IStrategy(strategy)
-                .investedUnderlyingBalance(); // Update the last balance
-        }
+    function processFees(
+        address[] memory list,
+        uint256[] memory strategyBalances,
+        uint256 otherStrategiesBalance
+    ) internal {
+        (
+            uint256[] memory strategyCreatorFees,
+            uint256[] memory strategyProfits,
+            uint256 profitToFund, // Profit to fund is the profit from each strategy minus the fee paid out to strategy creators.
+            uint256 totalFee // This will represent the total fee in underlying and will be used to mint fund shares.
+        ) = _processStrategyProfits(list, strategyBalances);
 
         uint256 fundManagerFee =
             profitToFund.mul(_performanceFeeFund()).div(MAX_BPS); // Fee to be paid to the fund manager based on the profit fund made in the last cycle
         totalFee = totalFee.add(fundManagerFee);
 
-        uint256 timeSinceLastHardwork =
-            // solhint-disable-next-line not-rely-on-time
-            block.timestamp.sub(_lastHardworkTimestamp()); // The time between 2 hardwork cycles
-        uint256 totalInvested = _totalInvested(); // Was updated during last cycle of hard work
-
-        uint256 platformFee =
-            totalInvested.mul(timeSinceLastHardwork).mul(_platformFee()).div(
-                MAX_BPS * SECS_PER_YEAR
-            ); // Platform fee is based on the AUM
+        uint256 platformFee = _accruedPlatformFee(); // Platform fee is based on the AUM
         totalFee = totalFee.add(platformFee);
 
         uint256 totalFeeInShares =
             (totalFee == 0 || totalSupply() == 0)
                 ? totalFee
                 : totalFee.mul(totalSupply()).div(
-                    underlyingBalanceWithInvestment()
+                    _underlyingBalanceWithSnapshot(
+                        otherStrategiesBalance,
+                        strategyBalances
+                    )
                 ); // If total fee is zero, totalFeeInShares is also 0. Otherwise, go to default share calculation. Similar to deposit.
         if (totalFeeInShares > 0) {
             _mint(address(this), totalFeeInShares); // Mint all the fee shares once to save on gas and have a consistent price per share for all.
         }
 
         // From the total minted shares, each strategy creator, fund manager and platform will get shares in the ratio of the fees.
+        // The shares stay in the fund and are claimed by the beneficiaries, to keep the transfers out of the hard work.
+        // With a fee distributor, strategy creator and platform shares all go to the distributor in a single entry,
+        // and are allocated off chain from the StrategyRewards and PlatformRewards events.
 
-        for (uint256 i; i < totalStrategies; i++) {
+        for (uint256 i; i < list.length; i++) {
             if (strategyCreatorFees[i] > 0) {
                 uint256 strategyCreatorFeeInShares =
                     totalFeeInShares.mul(strategyCreatorFees[i]).div(totalFee);
                 if (strategyCreatorFeeInShares > 0) {
-                    address strategy = strategyList[i];
-                    IERC20(address(this)).safeTransfer(
-                        IStrategy(strategy).creator(),
-                        strategyCreatorFeeInShares
-                    ); // Transfer the shares to strategy creator
+                    if (_feeDistributor() == ZERO_ADDRESS) {
+                        _accrueFeeShares(
+                            IStrategy(list[i]).creator(),
+                            strategyCreatorFeeInShares
+                        ); // Shares to strategy creator
+                    } // Otherwise accrued to the distributor with the rest below
                     emit StrategyRewards(
-                        strategy,
+                        list[i],
                         strategyProfits[i],
                         strategyCreatorFeeInShares
                     );
@@ -485,10 +727,7 @@ contract Fund is
                     (_fundManager() == _governance())
                         ? _platformRewards()
                         : _fundManager();
-                IERC20(address(this)).safeTransfer(
-                    fundManagerRewards,
-                    fundManagerFeeInShares
-                ); // Transfer the shares to fund manager
+                _accrueFeeShares(fundManagerRewards, fundManagerFeeInShares); // Shares to fund manager
                 emit FundManagerRewards(profitToFund, fundManagerFeeInShares);
             }
         }
@@ -497,22 +736,103 @@ contract Fund is
             uint256 platformFeeInShares =
                 totalFeeInShares.mul(platformFee).div(totalFee);
             emit PlatformRewards(
-                totalInvested,
-                timeSinceLastHardwork,
+                _totalInvested(),
+                // solhint-disable-next-line not-rely-on-time
+                block.timestamp.sub(_lastHardworkTimestamp()),
                 platformFeeInShares
             );
         }
 
-        // transfer the rest including platformFeeInShares and any dust remaining
-        // (since this contract will never have shares of itself apart from fees.)
-        uint256 selfBalance = IERC20(address(this)).balanceOf(address(this));
+        // the rest including platformFeeInShares and any dust remaining goes to platform, or to the fee distributor
+        // (since this contract will never have shares of itself apart from fees and queued requests.)
+        uint256 selfBalance =
+            IERC20(address(this))
+                .balanceOf(address(this))
+                .sub(_pendingWithdrawShares())
+                .sub(_unclaimedDepositShares())
+                .sub(_unclaimedFeeShares());
         if (selfBalance > 0) {
-            IERC20(address(this)).safeTransfer(_platformRewards(), selfBalance);
+            address feeDistributor = _feeDistributor();
+            _accrueFeeShares(
+                feeDistributor == ZERO_ADDRESS
+                    ? _platformRewards()
+                    : feeDistributor,
+                selfBalance
+            );
+        }
+    }
+
+    function _accrueFeeShares(address beneficiary, uint256 shares) internal {
+        claimableFeeShares[beneficiary] = claimableFeeShares[beneficiary].add(
+            shares
+        );
+        _setUnclaimedFeeShares(_unclaimedFeeShares().add(shares));
+    }
+
+    /*
+     * Returns the profit and the creator fee of each strategy since its last hard work,
+     * the profit to fund and the total creator fee, and updates the last balance of each strategy.
+     */
+    function _processStrategyProfits(
+        address[] memory list,
+        uint256[] memory strategyBalances
+    )
+        internal
+        returns (
+            uint256[] memory,
+            uint256[] memory,
+            uint256,
+            uint256
+        )
+    {
+        uint256[] memory strategyCreatorFees = new uint256[](list.length);
+        uint256[] memory strategyProfits = new uint256[](list.length);
+        uint256 profitToFund = 0;
+        uint256 totalCreatorFee = 0;
+
+        for (uint256 i; i < list.length; i++) {
+            PackedStrategyParams storage params = strategyParams[list[i]];
+            uint256 lastBalance = params.lastBalance;
+
+            if (
+                // If there is profit
+                strategyBalances[i] > lastBalance
+            ) {
+                uint256 profit = strategyBalances[i] - lastBalance; // Profit for this strategy
+                uint256 strategyCreatorFee =
+                    profit.mul(params.performanceFeeStrategy).div(MAX_BPS); // Fee to be paid to the creator based on the profit it made in the last cycle
+                strategyProfits[i] = profit;
+                strategyCreatorFees[i] = strategyCreatorFee;
+                totalCreatorFee = totalCreatorFee.add(strategyCreatorFee);
+                profitToFund = profitToFund.add(profit).sub(strategyCreatorFee);
+            }
+            params.lastBalance = strategyBalances[i].toUint128(); // Update the last balance
         }
+        return (
+            strategyCreatorFees,
+            strategyProfits,
+            profitToFund,
+            totalCreatorFee
+        );
+    }
+
+    /*
+     * Returns the platform fee (in underlying) accrued on the capital in strategies since the last hard work.
+     */
+    function _accruedPlatformFee() internal view returns (uint256) {
+        uint256 timeSinceLastHardwork =
+            // solhint-disable-next-line not-rely-on-time
+            block.timestamp.sub(_lastHardworkTimestamp()); // The time between 2 hardwork cycles
+        return
+            _totalInvested()
+                .mul(timeSinceLastHardwork)
+                .mul(_platformFee())
+                .div(MAX_BPS * SECS_PER_YEAR); // total invested was updated during last cycle of hard work
     }
 
     /*
      * Invests the underlying capital to various strategies. Looks for weightage changes.
+     * Each strategy balance is read once before and once after its hard work.
      */
     function doHardWork()
         external
@@ -520,132 +840,551 @@ contract Fund is
         whenStrategyDefined
         onlyFundManagerOrRelayer
     {
+        address[] memory list = strategyList; // read the list from storage once
+        uint256[] memory strategyBalances = _getStrategyBalances(list);
         if (_lastHardworkTimestamp() > 0) {
-            processFees();
+            processFees(list, strategyBalances, 0);
+        }
+        if (_pendingDeposits() > 0 || _pendingWithdrawShares() > 0) {
+            _settleQueue(strategyBalances);
         }
         // ensure that new funds are invested too
 
-        if (_shouldRebalance()) {
+        uint256 totalInStrategies;
+        if (_shouldRebalance() || _isBufferOutsideBand(strategyBalances)) {
             _setShouldRebalance(false);
-            doHardWorkWithRebalance();
+            totalInStrategies = doHardWorkWithRebalance(list, strategyBalances);
+        } else if (_bufferTargetBps() > 0) {
+            totalInStrategies = doHardWorkInPlace(list);
         } else {
-            doHardWorkWithoutRebalance();
+            totalInStrategies = doHardWorkWithoutRebalance(list);
+        }
+        if (_bufferTargetBps() > 0) {
+            _reportBufferStatus(totalInStrategies);
+        }
+        uint256 totalUnderlyingWithInvestment =
+            _afterHardWork(totalInStrategies);
+        if (!_fullHardWorkDone()) {
+            _setFullHardWorkDone(true);
         }
-        // solhint-disable-next-line not-rely-on-time
-        _setLastHardworkTimestamp(block.timestamp);
         emit HardWorkDone(
-            underlyingBalanceWithInvestment(),
-            _getPricePerShare()
+            totalUnderlyingWithInvestment,
+            _getPricePerShare(totalUnderlyingWithInvestment)
         );
     }
 
-    function doHardWorkWithoutRebalance() internal {
-        uint256 totalAccounted = _totalAccounted();
-        uint256 lastReserve =
-            totalAccounted > 0 ? totalAccounted.sub(_totalInvested()) : 0;
-        uint256 availableAmountToInvest =
-            underlyingBalanceInFund() > lastReserve
-                ? underlyingBalanceInFund().sub(lastReserve)
-                : 0;
-
-        // if (availableAmountToInvest == 0) {
-        //     return;
-        // }
+    /*
+     * Does the hard work for the strategies from start (inclusive) to end (exclusive) in the strategy list.
+     * Fees are processed for these strategies only, while the platform fee is accrued for the whole fund.
+     * These strategies are moved towards their weightage, other strategies are valued at their last balance.
+     * Queued requests are settled and other strategies are rebalanced only by doHardWork.
+     * The last balances are only in line with total invested once doHardWork has run (again after an upgrade).
+     */
+    function doHardWorkRange(uint256 start, uint256 end)
+        external
+        nonReentrant
+        whenStrategyDefined
+        onlyFundManagerOrRelayer
+    {
+        require(
+            start < end && end <= _getStrategyCount(),
+            "Invalid strategy range"
+        );
+        _doHardWorkRange(start, end);
+    }
 
-        _setTotalAccounted(totalAccounted.add(availableAmountToInvest));
-        uint256 totalInvested = 0;
+    /*
+     * Does the hard work for a single strategy, e.g. to harvest high yield strategies more often.
+     */
+    function doHardWorkFor(address activeStrategy)
+        external
+        nonReentrant
+        whenStrategyDefined
+        onlyFundManagerOrRelayer
+    {
+        require(
+            isActiveStrategy(activeStrategy),
+            "This strategy is not active in this fund"
+        );
+        uint256 index = strategyParams[activeStrategy].indexInList;
+        _doHardWorkRange(index, index + 1);
+    }
 
-        for (uint256 i; i < _getStrategyCount(); i++) {
-            address strategy = strategyList[i];
-            uint256 availableAmountForStrategy =
-                availableAmountToInvest.mul(strategies[strategy].weightage).div(
-                    MAX_BPS
-                );
-            if (availableAmountForStrategy > 0) {
-                IERC20(_underlying()).safeTransfer(
-                    strategy,
-                    availableAmountForStrategy
-                );
-                totalInvested = totalInvested.add(availableAmountForStrategy);
-                emit InvestInStrategy(strategy, availableAmountForStrategy);
-            }
+    function _doHardWorkRange(uint256 start, uint256 end) internal {
+        require(_fullHardWorkDone(), "Full hard work required first");
+        address[] memory list = new address[](end - start);
+        uint256 otherStrategiesBalance = _totalInvested(); // sum of last balances of all the strategies
+        for (uint256 i; i < list.length; i++) {
+            list[i] = strategyList[start + i];
+            otherStrategiesBalance = otherStrategiesBalance.sub(
+                strategyParams[list[i]].lastBalance
+            );
+        }
+        uint256[] memory strategyBalances = _getStrategyBalances(list);
+        if (_lastHardworkTimestamp() > 0) {
+            processFees(list, strategyBalances, otherStrategiesBalance);
+        }
 
-            IStrategy(strategy).doHardWork();
+        uint256[] memory targets =
+            _rebalanceTargets(
+                _underlyingBalanceWithSnapshot(
+                    otherStrategiesBalance,
+                    strategyBalances
+                ),
+                list,
+                strategyBalances
+            );
+        uint256[] memory order = _rebalanceOrder(list);
+        _withdrawAboveTargets(list, strategyBalances, targets, order);
+        uint256 totalInStrategies =
+            otherStrategiesBalance.add(
+                _depositBelowTargets(list, strategyBalances, targets, order)
+            );
 
-            strategies[strategy].lastBalance = IStrategy(strategy)
-                .investedUnderlyingBalance();
-        }
-        _setTotalInvested(totalInvested);
+        uint256 totalUnderlyingWithInvestment =
+            _afterHardWork(totalInStrategies);
+        emit HardWorkRangeDone(
+            start,
+            end,
+            totalUnderlyingWithInvestment,
+            _getPricePerShare(totalUnderlyingWithInvestment)
+        );
     }
 
-    function doHardWorkWithRebalance() internal {
+    /*
+     * Updates the bookkeeping after the hard work of all or some of the strategies.
+     * Total invested is the sum of the last balances of all the strategies,
+     * and total accounted also includes the underlying balance in the fund.
+     * Returns the total underlying with investment.
+     */
+    function _afterHardWork(uint256 totalInStrategies)
+        internal
+        returns (uint256)
+    {
         uint256 totalUnderlyingWithInvestment =
-            underlyingBalanceWithInvestment();
+            underlyingBalanceInFund().add(totalInStrategies);
+        _setTotalInvested(totalInStrategies);
         _setTotalAccounted(totalUnderlyingWithInvestment);
-        uint256 totalInvested = 0;
-        uint256 totalStrategies = _getStrategyCount();
-        uint256[] memory toDeposit = new uint256[](totalStrategies);
-
-        for (uint256 i; i < totalStrategies; i++) {
-            address strategy = strategyList[i];
-            uint256 shouldBeInStrategy =
-                totalUnderlyingWithInvestment
-                    .mul(strategies[strategy].weightage)
-                    .div(MAX_BPS);
-            totalInvested = totalInvested.add(shouldBeInStrategy);
-            uint256 currentlyInStrategy =
-                IStrategy(strategy).investedUnderlyingBalance();
-            if (currentlyInStrategy > shouldBeInStrategy) {
-                // withdraw from strategy
-                IStrategy(strategy).withdrawToFund(
-                    currentlyInStrategy.sub(shouldBeInStrategy)
-                );
-            } else if (shouldBeInStrategy > currentlyInStrategy) {
-                // can not directly deposit here as there might not be enough balance before withdrawing from required strategies
-                toDeposit[i] = shouldBeInStrategy.sub(currentlyInStrategy);
-            }
+        // solhint-disable-next-line not-rely-on-time
+        _setLastHardworkTimestamp(block.timestamp);
+        if (_navCacheEnabled()) {
+            _updateNavCache(totalInStrategies);
         }
-        _setTotalInvested(totalInvested);
+        return totalUnderlyingWithInvestment;
+    }
 
-        for (uint256 i; i < totalStrategies; i++) {
-            address strategy = strategyList[i];
-            if (toDeposit[i] > 0) {
-                IERC20(_underlying()).safeTransfer(strategy, toDeposit[i]);
-                emit InvestInStrategy(strategy, toDeposit[i]);
-            }
-            IStrategy(strategy).doHardWork();
+    /*
+     * Settles all the queued deposits and withdrawals of the current epoch at a single price per share,
+     * after the fees are processed. Deposits and withdrawals are netted against each other in the fund balance.
+     * If the fund can not pay the settled withdrawals, a rebalance is triggered, which touches each strategy once.
+     */
+    function _settleQueue(uint256[] memory strategyBalances) internal {
+        uint256 pricePerShare =
+            _getPricePerShare(_underlyingBalanceWithSnapshot(strategyBalances));
+        if (pricePerShare == 0) {
+            return;
+        }
+        uint256 epoch = _currentEpoch();
+        uint256 pendingDeposits = _pendingDeposits();
+        uint256 pendingWithdrawShares = _pendingWithdrawShares();
+
+        uint256 sharesToMint =
+            pendingDeposits.mul(_underlyingUnit()).div(pricePerShare);
+        uint256 underlyingToWithdraw =
+            pendingWithdrawShares.mul(pricePerShare).div(_underlyingUnit());
+
+        epochPricePerShare[epoch] = pricePerShare;
+        _setCurrentEpoch(epoch.add(1));
+        _setPendingDeposits(0);
+        _setPendingWithdrawShares(0);
+        _setUnclaimedDepositShares(
+            _unclaimedDepositShares().add(sharesToMint)
+        );
+        _setReservedWithdrawals(
+            _reservedWithdrawals().add(underlyingToWithdraw)
+        );
 
-            strategies[strategy].lastBalance = IStrategy(strategy)
-                .investedUnderlyingBalance();
+        if (sharesToMint > 0) {
+            _mint(address(this), sharesToMint); // held by the fund until claimed
+        }
+        if (pendingWithdrawShares > 0) {
+            _burn(address(this), pendingWithdrawShares);
+        }
+        if (
+            IERC20(_underlying()).balanceOf(address(this)) <
+            _reservedWithdrawals()
+        ) {
+            _setShouldRebalance(true);
         }
-    }
 
-    function pauseDeposits(bool trigger) external onlyFundManagerOrGovernance {
-        _setDepositsPaused(trigger);
+        emit QueueSettled(
+            epoch,
+            pricePerShare,
+            sharesToMint,
+            pendingWithdrawShares
+        );
     }
 
     /*
-     * Allows for depositing the underlying asset in exchange for shares.
-     * Approval is assumed.
+     * Returns the part of the fund value which should stay idle in the fund for withdrawals.
      */
-    function deposit(uint256 amount)
-        external
-        override
-        nonReentrant
-        whenDepositsNotPaused
+    function _bufferTarget(uint256 totalUnderlying)
+        internal
+        view
+        returns (uint256)
     {
-        _deposit(amount, msg.sender, msg.sender);
+        return totalUnderlying.mul(_bufferTargetBps()).div(MAX_BPS);
     }
 
     /*
-     * Allows for depositing the underlying asset and shares assigned to the holder.
-     * This facilitates depositing for someone else (e.g. using DepositHelper)
+     * The buffer is refilled (or drained) only when the idle balance moves out of the band around the target.
      */
-    function depositFor(uint256 amount, address holder)
-        external
+    function _isBufferOutsideBand(uint256[] memory strategyBalances)
+        internal
+        view
+        returns (bool)
+    {
+        if (_bufferTargetBps() == 0) {
+            return false;
+        }
+        uint256 totalUnderlying =
+            _underlyingBalanceWithSnapshot(strategyBalances);
+        uint256 target = _bufferTarget(totalUnderlying);
+        uint256 band = totalUnderlying.mul(_bufferBandBps()).div(MAX_BPS);
+        uint256 idle = underlyingBalanceInFund();
+        return idle.add(band) < target || idle > target.add(band);
+    }
+
+    function _reportBufferStatus(uint256 totalInStrategies) internal {
+        uint256 idle = underlyingBalanceInFund();
+        emit BufferStatus(
+            idle,
+            _bufferTarget(idle.add(totalInStrategies)),
+            _bufferHits(),
+            _bufferMisses()
+        );
+        _setBufferHits(0);
+        _setBufferMisses(0);
+    }
+
+    function _updateNavCache(uint256 strategiesBalance) internal {
+        _setCachedStrategiesBalance(strategiesBalance);
+        // solhint-disable-next-line not-rely-on-time
+        _setNavCacheTimestamp(block.timestamp);
+        // solhint-disable-next-line not-rely-on-time
+        emit NavCacheUpdated(strategiesBalance, block.timestamp);
+    }
+
+    /*
+     * Invests the underlying received since the last hard work (e.g. deposits) by weightage.
+     * The underlying left in the fund by the last hard work is kept as reserve.
+     * Returns the total balance in strategies after the hard work.
+     */
+    function doHardWorkWithoutRebalance(address[] memory list)
+        internal
+        returns (uint256)
+    {
+        uint256 totalAccounted = _totalAccounted();
+        uint256 lastReserve =
+            totalAccounted > 0 ? totalAccounted.sub(_totalInvested()) : 0;
+        uint256 underlyingBalance = underlyingBalanceInFund();
+        uint256 availableAmountToInvest =
+            underlyingBalance > lastReserve
+                ? underlyingBalance.sub(lastReserve)
+                : 0;
+
+        // if (availableAmountToInvest == 0) {
+        //     return;
+        // }
+
+        uint256 totalInStrategies = 0;
+
+        for (uint256 i; i < list.length; i++) {
+            uint256 availableAmountForStrategy =
+                availableAmountToInvest
+                    .mul(strategyParams[list[i]].weightage)
+                    .div(MAX_BPS);
+            totalInStrategies = totalInStrategies.add(
+                _investAndDoHardWork(list[i], availableAmountForStrategy)
+            );
+        }
+        return totalInStrategies;
+    }
+
+    /*
+     * Calls the hard work of each strategy without moving any capital, while the buffer is within its band.
+     * Returns the total balance in strategies after the hard work.
+     */
+    function doHardWorkInPlace(address[] memory list)
+        internal
+        returns (uint256)
+    {
+        uint256 totalInStrategies = 0;
+        for (uint256 i; i < list.length; i++) {
+            totalInStrategies = totalInStrategies.add(
+                _investAndDoHardWork(list[i], 0)
+            );
+        }
+        return totalInStrategies;
+    }
+
+    /*
+     * Transfers the amount to the strategy and does its hard work.
+     * In resilient mode, a failing hard work is reported and the amount is taken back to the fund,
+     * so that the capital of a failing strategy is not moved in this cycle.
+     * Returns the balance of the strategy after the hard work.
+     */
+    function _investAndDoHardWork(address strategy, uint256 amount)
+        internal
+        returns (uint256)
+    {
+        if (amount > 0) {
+            IERC20(_underlying()).safeTransfer(strategy, amount);
+            emit InvestInStrategy(strategy, amount);
+        }
+
+        if (!_resilientHardWork()) {
+            IStrategy(strategy).doHardWork();
+        } else {
+            try IStrategy(strategy).doHardWork() {} catch (
+                bytes memory reason
+            ) {
+                emit StrategyHardWorkFailed(strategy, reason);
+                if (amount > 0) {
+                    _withdrawFromStrategy(strategy, amount);
+                }
+                _setShouldRebalance(true); // try again in the next hard work
+            }
+        }
+
+        uint256 strategyBalance = _strategyBalance(strategy);
+        strategyParams[strategy].lastBalance = strategyBalance.toUint128();
+        return strategyBalance;
+    }
+
+    /*
+     * In resilient mode, a failing withdrawal is reported instead of reverting the hard work.
+     * Returns true if the withdrawal succeeded.
+     */
+    function _withdrawFromStrategy(address strategy, uint256 amount)
+        internal
+        returns (bool)
+    {
+        if (!_resilientHardWork()) {
+            IStrategy(strategy).withdrawToFund(amount);
+            return true;
+        }
+        try IStrategy(strategy).withdrawToFund(amount) {
+            return true;
+        } catch (bytes memory reason) {
+            emit StrategyHardWorkFailed(strategy, reason);
+            return false;
+        }
+    }
+
+    /*
+     * Moves the capital to match the weightage of each strategy, using the balance snapshot.
+     * Strategies within the rebalance tolerance are left alone, and with a movement cap
+     * the cheapest strategies to move capital in or out of are served first.
+     * Returns the total balance in strategies after the hard work.
+     */
+    function doHardWorkWithRebalance(
+        address[] memory list,
+        uint256[] memory strategyBalances
+    ) internal returns (uint256) {
+        uint256[] memory targets =
+            _rebalanceTargets(
+                _underlyingBalanceWithSnapshot(strategyBalances),
+                list,
+                strategyBalances
+            );
+        uint256[] memory order = _rebalanceOrder(list);
+
+        _withdrawAboveTargets(list, strategyBalances, targets, order);
+        return _depositBelowTargets(list, strategyBalances, targets, order);
+    }
+
+    /*
+     * Returns the balance each given strategy should have after the rebalance.
+     * With a buffer target, the capital above the target is split by the relative weightage of the strategies.
+     * A strategy whose balance is within the tolerance of its weightage keeps its balance.
+     */
+    function _rebalanceTargets(
+        uint256 totalUnderlyingWithInvestment,
+        address[] memory list,
+        uint256[] memory strategyBalances
+    ) internal view returns (uint256[] memory) {
+        uint256 investableUnderlying = totalUnderlyingWithInvestment;
+        uint256 totalWeightage = MAX_BPS;
+        if (_bufferTargetBps() > 0 && _totalWeightInStrategies() > 0) {
+            investableUnderlying = investableUnderlying.sub(
+                _bufferTarget(totalUnderlyingWithInvestment)
+            );
+            totalWeightage = _totalWeightInStrategies();
+        }
+        uint256 tolerance =
+            totalUnderlyingWithInvestment.mul(_rebalanceToleranceBps()).div(
+                MAX_BPS
+            );
+        uint256[] memory targets = new uint256[](strategyBalances.length);
+
+        for (uint256 i; i < strategyBalances.length; i++) {
+            uint256 shouldBeInStrategy =
+                investableUnderlying
+                    .mul(strategyParams[list[i]].weightage)
+                    .div(totalWeightage);
+            uint256 currentlyInStrategy = strategyBalances[i];
+            uint256 drift =
+                currentlyInStrategy > shouldBeInStrategy
+                    ? currentlyInStrategy - shouldBeInStrategy
+                    : shouldBeInStrategy - currentlyInStrategy;
+            targets[i] = drift > tolerance
+                ? shouldBeInStrategy
+                : currentlyInStrategy;
+        }
+        return targets;
+    }
+
+    /*
+     * Returns the order (as indexes in the given strategies) in which the capital is moved.
+     * Without a movement cap, all the targets are reached and the strategy list order is kept.
+     * With a movement cap, strategies are sorted by their movement cost (insertion sort, the list is short).
+     */
+    function _rebalanceOrder(address[] memory list)
+        internal
+        view
+        returns (uint256[] memory)
+    {
+        uint256 totalStrategies = list.length;
+        uint256[] memory order = new uint256[](totalStrategies);
+        for (uint256 i; i < totalStrategies; i++) {
+            order[i] = i;
+        }
+        if (_rebalanceMaxMovement() == 0) {
+            return order;
+        }
+
+        uint256[] memory costs = new uint256[](totalStrategies);
+        for (uint256 i; i < totalStrategies; i++) {
+            costs[i] = strategyMovementCost[list[i]];
+        }
+        for (uint256 i = 1; i < totalStrategies; i++) {
+            uint256 index = order[i];
+            uint256 j = i;
+            while (j > 0 && costs[order[j - 1]] > costs[index]) {
+                order[j] = order[j - 1];
+                j--;
+            }
+            order[j] = index;
+        }
+        return order;
+    }
+
+    /*
+     * Withdraws the capital above the targets, up to the movement cap.
+     * If the cap is hit, the rebalance continues in the next hard work.
+     */
+    function _withdrawAboveTargets(
+        address[] memory list,
+        uint256[] memory strategyBalances,
+        uint256[] memory targets,
+        uint256[] memory order
+    ) internal {
+        uint256 movementLeft = _rebalanceMaxMovement();
+        if (movementLeft == 0) {
+            movementLeft = uint256(-1); // no cap
+        }
+        for (uint256 j; j < order.length; j++) {
+            uint256 i = order[j];
+            if (strategyBalances[i] > targets[i]) {
+                uint256 toWithdraw =
+                    MathUpgradeable.min(
+                        strategyBalances[i] - targets[i],
+                        movementLeft
+                    );
+                if (
+                    toWithdraw > 0 &&
+                    _withdrawFromStrategy(list[i], toWithdraw)
+                ) {
+                    movementLeft -= toWithdraw;
+                } else {
+                    toWithdraw = 0; // nothing moved from a failing strategy
+                }
+                if (strategyBalances[i] - toWithdraw > targets[i]) {
+                    _setShouldRebalance(true); // continue in the next hard work
+                }
+            }
+        }
+    }
+
+    /*
+     * Deposits the capital below the targets, up to the movement cap and the balance in the fund,
+     * and does the hard work of each strategy.
+     * Returns the total balance in these strategies after the hard work.
+     */
+    function _depositBelowTargets(
+        address[] memory list,
+        uint256[] memory strategyBalances,
+        uint256[] memory targets,
+        uint256[] memory order
+    ) internal returns (uint256) {
+        uint256 movementLeft = _rebalanceMaxMovement();
+        if (movementLeft == 0) {
+            movementLeft = uint256(-1); // no cap
+        }
+        // can not directly deposit while withdrawing as there might not be enough balance before withdrawing from required strategies
+        uint256 availableInFund = underlyingBalanceInFund();
+        uint256 totalInStrategies = 0;
+
+        for (uint256 j; j < order.length; j++) {
+            uint256 i = order[j];
+            uint256 toDeposit = 0;
+            if (targets[i] > strategyBalances[i]) {
+                toDeposit = MathUpgradeable.min(
+                    targets[i] - strategyBalances[i],
+                    MathUpgradeable.min(movementLeft, availableInFund)
+                );
+                movementLeft -= toDeposit;
+                availableInFund -= toDeposit;
+                if (strategyBalances[i] + toDeposit < targets[i]) {
+                    _setShouldRebalance(true); // continue in the next hard work
+                }
+            }
+            totalInStrategies = totalInStrategies.add(
+                _investAndDoHardWork(list[i], toDeposit)
+            );
+        }
+        return totalInStrategies;
+    }
+
+    function pauseDeposits(bool trigger) external onlyFundManagerOrGovernance {
+        _setDepositsPaused(trigger);
+    }
+
+    /*
+     * Allows for depositing the underlying asset in exchange for shares.
+     * Approval is assumed.
+     */
+    function deposit(uint256 amount)
+        external
+        override
+        nonReentrant
+        whenDepositsNotPaused
+        whenQueueModeNotActive
+    {
+        _deposit(amount, msg.sender, msg.sender);
+    }
+
+    /*
+     * Allows for depositing the underlying asset and shares assigned to the holder.
+     * This facilitates depositing for someone else (e.g. using DepositHelper)
+     */
+    function depositFor(uint256 amount, address holder)
+        external
         override
         nonReentrant
         whenDepositsNotPaused
+        whenQueueModeNotActive
     {
         require(holder != ZERO_ADDRESS, "holder must be defined");
         _deposit(amount, msg.sender, holder);
@@ -658,11 +1397,27 @@ contract Fund is
     ) internal {
         require(amount > 0, "Cannot deposit 0");
 
+        uint256 totalUnderlying = _totalUnderlying();
+        _checkDepositLimits(amount, totalUnderlying);
+
+        uint256 toMint =
+            totalSupply() == 0
+                ? amount
+                : amount.mul(totalSupply()).div(totalUnderlying);
+        _mint(beneficiary, toMint);
+
+        IERC20(_underlying()).safeTransferFrom(sender, address(this), amount);
+        emit Deposit(beneficiary, amount);
+    }
+
+    function _checkDepositLimits(uint256 amount, uint256 totalUnderlying)
+        internal
+        view
+    {
         if (_depositLimit() > 0) {
             // if deposit limit is 0, then there is no deposit limit
             require(
-                underlyingBalanceWithInvestment().add(amount) <=
-                    _depositLimit(),
+                totalUnderlying.add(amount) <= _depositLimit(),
                 "Total deposit limit hit"
             );
         }
@@ -682,20 +1437,14 @@ contract Fund is
                 "Minimum transaction deposit limit hit"
             );
         }
-
-        uint256 toMint =
-            totalSupply() == 0
-                ? amount
-                : amount.mul(totalSupply()).div(
-                    underlyingBalanceWithInvestment()
-                );
-        _mint(beneficiary, toMint);
-
-        IERC20(_underlying()).safeTransferFrom(sender, address(this), amount);
-        emit Deposit(beneficiary, amount);
     }
 
-    function withdraw(uint256 numberOfShares) external override nonReentrant {
+    function withdraw(uint256 numberOfShares)
+        external
+        override
+        nonReentrant
+        whenQueueModeNotActive
+    {
         require(totalSupply() > 0, "Fund has no shares");
         require(numberOfShares > 0, "numberOfShares must be greater than 0");
 
@@ -705,27 +1454,57 @@ contract Fund is
 
         _burn(msg.sender, numberOfShares);
 
-        if (underlyingAmountToWithdraw == underlyingBalanceInFund()) {
+        bool bufferEnabled = _bufferTargetBps() > 0;
+        if (bufferEnabled) {
+            // hit rate is reported at the next hard work to size the buffer
+            if (underlyingAmountToWithdraw <= underlyingBalanceInFund()) {
+                _setBufferHits(_bufferHits().add(1));
+            } else {
+                _setBufferMisses(_bufferMisses().add(1));
+            }
+        }
+
+        if (
+            underlyingAmountToWithdraw == underlyingBalanceInFund() &&
+            !bufferEnabled
+        ) {
+            // the buffer is refilled by doHardWork when it leaves its band
             _setShouldRebalance(true);
         } else if (underlyingAmountToWithdraw > underlyingBalanceInFund()) {
             uint256 missing =
                 underlyingAmountToWithdraw.sub(underlyingBalanceInFund());
             uint256 missingCarryOver;
-            for (uint256 i; i < _getStrategyCount(); i++) {
-                if (isActiveStrategy(strategyList[i])) {
+            address[] memory list = strategyList;
+            for (uint256 i; i < list.length; i++) {
+                uint256 weightage = strategyParams[list[i]].weightage;
+                if (weightage > 0) {
                     uint256 balanceBefore = underlyingBalanceInFund();
-                    uint256 weightage = strategies[strategyList[i]].weightage;
                     uint256 missingforStrategy =
                         (missing.mul(weightage).div(_totalWeightInStrategies()))
                             .add(missingCarryOver);
-                    IStrategy(strategyList[i]).withdrawToFund(
-                        missingforStrategy
+                    IStrategy(list[i]).withdrawToFund(missingforStrategy);
+                    _recordStrategyWithdrawal(
+                        list[i],
+                        underlyingBalanceInFund().sub(balanceBefore)
                     );
                     missingCarryOver = missingforStrategy
                         .add(balanceBefore)
                         .sub(underlyingBalanceInFund());
                 }
             }
+            if (_navCacheEnabled()) {
+                // strategies now hold what was withdrawn less
+                uint256 withdrawnFromStrategies =
+                    underlyingBalanceInFund().sub(
+                        underlyingAmountToWithdraw.sub(missing)
+                    );
+                uint256 strategiesBalance = _cachedStrategiesBalance();
+                _setCachedStrategiesBalance(
+                    strategiesBalance > withdrawnFromStrategies
+                        ? strategiesBalance - withdrawnFromStrategies
+                        : 0
+                );
+            }
             // recalculate to improve accuracy
             underlyingAmountToWithdraw = MathUpgradeable.min(
                 underlyingAmountToWithdraw,
@@ -742,6 +1521,177 @@ contract Fund is
         emit Withdraw(msg.sender, underlyingAmountToWithdraw);
     }
 
+    /*
+     * Lowers the last balance of the strategy, and total invested with it, by the underlying the strategy returned.
+     * Otherwise a hard work of a range of strategies would value the other strategies with capital which has left.
+     */
+    function _recordStrategyWithdrawal(address strategy, uint256 withdrawn)
+        internal
+    {
+        uint256 lastBalance = strategyParams[strategy].lastBalance;
+        if (withdrawn > lastBalance) {
+            withdrawn = lastBalance; // the rest is profit not accounted yet
+        }
+        strategyParams[strategy].lastBalance = uint128(lastBalance - withdrawn);
+        uint256 totalInvested = _totalInvested();
+        _setTotalInvested(
+            totalInvested > withdrawn ? totalInvested - withdrawn : 0
+        );
+    }
+
+    /*
+     * Queues a deposit of the underlying asset for the current epoch. Approval is assumed.
+     * Shares are minted at the price per share of the hard work settling the epoch.
+     */
+    function requestDeposit(uint256 amount)
+        external
+        nonReentrant
+        whenDepositsNotPaused
+        whenQueueModeActive
+    {
+        require(amount > 0, "Cannot deposit 0");
+        _checkDepositLimits(amount, _totalUnderlying().add(_pendingDeposits()));
+        _claimQueued(msg.sender);
+
+        uint256 epoch = _currentEpoch();
+        QueuedRequest storage request = queuedRequests[msg.sender];
+        request.epoch = epoch;
+        request.depositAmount = request.depositAmount.add(amount);
+        _setPendingDeposits(_pendingDeposits().add(amount));
+
+        IERC20(_underlying()).safeTransferFrom(
+            msg.sender,
+            address(this),
+            amount
+        );
+        emit DepositQueued(msg.sender, epoch, amount);
+    }
+
+    /*
+     * Queues a withdrawal for the current epoch. The shares are held by the fund
+     * and converted to underlying at the price per share of the hard work settling the epoch.
+     */
+    function requestWithdraw(uint256 numberOfShares)
+        external
+        nonReentrant
+        whenQueueModeActive
+    {
+        require(numberOfShares > 0, "numberOfShares must be greater than 0");
+        _claimQueued(msg.sender);
+
+        uint256 epoch = _currentEpoch();
+        QueuedRequest storage request = queuedRequests[msg.sender];
+        request.epoch = epoch;
+        request.withdrawShares = request.withdrawShares.add(numberOfShares);
+        _setPendingWithdrawShares(
+            _pendingWithdrawShares().add(numberOfShares)
+        );
+
+        _transfer(msg.sender, address(this), numberOfShares);
+        emit WithdrawalQueued(msg.sender, epoch, numberOfShares);
+    }
+
+    /*
+     * Transfers the shares and underlying of settled queued requests to the holder.
+     * Requests of the current epoch are not settled yet and stay queued.
+     */
+    function claimQueued() external nonReentrant {
+        _claimQueued(msg.sender);
+    }
+
+    function _claimQueued(address holder) internal {
+        QueuedRequest storage request = queuedRequests[holder];
+        uint256 depositAmount = request.depositAmount;
+        uint256 withdrawShares = request.withdrawShares;
+        if (
+            (depositAmount == 0 && withdrawShares == 0) ||
+            request.epoch >= _currentEpoch()
+        ) {
+            return;
+        }
+        uint256 pricePerShare = epochPricePerShare[request.epoch];
+        delete queuedRequests[holder];
+
+        if (depositAmount > 0) {
+            uint256 shares =
+                depositAmount.mul(_underlyingUnit()).div(pricePerShare);
+            _setUnclaimedDepositShares(_unclaimedDepositShares().sub(shares));
+            _transfer(address(this), holder, shares);
+            emit Deposit(holder, depositAmount);
+        }
+
+        if (withdrawShares > 0) {
+            uint256 underlyingAmount =
+                withdrawShares.mul(pricePerShare).div(_underlyingUnit());
+            _setReservedWithdrawals(
+                _reservedWithdrawals().sub(underlyingAmount)
+            );
+            IERC20(_underlying()).safeTransfer(holder, underlyingAmount);
+            emit Withdraw(holder, underlyingAmount);
+        }
+    }
+
+    /*
+     * Transfers the fee shares accrued by the caller at the hard works.
+     */
+    function claimFees() external nonReentrant {
+        _claimFees(msg.sender);
+    }
+
+    /*
+     * Transfers the accrued fee shares to each of the beneficiaries. Can be called by anyone.
+     */
+    function claimFeesFor(address[] calldata beneficiaries)
+        external
+        nonReentrant
+    {
+        for (uint256 i; i < beneficiaries.length; i++) {
+            _claimFees(beneficiaries[i]);
+        }
+    }
+
+    function _claimFees(address beneficiary) internal {
+        uint256 shares = claimableFeeShares[beneficiary];
+        if (shares == 0) {
+            return;
+        }
+        delete claimableFeeShares[beneficiary];
+        _setUnclaimedFeeShares(_unclaimedFeeShares().sub(shares));
+        _transfer(address(this), beneficiary, shares);
+        emit FeesClaimed(beneficiary, shares);
+    }
+
+    function unclaimedFeeShares() external view returns (uint256) {
+        return _unclaimedFeeShares();
+    }
+
+    function setQueueModeEnabled(bool enabled)
+        external
+        onlyFundManagerOrGovernance
+    {
+        _setQueueModeEnabled(enabled);
+    }
+
+    function queueModeEnabled() external view returns (bool) {
+        return _queueModeEnabled();
+    }
+
+    function currentEpoch() external view returns (uint256) {
+        return _currentEpoch();
+    }
+
+    function pendingDeposits() external view returns (uint256) {
+        return _pendingDeposits();
+    }
+
+    function pendingWithdrawShares() external view returns (uint256) {
+        return _pendingWithdrawShares();
+    }
+
+    function reservedWithdrawals() external view returns (uint256) {
+        return _reservedWithdrawals();
+    }
+
     /**
      * Schedules an upgrade for this fund's proxy.
      */
@@ -775,6 +1725,33 @@ contract Fund is
     function finalizeUpgrade() external onlyGovernance {
         _setNextImplementation(ZERO_ADDRESS);
         _setNextImplementationTimestamp(0);
+        _migrateToPackedConfig();
+        _migrateStrategyParams();
+        // the totals are rebuilt from the strategies by the next doHardWork
+        _setFullHardWorkDone(false);
+    }
+
+    /*
+     * Funds deployed before the packed strategy params keep them in legacyStrategies.
+     * Moves them to the packed strategy params once. Called on upgrade.
+     */
+    function _migrateStrategyParams() internal {
+        address[] memory list = strategyList;
+        for (uint256 i; i < list.length; i++) {
+            StrategyParams memory legacy = legacyStrategies[list[i]];
+            if (legacy.weightage > 0) {
+                strategyParams[list[i]] = PackedStrategyParams({
+                    weightage: legacy.weightage.toUint16(),
+                    performanceFeeStrategy: legacy
+                        .performanceFeeStrategy
+                        .toUint16(),
+                    indexInList: legacy.indexInList.toUint16(),
+                    activation: legacy.activation.toUint64(),
+                    lastBalance: legacy.lastBalance.toUint128()
+                });
+                delete legacyStrategies[list[i]];
+            }
+        }
     }
 
     function setFundManager(address newFundManager)
@@ -782,20 +1759,72 @@ contract Fund is
         onlyFundManagerOrGovernance
     {
         _setFundManager(newFundManager);
+        _syncStrategyRoles();
     }
 
     function setRelayer(address newRelayer) external onlyFundManager {
         _setRelayer(newRelayer);
+        _syncStrategyRoles();
+    }
+
+    function _afterGovernanceUpdate() internal override {
+        _syncStrategyRoles();
+    }
+
+    /*
+     * Strategies cache the roles of the fund for their access checks,
+     * so they are told to read them again when a role changes.
+     */
+    function _syncStrategyRoles() internal {
+        address[] memory list = strategyList;
+        for (uint256 i = 0; i < list.length; i++) {
+            _syncStrategyRoles(list[i]);
+        }
+    }
+
+    function _syncStrategyRoles(address strategy) internal {
+        // a strategy that does not cache the roles does not implement syncRoles
+        try IStrategyRoles(strategy).syncRoles() {} catch {}
     }
 
     function setPlatformRewards(address newRewards) external onlyGovernance {
         _setPlatformRewards(newRewards);
     }
 
+    /*
+     * Strategy creator and platform fees are accrued to the distributor (e.g. a MerkleDistributor)
+     * when set, and to each of them when it is the zero address.
+     */
+    function setFeeDistributor(address newFeeDistributor)
+        external
+        onlyGovernance
+    {
+        _setFeeDistributor(newFeeDistributor);
+    }
+
+    function feeDistributor() external view returns (address) {
+        return _feeDistributor();
+    }
+
     function setShouldRebalance(bool trigger) external onlyFundManager {
         _setShouldRebalance(trigger);
     }
 
+    /*
+     * In resilient mode, a strategy failing its hard work or withdrawal is reported and skipped
+     * instead of reverting the hard work of the whole fund.
+     */
+    function setResilientHardWork(bool enabled)
+        external
+        onlyFundManagerOrGovernance
+    {
+        _setResilientHardWork(enabled);
+    }
+
+    function resilientHardWork() external view returns (bool) {
+        return _resilientHardWork();
+    }
+
     function setMaxInvestmentInStrategies(uint256 value)
         external
         onlyFundManager
@@ -804,8 +1833,58 @@ contract Fund is
         _setMaxInvestmentInStrategies(value);
     }
 
+    /*
+     * Strategies whose balance is within the tolerance (in BPS of the fund value) of their weightage are not rebalanced.
+     */
+    function setRebalanceTolerance(uint256 toleranceBps)
+        external
+        onlyFundManager
+    {
+        require(toleranceBps < MAX_BPS, "Tolerance greater than 100%");
+        _setRebalanceToleranceBps(toleranceBps);
+    }
+
+    function rebalanceToleranceBps() external view returns (uint256) {
+        return _rebalanceToleranceBps();
+    }
+
+    // if value == 0 then there is no cap on capital moved in each direction during a rebalance
+    function setRebalanceMaxMovement(uint256 value) external onlyFundManager {
+        _setRebalanceMaxMovement(value);
+    }
+
+    function rebalanceMaxMovement() external view returns (uint256) {
+        return _rebalanceMaxMovement();
+    }
+
+    /*
+     * Sets the idle balance target (in BPS of the fund value) kept in the fund for withdrawals,
+     * and the band (in BPS of the fund value) around it in which doHardWork does not move any capital.
+     * A target of 0 disables the buffer.
+     */
+    function setBufferPolicy(uint256 targetBps, uint256 bandBps)
+        external
+        onlyFundManager
+    {
+        require(targetBps < MAX_BPS, "Buffer target greater than 100%");
+        require(bandBps <= targetBps, "Buffer band greater than target");
+        _setBufferTargetBps(targetBps);
+        _setBufferBandBps(bandBps);
+        _setShouldRebalance(true);
+    }
+
+    function bufferTargetBps() external view returns (uint256) {
+        return _bufferTargetBps();
+    }
+
+    function bufferBandBps() external view returns (uint256) {
+        return _bufferBandBps();
+    }
+
     // if limit == 0 then there is no deposit limit
+    // Deposit limits are packed in 128 bits
     function setDepositLimit(uint256 limit) external onlyFundManager {
+        require(limit <= type(uint128).max, "Limit too large");
         _setDepositLimit(limit);
     }
 
@@ -819,6 +1898,7 @@ contract Fund is
             _depositLimitTxMin() == 0 || limit > _depositLimitTxMin(),
             "Max limit greater than min limit"
         );
+        require(limit <= type(uint128).max, "Limit too large");
         _setDepositLimitTxMax(limit);
     }
 
@@ -832,6 +1912,7 @@ contract Fund is
             _depositLimitTxMax() == 0 || limit < _depositLimitTxMax(),
             "Min limit greater than max limit"
         );
+        require(limit <= type(uint128).max, "Limit too large");
         _setDepositLimitTxMin(limit);
     }
 
@@ -857,9 +1938,41 @@ contract Fund is
         return _platformFee();
     }
 
+    /*
+     * In cached NAV mode, deposits and withdrawals are priced using the strategy valuation
+     * stored at the last hard work. Switching it off falls back to the live valuation.
+     * The cache is reset, so it only becomes valid after the next hard work.
+     */
+    function setNavCacheEnabled(bool enabled) external onlyGovernance {
+        _setNavCacheEnabled(enabled);
+        _setNavCacheTimestamp(0);
+    }
+
+    function navCacheEnabled() external view returns (bool) {
+        return _navCacheEnabled();
+    }
+
+    function setNavCacheMaxAge(uint256 maxAge) external onlyGovernance {
+        require(maxAge <= MAX_NAV_CACHE_AGE, "Max age greater than max limit");
+        _setNavCacheMaxAge(maxAge);
+    }
+
+    function navCacheMaxAge() external view returns (uint256) {
+        return _navCacheMaxAge();
+    }
+
+    function cachedStrategiesBalance() external view returns (uint256) {
+        return _cachedStrategiesBalance();
+    }
+
+    function isNavCacheValid() external view returns (bool) {
+        return _isNavCacheValid();
+    }
+
     // no tokens should ever be stored on this contract. Any tokens that are sent here by mistake are recoverable by governance
     function sweep(address _token, address _sweepTo) external onlyGovernance {
         require(_token != address(_underlying()), "can not sweep underlying");
+        require(_token != address(this), "can not sweep fund shares");
         require(_sweepTo != ZERO_ADDRESS, "can not sweep to zero");
         IERC20(_token).safeTransfer(
             _sweepTo,
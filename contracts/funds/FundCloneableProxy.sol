@@ -0,0 +1,97 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+import "../../interfaces/IUpgradeSource.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/proxy/Proxy.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/utils/Address.sol";
+
+/**
+ * Same as FundProxy, with the implementation set by initializeProxy instead of the constructor,
+ * so that FundFactory can deploy funds as minimal proxies (EIP-1167) of this contract.
+ * The implementation is read from the storage of each clone, so every fund upgrades on its own.
+ */
+contract FundCloneableProxy is Proxy {
+    event Upgraded(address indexed implementation);
+
+    bytes32 private constant _IMPLEMENTATION_SLOT =
+        0x360894a13ba1a3210667c828492db98dca3e2076cc3735a920a3ca505d382bbc;
+
+    constructor() public {
+        assert(
+            _IMPLEMENTATION_SLOT ==
+                bytes32(uint256(keccak256("eip1967.proxy.implementation")) - 1)
+        );
+    }
+
+    function initializeProxy(address _implementation) external {
+        require(
+            _getImplementation() == address(0),
+            "Proxy already initialized"
+        );
+        _setImplementation(_implementation);
+    }
+
+    /**
+     * The main logic. If the timer has elapsed and there is a schedule upgrade,
+     * the governance can upgrade the vault
+     */
+    function upgrade(address newImplementation) external {
+        require(
+            newImplementation != address(0),
+            "new fund implementation cannot be empty"
+        );
+        // solhint-disable-next-line no-unused-vars
+        (bool should, address nextImplementation) =
+            IUpgradeSource(address(this)).shouldUpgrade();
+        require(should, "Upgrade not scheduled");
+        require(
+            nextImplementation == newImplementation,
+            "NewImplementation is not same"
+        );
+        _setImplementation(newImplementation);
+        emit Upgraded(newImplementation);
+
+        // the finalization needs to be executed on itself to update the storage of this proxy
+        // it also needs to be invoked by the governance, not by address(this), so delegatecall is needed
+
+        // result is unused for now
+        // solhint-disable-next-line no-unused-vars
+        (bool success, bytes memory result) =
+            // solhint-disable-next-line avoid-low-level-calls
+            address(this).delegatecall(
+                abi.encodeWithSignature("finalizeUpgrade()")
+            );
+
+        require(success, "Issue when finalizing the upgrade");
+    }
+
+    function implementation() external view returns (address) {
+        return _getImplementation();
+    }
+
+    function _implementation() internal view override returns (address) {
+        return _getImplementation();
+    }
+
+    function _getImplementation() private view returns (address impl) {
+        bytes32 slot = _IMPLEMENTATION_SLOT;
+        // solhint-disable-next-line no-inline-assembly
+        assembly {
+            impl := sload(slot)
+        }
+    }
+
+    function _setImplementation(address newImplementation) private {
+        require(
+            Address.isContract(newImplementation),
+            "Cannot set a proxy implementation to a non-contract address"
+        );
+
+        bytes32 slot = _IMPLEMENTATION_SLOT;
+
+        // solhint-disable-next-line no-inline-assembly
+        assembly {
+            sstore(slot, newImplementation)
+        }
+    }
+}
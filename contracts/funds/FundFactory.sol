@@ -1,15 +1,21 @@
 // SPDX-License-Identifier: MIT
 pragma solidity 0.6.12;
+pragma experimental ABIEncoderV2;
 
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/proxy/Clones.sol";
 import "./FundProxy.sol";
+import "./FundCloneableProxy.sol";
 import "../../interfaces/IFundInitializer.sol";
 import "../utils/Governable.sol";
 
 contract FundFactory is Governable {
     event NewFund(address indexed fundProxy);
 
+    address public immutable fundProxyMaster; // minimal proxies of this are deployed by the clone path
+
     constructor() public {
         Governable.initializeGovernance(msg.sender);
+        fundProxyMaster = address(new FundCloneableProxy());
     }
 
     function createFund(
@@ -29,4 +35,61 @@ contract FundFactory is Governable {
         emit NewFund(address(proxy));
         return address(proxy);
     }
+
+    /**
+     * Same as createFund, with the fund deployed as a minimal proxy (EIP-1167) of the fund proxy master
+     * at the address given by predictFundAddress for the salt. The fund keeps the upgrade semantics of FundProxy.
+     */
+    function createFundDeterministic(
+        address _implementation,
+        address _underlying,
+        string memory _name,
+        string memory _symbol,
+        bytes32 _salt
+    ) public onlyGovernance returns (address) {
+        require(_implementation != address(0), "fund cannot be empty");
+        address proxy = Clones.cloneDeterministic(fundProxyMaster, _salt);
+        FundCloneableProxy(payable(proxy)).initializeProxy(_implementation);
+        IFundInitializer(proxy).initializeFund(
+            msg.sender,
+            _underlying,
+            _name,
+            _symbol
+        );
+        emit NewFund(proxy);
+        return proxy;
+    }
+
+    /**
+     * Deploys and initializes a fund for each of the underlyings in a single transaction.
+     */
+    function createFunds(
+        address _implementation,
+        address[] memory _underlyings,
+        string[] memory _names,
+        string[] memory _symbols,
+        bytes32[] memory _salts
+    ) external onlyGovernance returns (address[] memory) {
+        require(
+            _names.length == _underlyings.length &&
+                _symbols.length == _underlyings.length &&
+                _salts.length == _underlyings.length,
+            "Lengths do not match"
+        );
+        address[] memory funds = new address[](_underlyings.length);
+        for (uint256 i; i < _underlyings.length; i++) {
+            funds[i] = createFundDeterministic(
+                _implementation,
+                _underlyings[i],
+                _names[i],
+                _symbols[i],
+                _salts[i]
+            );
+        }
+        return funds;
+    }
+
+    function predictFundAddress(bytes32 _salt) external view returns (address) {
+        return Clones.predictDeterministicAddress(fundProxyMaster, _salt);
+    }
 }
@@ -47,6 +47,60 @@ contract FundStorage is Initializable, SetGetAssembly {
         0xa7ae0fa763ec3009113ccc5eb9089e1f0028607f5b8198c52cd42366c1ddb17b;
     bytes32 internal constant _NEXT_IMPLEMENTATION_TIMESTAMP_SLOT =
         0x5e1f7083e1d90c44893f97806d0ec517436a58b85860b28247fd6fd56f5dc897;
+    bytes32 internal constant _NAV_CACHE_MAX_AGE_SLOT =
+        0xf72247c321a926085610b6d467ef02f8005a6521f0df0f5b1fd0743a72db7c9c;
+    bytes32 internal constant _CACHED_STRATEGIES_BALANCE_SLOT =
+        0xa1a632222dcad0ae52d94eeb2f82d372716aa3788ea1f1c887063473fe42132a;
+    bytes32 internal constant _NAV_CACHE_TIMESTAMP_SLOT =
+        0x136060b83dbe9435f7d6e98185d40c86d60c4b7679e32866b33e98cd2289a018;
+    bytes32 internal constant _CURRENT_EPOCH_SLOT =
+        0xa4c27415f65f2624787a5c1cc21c1004111b3ca09f74a539f761c534be144754;
+    bytes32 internal constant _PENDING_DEPOSITS_SLOT =
+        0xa62b59a61514c9dc68b703b8f24cfbb71f941c893748c0f637c69fef19cf736d;
+    bytes32 internal constant _PENDING_WITHDRAW_SHARES_SLOT =
+        0x29857415140027c18a2134e2baa941da555d344418e2ca87d78d26dcc87ba310;
+    bytes32 internal constant _RESERVED_WITHDRAWALS_SLOT =
+        0x95c9029cb8d3929027de8a91ed7f2f81d555aa7dc72469e4629405af96742730;
+    bytes32 internal constant _UNCLAIMED_DEPOSIT_SHARES_SLOT =
+        0xbbd02d08a141bbfd9765b9e00eb0b656e0852cc2990c0a31606ee1736de5e587;
+    bytes32 internal constant _BUFFER_HITS_SLOT =
+        0x37127606388a63cf2e2ac1e5f288f9c2d3814edfa21b954cf48021ac04398a21;
+    bytes32 internal constant _BUFFER_MISSES_SLOT =
+        0x2ace66b0f61e914657c28013861b94ee40c2cb243e23a82cb4557f684e377e2c;
+    bytes32 internal constant _REBALANCE_MAX_MOVEMENT_SLOT =
+        0x0d569c3602a5ee3a5960a0f5ad794837b505979e5c5bfa46aa700a5e28144bae;
+
+    bytes32 internal constant _FUND_CONFIG_SLOT =
+        0x8159acbabd018d3da2ff807670f2fa273183e68d512a1df6a7db4095de65f051;
+    bytes32 internal constant _DEPOSIT_LIMITS_SLOT =
+        0x7175759a611d7ec590ea839ec30da081f8fe2ff605628cd005e4c98ad3532676;
+    bytes32 internal constant _UNCLAIMED_FEE_SHARES_SLOT =
+        0x471f2ea934b929eb088d9d6790c63d8e935db317da486883d655f959ad7e4aaa;
+    bytes32 internal constant _FEE_DISTRIBUTOR_SLOT =
+        0x99c60e4c45cdcc443db0e6d1a272a737855133efb912d23d35f3f23cf8e3cc3e;
+
+    // Small values read on every deposit, withdrawal and hard work are packed in the fund config slot,
+    // to read them with a single sload. Offsets are in bits.
+    // Values of the baseline fund with their own (legacy) slot above are only read from it to migrate
+    // funds initialized before the packed config. The deposit limits fit in 128 bits each.
+    uint256 internal constant _DEPOSIT_LIMIT_TX_MIN_OFFSET = 0; // 128 bits
+    uint256 internal constant _PERFORMANCE_FEE_FUND_OFFSET = 128; // 16 bits
+    uint256 internal constant _PLATFORM_FEE_OFFSET = 144; // 16 bits
+    uint256 internal constant _MAX_INVESTMENT_IN_STRATEGIES_OFFSET = 160; // 16 bits
+    uint256 internal constant _BUFFER_TARGET_BPS_OFFSET = 176; // 16 bits
+    uint256 internal constant _BUFFER_BAND_BPS_OFFSET = 192; // 16 bits
+    uint256 internal constant _REBALANCE_TOLERANCE_BPS_OFFSET = 208; // 16 bits
+    uint256 internal constant _DECIMALS_OFFSET = 224; // 8 bits
+    uint256 internal constant _DEPOSITS_PAUSED_OFFSET = 232; // 1 bit
+    uint256 internal constant _SHOULD_REBALANCE_OFFSET = 233; // 1 bit
+    uint256 internal constant _NAV_CACHE_ENABLED_OFFSET = 234; // 1 bit
+    uint256 internal constant _QUEUE_MODE_ENABLED_OFFSET = 235; // 1 bit
+    uint256 internal constant _RESILIENT_HARD_WORK_OFFSET = 236; // 1 bit
+    uint256 internal constant _FULL_HARD_WORK_DONE_OFFSET = 237; // 1 bit, cleared on upgrade
+    uint256 internal constant _CONFIG_PACKED_OFFSET = 255; // 1 bit, set once the legacy slots are migrated
+    // Both the deposit limits are packed in the deposit limits slot.
+    uint256 internal constant _DEPOSIT_LIMIT_OFFSET = 0; // 128 bits
+    uint256 internal constant _DEPOSIT_LIMIT_TX_MAX_OFFSET = 128; // 128 bits
 
     constructor() public {
         assert(
@@ -253,6 +307,152 @@ contract FundStorage is Initializable, SetGetAssembly {
                     ) - 1
                 )
         );
+        assert(
+            _NAV_CACHE_MAX_AGE_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.navCacheMaxAge"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _CACHED_STRATEGIES_BALANCE_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.cachedStrategiesBalance"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _NAV_CACHE_TIMESTAMP_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.navCacheTimestamp"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _CURRENT_EPOCH_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.currentEpoch"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _PENDING_DEPOSITS_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.pendingDeposits"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _PENDING_WITHDRAW_SHARES_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.pendingWithdrawShares"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _RESERVED_WITHDRAWALS_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.reservedWithdrawals"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _UNCLAIMED_DEPOSIT_SHARES_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.unclaimedDepositShares"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _BUFFER_HITS_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256("eip1967.mesh.finance.fundStorage.bufferHits")
+                    ) - 1
+                )
+        );
+        assert(
+            _BUFFER_MISSES_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.bufferMisses"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _REBALANCE_MAX_MOVEMENT_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.rebalanceMaxMovement"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _FUND_CONFIG_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256("eip1967.mesh.finance.fundStorage.fundConfig")
+                    ) - 1
+                )
+        );
+        assert(
+            _DEPOSIT_LIMITS_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.depositLimits"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _UNCLAIMED_FEE_SHARES_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.unclaimedFeeShares"
+                        )
+                    ) - 1
+                )
+        );
+        assert(
+            _FEE_DISTRIBUTOR_SLOT ==
+                bytes32(
+                    uint256(
+                        keccak256(
+                            "eip1967.mesh.finance.fundStorage.feeDistributor"
+                        )
+                    ) - 1
+                )
+        );
     }
 
     function initializeFundStorage(
@@ -264,6 +464,7 @@ contract FundStorage is Initializable, SetGetAssembly {
         address _platformRewards,
         uint256 _changeDelay
     ) public initializer {
+        setPacked(_FUND_CONFIG_SLOT, _CONFIG_PACKED_OFFSET, 1, 1);
         _setUnderlying(_underlying);
         _setUnderlyingUnit(_underlyingUnit);
         _setDecimals(_decimals);
@@ -285,6 +486,17 @@ contract FundStorage is Initializable, SetGetAssembly {
         _setLastHardworkTimestamp(0);
         _setNextImplementation(address(0));
         _setNextImplementationTimestamp(0);
+        _setNavCacheEnabled(false);
+        _setNavCacheMaxAge(1 days);
+        _setCachedStrategiesBalance(0);
+        _setNavCacheTimestamp(0);
+        _setQueueModeEnabled(false);
+        _setCurrentEpoch(0);
+        _setPendingDeposits(0);
+        _setPendingWithdrawShares(0);
+        _setReservedWithdrawals(0);
+        _setUnclaimedDepositShares(0);
+        _setUnclaimedFeeShares(0);
     }
 
     function _setUnderlying(address _address) internal {
@@ -304,11 +516,11 @@ contract FundStorage is Initializable, SetGetAssembly {
     }
 
     function _setDecimals(uint8 _value) internal {
-        setUint8(_DECIMALS_SLOT, _value);
+        setPacked(_FUND_CONFIG_SLOT, _DECIMALS_OFFSET, 8, _value);
     }
 
     function _decimals() internal view returns (uint8) {
-        return getUint8(_DECIMALS_SLOT);
+        return uint8(getPacked(_FUND_CONFIG_SLOT, _DECIMALS_OFFSET, 8));
     }
 
     function _setFundManager(address _fundManager) internal {
@@ -344,51 +556,71 @@ contract FundStorage is Initializable, SetGetAssembly {
     }
 
     function _setDepositLimit(uint256 _value) internal {
-        setUint256(_DEPOSIT_LIMIT_SLOT, _value);
+        setPacked(_DEPOSIT_LIMITS_SLOT, _DEPOSIT_LIMIT_OFFSET, 128, _value);
     }
 
     function _depositLimit() internal view returns (uint256) {
-        return getUint256(_DEPOSIT_LIMIT_SLOT);
+        return getPacked(_DEPOSIT_LIMITS_SLOT, _DEPOSIT_LIMIT_OFFSET, 128);
     }
 
     function _setDepositLimitTxMax(uint256 _value) internal {
-        setUint256(_DEPOSIT_LIMIT_TX_MAX_SLOT, _value);
+        setPacked(
+            _DEPOSIT_LIMITS_SLOT,
+            _DEPOSIT_LIMIT_TX_MAX_OFFSET,
+            128,
+            _value
+        );
     }
 
     function _depositLimitTxMax() internal view returns (uint256) {
-        return getUint256(_DEPOSIT_LIMIT_TX_MAX_SLOT);
+        return
+            getPacked(
+                _DEPOSIT_LIMITS_SLOT,
+                _DEPOSIT_LIMIT_TX_MAX_OFFSET,
+                128
+            );
     }
 
     function _setDepositLimitTxMin(uint256 _value) internal {
-        setUint256(_DEPOSIT_LIMIT_TX_MIN_SLOT, _value);
+        setPacked(_FUND_CONFIG_SLOT, _DEPOSIT_LIMIT_TX_MIN_OFFSET, 128, _value);
     }
 
     function _depositLimitTxMin() internal view returns (uint256) {
-        return getUint256(_DEPOSIT_LIMIT_TX_MIN_SLOT);
+        return getPacked(_FUND_CONFIG_SLOT, _DEPOSIT_LIMIT_TX_MIN_OFFSET, 128);
     }
 
     function _setPerformanceFeeFund(uint256 _value) internal {
-        setUint256(_PERFORMANCE_FEE_FUND_SLOT, _value);
+        setPacked(_FUND_CONFIG_SLOT, _PERFORMANCE_FEE_FUND_OFFSET, 16, _value);
     }
 
     function _performanceFeeFund() internal view returns (uint256) {
-        return getUint256(_PERFORMANCE_FEE_FUND_SLOT);
+        return getPacked(_FUND_CONFIG_SLOT, _PERFORMANCE_FEE_FUND_OFFSET, 16);
     }
 
     function _setPlatformFee(uint256 _value) internal {
-        setUint256(_PLATFORM_FEE_SLOT, _value);
+        setPacked(_FUND_CONFIG_SLOT, _PLATFORM_FEE_OFFSET, 16, _value);
     }
 
     function _platformFee() internal view returns (uint256) {
-        return getUint256(_PLATFORM_FEE_SLOT);
+        return getPacked(_FUND_CONFIG_SLOT, _PLATFORM_FEE_OFFSET, 16);
     }
 
     function _setMaxInvestmentInStrategies(uint256 _value) internal {
-        setUint256(_MAX_INVESTMENT_IN_STRATEGIES_SLOT, _value);
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _MAX_INVESTMENT_IN_STRATEGIES_OFFSET,
+            16,
+            _value
+        );
     }
 
     function _maxInvestmentInStrategies() internal view returns (uint256) {
-        return getUint256(_MAX_INVESTMENT_IN_STRATEGIES_SLOT);
+        return
+            getPacked(
+                _FUND_CONFIG_SLOT,
+                _MAX_INVESTMENT_IN_STRATEGIES_OFFSET,
+                16
+            );
     }
 
     function _setTotalWeightInStrategies(uint256 _value) internal {
@@ -416,19 +648,29 @@ contract FundStorage is Initializable, SetGetAssembly {
     }
 
     function _setDepositsPaused(bool _value) internal {
-        setBool(_DEPOSITS_PAUSED_SLOT, _value);
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _DEPOSITS_PAUSED_OFFSET,
+            1,
+            _value ? 1 : 0
+        );
     }
 
     function _depositsPaused() internal view returns (bool) {
-        return getBool(_DEPOSITS_PAUSED_SLOT);
+        return getPacked(_FUND_CONFIG_SLOT, _DEPOSITS_PAUSED_OFFSET, 1) == 1;
     }
 
     function _setShouldRebalance(bool _value) internal {
-        setBool(_SHOULD_REBALANCE_SLOT, _value);
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _SHOULD_REBALANCE_OFFSET,
+            1,
+            _value ? 1 : 0
+        );
     }
 
     function _shouldRebalance() internal view returns (bool) {
-        return getBool(_SHOULD_REBALANCE_SLOT);
+        return getPacked(_FUND_CONFIG_SLOT, _SHOULD_REBALANCE_OFFSET, 1) == 1;
     }
 
     function _setLastHardworkTimestamp(uint256 _value) internal {
@@ -455,5 +697,246 @@ contract FundStorage is Initializable, SetGetAssembly {
         return getUint256(_NEXT_IMPLEMENTATION_TIMESTAMP_SLOT);
     }
 
+    function _setNavCacheEnabled(bool _value) internal {
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _NAV_CACHE_ENABLED_OFFSET,
+            1,
+            _value ? 1 : 0
+        );
+    }
+
+    function _navCacheEnabled() internal view returns (bool) {
+        return getPacked(_FUND_CONFIG_SLOT, _NAV_CACHE_ENABLED_OFFSET, 1) == 1;
+    }
+
+    function _setNavCacheMaxAge(uint256 _value) internal {
+        setUint256(_NAV_CACHE_MAX_AGE_SLOT, _value);
+    }
+
+    function _navCacheMaxAge() internal view returns (uint256) {
+        return getUint256(_NAV_CACHE_MAX_AGE_SLOT);
+    }
+
+    function _setCachedStrategiesBalance(uint256 _value) internal {
+        setUint256(_CACHED_STRATEGIES_BALANCE_SLOT, _value);
+    }
+
+    function _cachedStrategiesBalance() internal view returns (uint256) {
+        return getUint256(_CACHED_STRATEGIES_BALANCE_SLOT);
+    }
+
+    function _setNavCacheTimestamp(uint256 _value) internal {
+        setUint256(_NAV_CACHE_TIMESTAMP_SLOT, _value);
+    }
+
+    function _navCacheTimestamp() internal view returns (uint256) {
+        return getUint256(_NAV_CACHE_TIMESTAMP_SLOT);
+    }
+
+    function _setQueueModeEnabled(bool _value) internal {
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _QUEUE_MODE_ENABLED_OFFSET,
+            1,
+            _value ? 1 : 0
+        );
+    }
+
+    function _queueModeEnabled() internal view returns (bool) {
+        return getPacked(_FUND_CONFIG_SLOT, _QUEUE_MODE_ENABLED_OFFSET, 1) == 1;
+    }
+
+    function _setCurrentEpoch(uint256 _value) internal {
+        setUint256(_CURRENT_EPOCH_SLOT, _value);
+    }
+
+    function _currentEpoch() internal view returns (uint256) {
+        return getUint256(_CURRENT_EPOCH_SLOT);
+    }
+
+    function _setPendingDeposits(uint256 _value) internal {
+        setUint256(_PENDING_DEPOSITS_SLOT, _value);
+    }
+
+    function _pendingDeposits() internal view returns (uint256) {
+        return getUint256(_PENDING_DEPOSITS_SLOT);
+    }
+
+    function _setPendingWithdrawShares(uint256 _value) internal {
+        setUint256(_PENDING_WITHDRAW_SHARES_SLOT, _value);
+    }
+
+    function _pendingWithdrawShares() internal view returns (uint256) {
+        return getUint256(_PENDING_WITHDRAW_SHARES_SLOT);
+    }
+
+    function _setReservedWithdrawals(uint256 _value) internal {
+        setUint256(_RESERVED_WITHDRAWALS_SLOT, _value);
+    }
+
+    function _reservedWithdrawals() internal view returns (uint256) {
+        return getUint256(_RESERVED_WITHDRAWALS_SLOT);
+    }
+
+    function _setUnclaimedDepositShares(uint256 _value) internal {
+        setUint256(_UNCLAIMED_DEPOSIT_SHARES_SLOT, _value);
+    }
+
+    function _unclaimedDepositShares() internal view returns (uint256) {
+        return getUint256(_UNCLAIMED_DEPOSIT_SHARES_SLOT);
+    }
+
+    function _setBufferTargetBps(uint256 _value) internal {
+        setPacked(_FUND_CONFIG_SLOT, _BUFFER_TARGET_BPS_OFFSET, 16, _value);
+    }
+
+    function _bufferTargetBps() internal view returns (uint256) {
+        return getPacked(_FUND_CONFIG_SLOT, _BUFFER_TARGET_BPS_OFFSET, 16);
+    }
+
+    function _setBufferBandBps(uint256 _value) internal {
+        setPacked(_FUND_CONFIG_SLOT, _BUFFER_BAND_BPS_OFFSET, 16, _value);
+    }
+
+    function _bufferBandBps() internal view returns (uint256) {
+        return getPacked(_FUND_CONFIG_SLOT, _BUFFER_BAND_BPS_OFFSET, 16);
+    }
+
+    function _setBufferHits(uint256 _value) internal {
+        setUint256(_BUFFER_HITS_SLOT, _value);
+    }
+
+    function _bufferHits() internal view returns (uint256) {
+        return getUint256(_BUFFER_HITS_SLOT);
+    }
+
+    function _setBufferMisses(uint256 _value) internal {
+        setUint256(_BUFFER_MISSES_SLOT, _value);
+    }
+
+    function _bufferMisses() internal view returns (uint256) {
+        return getUint256(_BUFFER_MISSES_SLOT);
+    }
+
+    function _setRebalanceToleranceBps(uint256 _value) internal {
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _REBALANCE_TOLERANCE_BPS_OFFSET,
+            16,
+            _value
+        );
+    }
+
+    function _rebalanceToleranceBps() internal view returns (uint256) {
+        return
+            getPacked(
+                _FUND_CONFIG_SLOT,
+                _REBALANCE_TOLERANCE_BPS_OFFSET,
+                16
+            );
+    }
+
+    function _setRebalanceMaxMovement(uint256 _value) internal {
+        setUint256(_REBALANCE_MAX_MOVEMENT_SLOT, _value);
+    }
+
+    function _rebalanceMaxMovement() internal view returns (uint256) {
+        return getUint256(_REBALANCE_MAX_MOVEMENT_SLOT);
+    }
+
+    function _setResilientHardWork(bool _value) internal {
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _RESILIENT_HARD_WORK_OFFSET,
+            1,
+            _value ? 1 : 0
+        );
+    }
+
+    function _resilientHardWork() internal view returns (bool) {
+        return
+            getPacked(
+                _FUND_CONFIG_SLOT,
+                _RESILIENT_HARD_WORK_OFFSET,
+                1
+            ) == 1;
+    }
+
+    function _setFullHardWorkDone(bool _value) internal {
+        setPacked(
+            _FUND_CONFIG_SLOT,
+            _FULL_HARD_WORK_DONE_OFFSET,
+            1,
+            _value ? 1 : 0
+        );
+    }
+
+    function _fullHardWorkDone() internal view returns (bool) {
+        return
+            getPacked(
+                _FUND_CONFIG_SLOT,
+                _FULL_HARD_WORK_DONE_OFFSET,
+                1
+            ) == 1;
+    }
+
+    /*
+     * Funds initialized before the packed config keep these values in their own slots.
+     * Moves them into the packed config once and clears the legacy slots. Called on upgrade.
+     */
+    function _migrateToPackedConfig() internal {
+        if (getPacked(_FUND_CONFIG_SLOT, _CONFIG_PACKED_OFFSET, 1) == 1) {
+            return;
+        }
+        setPacked(_FUND_CONFIG_SLOT, _CONFIG_PACKED_OFFSET, 1, 1);
+        _setDecimals(getUint8(_DECIMALS_SLOT));
+        // a legacy limit above 128 bits was unreachable anyway, so it is capped
+        _setDepositLimit(_toPackedLimit(getUint256(_DEPOSIT_LIMIT_SLOT)));
+        _setDepositLimitTxMax(
+            _toPackedLimit(getUint256(_DEPOSIT_LIMIT_TX_MAX_SLOT))
+        );
+        _setDepositLimitTxMin(
+            _toPackedLimit(getUint256(_DEPOSIT_LIMIT_TX_MIN_SLOT))
+        );
+        _setPerformanceFeeFund(getUint256(_PERFORMANCE_FEE_FUND_SLOT));
+        _setPlatformFee(getUint256(_PLATFORM_FEE_SLOT));
+        _setMaxInvestmentInStrategies(
+            getUint256(_MAX_INVESTMENT_IN_STRATEGIES_SLOT)
+        );
+        _setDepositsPaused(getBool(_DEPOSITS_PAUSED_SLOT));
+        _setShouldRebalance(getBool(_SHOULD_REBALANCE_SLOT));
+
+        setUint256(_DECIMALS_SLOT, 0);
+        setUint256(_DEPOSIT_LIMIT_SLOT, 0);
+        setUint256(_DEPOSIT_LIMIT_TX_MAX_SLOT, 0);
+        setUint256(_DEPOSIT_LIMIT_TX_MIN_SLOT, 0);
+        setUint256(_PERFORMANCE_FEE_FUND_SLOT, 0);
+        setUint256(_PLATFORM_FEE_SLOT, 0);
+        setUint256(_MAX_INVESTMENT_IN_STRATEGIES_SLOT, 0);
+        setUint256(_DEPOSITS_PAUSED_SLOT, 0);
+        setUint256(_SHOULD_REBALANCE_SLOT, 0);
+    }
+
+    function _toPackedLimit(uint256 _value) private pure returns (uint256) {
+        return _value > type(uint128).max ? type(uint128).max : _value;
+    }
+
+    function _setUnclaimedFeeShares(uint256 _value) internal {
+        setUint256(_UNCLAIMED_FEE_SHARES_SLOT, _value);
+    }
+
+    function _unclaimedFeeShares() internal view returns (uint256) {
+        return getUint256(_UNCLAIMED_FEE_SHARES_SLOT);
+    }
+
+    function _setFeeDistributor(address _address) internal {
+        setAddress(_FEE_DISTRIBUTOR_SLOT, _address);
+    }
+
+    function _feeDistributor() internal view returns (address) {
+        return getAddress(_FEE_DISTRIBUTOR_SLOT);
+    }
+
     uint256[50] private bigEmptySlot;
 }
@@ -0,0 +1,120 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/IERC20.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC20.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/cryptography/MerkleProof.sol";
+import "../../interfaces/IMerkleDistributor.sol";
+import "../utils/Governable.sol";
+
+interface IFundFeeClaim {
+    function claimFees() external;
+}
+
+/**
+ * Distributes the fee shares of a fund to strategy creators and platform.
+ * The fund accrues these fees to this contract at each hard work, and governance
+ * publishes a merkle root of the balances accrued in each period (built off chain from the fee events).
+ * Claims of a period are tracked in a bitmap, one bit per index of the tree.
+ */
+contract MerkleDistributor is IMerkleDistributor, Governable {
+    using SafeERC20 for IERC20;
+
+    event RootPublished(uint256 indexed period, bytes32 merkleRoot);
+
+    address public immutable override token;
+
+    bytes32[] public merkleRoots; // root of each period
+    mapping(uint256 => mapping(uint256 => uint256)) private claimedBitMap; // period => word index => bits
+
+    constructor(address _token) public {
+        Governable.initializeGovernance(msg.sender);
+        token = _token;
+    }
+
+    /**
+     * Root of the latest period.
+     */
+    function merkleRoot() external view override returns (bytes32) {
+        if (merkleRoots.length == 0) {
+            return bytes32(0);
+        }
+        return merkleRoots[merkleRoots.length - 1];
+    }
+
+    function currentPeriod() public view returns (uint256) {
+        require(merkleRoots.length > 0, "No root published");
+        return merkleRoots.length - 1;
+    }
+
+    /**
+     * Collects the fees accrued to this contract by the fund and publishes the root
+     * of the balances accrued since the previous root.
+     */
+    function publishRoot(bytes32 root) external onlyGovernance {
+        IFundFeeClaim(token).claimFees();
+        merkleRoots.push(root);
+        emit RootPublished(merkleRoots.length - 1, root);
+    }
+
+    function isClaimed(uint256 index) external view override returns (bool) {
+        return isClaimedInPeriod(currentPeriod(), index);
+    }
+
+    function isClaimedInPeriod(uint256 period, uint256 index)
+        public
+        view
+        returns (bool)
+    {
+        uint256 claimedWord = claimedBitMap[period][index / 256];
+        uint256 mask = (1 << (index % 256));
+        return claimedWord & mask == mask;
+    }
+
+    function _setClaimed(uint256 period, uint256 index) private {
+        claimedBitMap[period][index / 256] =
+            claimedBitMap[period][index / 256] |
+            (1 << (index % 256));
+    }
+
+    function claim(
+        uint256 index,
+        address account,
+        uint256 amount,
+        bytes32[] calldata merkleProof
+    ) external override {
+        _claim(currentPeriod(), index, account, amount, merkleProof);
+    }
+
+    function claimForPeriod(
+        uint256 period,
+        uint256 index,
+        address account,
+        uint256 amount,
+        bytes32[] calldata merkleProof
+    ) external {
+        require(period < merkleRoots.length, "Invalid period");
+        _claim(period, index, account, amount, merkleProof);
+    }
+
+    function _claim(
+        uint256 period,
+        uint256 index,
+        address account,
+        uint256 amount,
+        bytes32[] calldata merkleProof
+    ) private {
+        require(!isClaimedInPeriod(period, index), "Drop already claimed");
+
+        bytes32 node = keccak256(abi.encodePacked(index, account, amount));
+        require(
+            MerkleProof.verify(merkleProof, merkleRoots[period], node),
+            "Invalid proof"
+        );
+
+        _setClaimed(period, index);
+        IERC20(token).safeTransfer(account, amount);
+
+        emit Claimed(index, account, amount);
+    }
+}
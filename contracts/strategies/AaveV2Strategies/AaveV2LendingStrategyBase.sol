@@ -11,9 +11,9 @@ import "../../../interfaces/strategies/AaveV2Strategies/IAaveV2.sol";
 import "../../../interfaces/strategies/AaveV2Strategies/IAaveIncentivesController.sol";
 import "../../../interfaces/uniswap/IUniswapV2Router02.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
 import "../../../interfaces/IStrategyUnderOptimizer.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../../../interfaces/IStrategyInitializer.sol";
+import "../StrategyBase.sol";
 import "../../utils/SwapTokensLibrary.sol";
 
 /**
@@ -22,8 +22,9 @@ import "../../utils/SwapTokensLibrary.sol";
  * @notice This strategy lends asset to Aave V2
  */
 abstract contract AaveV2LendingStrategyBase is
-    IStrategy,
-    IStrategyUnderOptimizer
+    StrategyBase,
+    IStrategyUnderOptimizer,
+    IStrategyInitializer
 {
     using SafeERC20 for IERC20;
     using Address for address;
@@ -31,9 +32,10 @@ abstract contract AaveV2LendingStrategyBase is
 
     uint256 internal constant APR_BASE = 10**6;
 
+    // Immutable, a clone deployed by StrategyFactory shares the configuration of its master,
+    // so the master has to be deployed for a fund of the same underlying.
     address public immutable override underlying;
-    address public immutable override fund;
-    address public immutable override creator;
+    address public override creator;
 
     // Address provider for AAVE
     AaveLendingPoolAddressesProviderV2 public immutable aaveAddressesProvider;
@@ -48,7 +50,7 @@ abstract contract AaveV2LendingStrategyBase is
     address public immutable unstakedRewardToken;
 
     // Reward token controller, for claiming rewards
-    address public incentivesController;
+    address public immutable incentivesController;
 
     // DEX router to liquidate rewards to underlying
     address internal immutable _dEXRouter;
@@ -56,11 +58,12 @@ abstract contract AaveV2LendingStrategyBase is
     // base currency serves as path to convert rewards to underlying
     address internal immutable _baseCurrency;
 
+    // Lending pool which has the allowance of underlying
+    address public approvedLendingPool;
+
     // these tokens cannot be claimed by the governance
     mapping(address => bool) public canNotSweep;
 
-    bool public investActivated;
-
     constructor(
         address _fund,
         address aaveAddressProvider_,
@@ -71,16 +74,15 @@ abstract contract AaveV2LendingStrategyBase is
         address baseCurrency_
     ) public {
         require(_fund != address(0), "Fund cannot be empty");
-        fund = _fund;
         address _underlying = IFund(_fund).underlying();
         underlying = _underlying;
-        AaveLendingPoolAddressesProviderV2 _aaveAddressesProvider =
-            AaveLendingPoolAddressesProviderV2(aaveAddressProvider_);
-        aaveAddressesProvider = _aaveAddressesProvider;
-        bytes32 _providerId =
-            0x0100000000000000000000000000000000000000000000000000000000000000;
+        aaveAddressesProvider = AaveLendingPoolAddressesProviderV2(
+            aaveAddressProvider_
+        );
         address _aaveProtocolDataProvider =
-            _aaveAddressesProvider.getAddress(_providerId);
+            AaveLendingPoolAddressesProviderV2(aaveAddressProvider_).getAddress(
+                0x0100000000000000000000000000000000000000000000000000000000000000 // id of the protocol data provider
+            );
         (address _aToken, , ) =
             AaveProtocolDataProviderV2(_aaveProtocolDataProvider)
                 .getReserveTokensAddresses(_underlying);
@@ -91,56 +93,54 @@ abstract contract AaveV2LendingStrategyBase is
         unstakedRewardToken = _unstakedRewardToken;
         _dEXRouter = dEXRouter_;
         _baseCurrency = baseCurrency_;
+        _initializeStrategy(
+            _fund,
+            _underlying,
+            _aToken,
+            _rewardToken,
+            _unstakedRewardToken
+        );
         creator = msg.sender;
-
-        // restricted tokens, can not be swept
-        canNotSweep[_underlying] = true;
-        canNotSweep[_aToken] = true;
-        canNotSweep[_rewardToken] = true;
-        canNotSweep[_unstakedRewardToken] = true;
-
-        investActivated = true;
-    }
-
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
-    }
-
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
     }
 
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
-    }
-
-    modifier onlyFundOrGovernance() {
-        require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
+    /**
+     * Initializes a clone of this strategy deployed by StrategyFactory.
+     */
+    function initialize(address _fund, address _creator) external override {
+        _initializeStrategy(
+            _fund,
+            underlying,
+            aToken,
+            rewardToken,
+            unstakedRewardToken
         );
-        _;
+        creator = _creator;
     }
 
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
-    }
-
-    modifier onlyFundManagerOrGovernance() {
+    /**
+     * Sets the fund, once. Called by the constructor, or by initialize for a clone.
+     * @dev The immutables are passed in, they cannot be read in the constructor of the master.
+     */
+    function _initializeStrategy(
+        address _fund,
+        address _underlying,
+        address _aToken,
+        address _rewardToken,
+        address _unstakedRewardToken
+    ) internal {
+        _initializeFund(_fund);
         require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
+            _underlying == IFund(_fund).underlying(),
+            "Underlying do not match"
         );
-        _;
-    }
 
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
+        // restricted tokens, can not be swept
+        canNotSweep[_underlying] = true;
+        canNotSweep[_aToken] = true;
+        canNotSweep[_rewardToken] = true;
+        canNotSweep[_unstakedRewardToken] = true;
+
+        investActivated = true;
     }
 
     /**
@@ -182,7 +182,7 @@ abstract contract AaveV2LendingStrategyBase is
      * @notice Withdraws an underlying asset from the strategy to the fund in the specified amount.
      * It tries to withdraw from the strategy contract if this has enough balance.
      * Otherwise, we withdraw from Aave V2. Transfer the required underlying amount to fund.
-     * Reinvest any remaining underlying.
+     * Remaining underlying is left idle, the next hard work invests it.
      * @param underlyingAmount Underlying amount to withdraw to fund
      */
     function withdrawToFund(uint256 underlyingAmount)
@@ -211,15 +211,13 @@ abstract contract AaveV2LendingStrategyBase is
 
         _withdrawATokens(_requiredATokens);
 
-        // we can transfer the asset to the fund
+        // aTokens are redeemed 1:1, so there is no surplus to put back
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
-            } else {
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
-            }
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
         }
     }
 
@@ -247,8 +245,7 @@ abstract contract AaveV2LendingStrategyBase is
         address _aaveLendingPool = aaveAddressesProvider.getLendingPool();
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            IERC20(underlying).safeApprove(_aaveLendingPool, 0);
-            IERC20(underlying).safeApprove(_aaveLendingPool, underlyingBalance);
+            _approveLendingPool(_aaveLendingPool, underlyingBalance);
 
             AaveLendingPoolV2(_aaveLendingPool).deposit(
                 underlying,
@@ -259,6 +256,23 @@ abstract contract AaveV2LendingStrategyBase is
         }
     }
 
+    /**
+     * @notice Grants the standing allowance to the lending pool.
+     * When Aave replaces the lending pool in the addresses provider, the allowance of the previous pool is revoked.
+     */
+    function _approveLendingPool(address _aaveLendingPool, uint256 amount)
+        internal
+    {
+        address _previousLendingPool = approvedLendingPool;
+        if (_previousLendingPool != _aaveLendingPool) {
+            if (_previousLendingPool != address(0)) {
+                _revokeAllowance(underlying, _previousLendingPool);
+            }
+            approvedLendingPool = _aaveLendingPool;
+        }
+        _ensureAllowance(underlying, _aaveLendingPool, amount);
+    }
+
     /**
      * @notice This invests all the underlying balance to Aave V2.
      */
@@ -325,13 +339,15 @@ abstract contract AaveV2LendingStrategyBase is
     function _liquidateRewardsAndReinvest(uint256 minUnderlyingExpected)
         internal
     {
-        SwapTokensLibrary._liquidateRewards(
-            rewardToken,
-            underlying,
-            _dEXRouter,
-            _baseCurrency,
-            minUnderlyingExpected
-        );
+        if (!_pushRewards(rewardToken)) {
+            SwapTokensLibrary._liquidateRewards(
+                rewardToken,
+                underlying,
+                _dEXRouter,
+                _baseCurrency,
+                minUnderlyingExpected
+            );
+        }
         _investAllUnderlying();
     }
 
@@ -10,19 +10,17 @@ import "../../../interfaces/strategies/AlphaV2Strategies/IAlphaV2.sol";
 import "../../../interfaces/strategies/AlphaV2Strategies/ICErc20.sol";
 import "../../../interfaces/uniswap/IUniswapV2Router02.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../StrategyBase.sol";
 
 /**
  * This strategy takes an asset (DAI, USDC), lends to AlphaV2 Lending Box.
  */
-abstract contract AlphaV2LendingStrategyBase is IStrategy {
+abstract contract AlphaV2LendingStrategyBase is StrategyBase {
     using SafeERC20 for IERC20;
     using Address for address;
     using SafeMath for uint256;
 
     address public immutable override underlying;
-    address public immutable override fund;
     address public immutable override creator;
 
     // the alphasafebox corresponding to the underlying asset
@@ -48,12 +46,9 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
     // these tokens cannot be claimed by the governance
     mapping(address => bool) public canNotSweep;
 
-    bool public investActivated;
-
     constructor(address _fund, address _aBox) public {
-        require(_fund != address(0), "Fund cannot be empty");
+        _initializeFund(_fund);
         require(_aBox != address(0), "Alpha Safebox cannot be empty");
-        fund = _fund;
         address _underlying = IFund(_fund).underlying();
         require(
             _underlying == IAlphaV2(_aBox).uToken(),
@@ -72,47 +67,6 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
         investActivated = true;
     }
 
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
-    }
-
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
-    }
-
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
-    }
-
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
-    }
-
-    modifier onlyFundOrGovernance() {
-        require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
-        );
-        _;
-    }
-
-    modifier onlyFundManagerOrGovernance() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
-        );
-        _;
-    }
-
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
-    }
-
     /**
      * Allows Governance to withdraw partial shares to reduce slippage incurred
      *  and facilitate migration / withdrawal / strategy switch / emergency
@@ -134,8 +88,8 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
     /**
      * Withdraws an underlying asset from the strategy to the fund in the specified amount.
      * It tries to withdraw from the strategy contract if this has enough balance.
-     * Otherwise, we withdraw shares from the Alpha V2 Lending Box. Transfer the required underlying amount to fund,
-     * and reinvest the rest. We can make it better by calculating the correct amount and withdrawing only that much.
+     * Otherwise, we withdraw the shares worth the missing amount (rounded up) from the Alpha V2 Lending Box.
+     * Transfer the required underlying amount to fund, what is left over is invested again at the next hard work.
      */
     function withdrawToFund(uint256 underlyingAmount)
         external
@@ -163,15 +117,13 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
 
         IAlphaV2(aBox).withdraw(shares);
 
-        // we can transfer the asset to the fund
+        // shares are rounded up, and the dust over the amount waits for the next hard work
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
-            } else {
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
-            }
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
         }
     }
 
@@ -197,9 +149,7 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
 
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            // approve amount per transaction
-            IERC20(underlying).safeApprove(aBox, 0);
-            IERC20(underlying).safeApprove(aBox, underlyingBalance);
+            _ensureAllowance(underlying, aBox, underlyingBalance);
             // deposits the entire balance to Alpha V2 Lending Box
             IAlphaV2(aBox).deposit(underlyingBalance);
         }
@@ -245,6 +195,9 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
     function _liquidateRewardsAndReinvest(uint256 minUnderlyingExpected)
         internal
     {
+        if (_pushRewards(rewardToken)) {
+            return;
+        }
         uint256 rewardAmount = IERC20(rewardToken).balanceOf(address(this));
         if (rewardAmount != 0) {
             IUniswapV2Router02 uniswapRouter =
@@ -318,9 +271,11 @@ abstract contract AlphaV2LendingStrategyBase is IStrategy {
         view
         returns (uint256)
     {
+        uint256 exchangeRate = ICErc20(cToken).exchangeRateStored();
+        // Round up, a share short would leave the withdrawal below underlyingAmount
         return
-            underlyingAmount.mul(PRECISION).div(
-                ICErc20(cToken).exchangeRateStored()
+            underlyingAmount.mul(PRECISION).add(exchangeRate).sub(1).div(
+                exchangeRate
             );
     }
 }
@@ -11,9 +11,9 @@ import "../../../interfaces/strategies/CompoundStrategies/ICToken.sol";
 import "../../../interfaces/strategies/CompoundStrategies/WhitePaperInterestRateModel.sol";
 import "../../../interfaces/strategies/CompoundStrategies/IComptroller.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
 import "../../../interfaces/IStrategyUnderOptimizer.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../../../interfaces/IStrategyInitializer.sol";
+import "../StrategyBase.sol";
 import "../../utils/SwapTokensLibrary.sol";
 import "../../utils/PriceFeedLibrary.sol";
 
@@ -23,8 +23,9 @@ import "../../utils/PriceFeedLibrary.sol";
  * @notice This strategy lends asset to compound
  */
 abstract contract CompoundLendingStrategyBase is
-    IStrategy,
-    IStrategyUnderOptimizer
+    StrategyBase,
+    IStrategyUnderOptimizer,
+    IStrategyInitializer
 {
     using SafeERC20 for IERC20;
     using Address for address;
@@ -37,9 +38,11 @@ abstract contract CompoundLendingStrategyBase is
 
     uint256 internal constant BLOCKS_PER_YEAR = 2371428;
 
+    // The configuration is fixed by the strategy contract, so it stays immutable:
+    // a clone runs the code of its master and reads the same values.
+    // Only what belongs to a fund (fund, creator, parameters) is in storage.
     address public immutable override underlying;
-    address public immutable override fund;
-    address public immutable override creator;
+    address public override creator;
 
     // the c-token corresponding to the underlying asset
     address public immutable cToken;
@@ -59,13 +62,24 @@ abstract contract CompoundLendingStrategyBase is
     // base currency serves as path to convert rewards to underlying
     address internal immutable _baseCurrency;
 
-    uint256 internal allowedSlippage = 500; // In BPS, can be changed
+    // Decimals are read once, when the master is deployed
+    uint8 internal immutable _underlyingDecimals;
+    uint8 internal immutable _rewardTokenDecimals;
+    uint8 internal immutable _priceFeedDecimals;
+
+    uint256 internal allowedSlippage; // In BPS, can be changed
+
+    uint64 public maxPriceAge; // In seconds, the reward token price is not used if older
+
+    // Harvest policy, packed in one slot. In the hard work, rewards are claimed and liquidated only if
+    // worth at least minHarvestValue of underlying, or if maxHarvestInterval has passed since lastHarvest.
+    uint128 public minHarvestValue; // 0 to harvest at every hard work
+    uint64 public maxHarvestInterval; // In seconds, 0 for no forced harvest
+    uint64 public lastHarvest;
 
     // these tokens cannot be claimed by the governance
     mapping(address => bool) public canNotSweep;
 
-    bool public investActivated;
-
     constructor(
         address _fund,
         address _cToken,
@@ -75,14 +89,8 @@ abstract contract CompoundLendingStrategyBase is
         address dEXRouter_,
         address baseCurrency_
     ) public {
-        require(_fund != address(0), "Fund cannot be empty");
         require(_cToken != address(0), "cToken cannot be empty");
-        fund = _fund;
-        address _underlying = IFund(_fund).underlying();
-        require(
-            _underlying == ICToken(_cToken).underlying(),
-            "Underlying do not match"
-        );
+        address _underlying = ICToken(_cToken).underlying();
         underlying = _underlying;
         cToken = _cToken;
         rewardToken = _rewardToken;
@@ -90,55 +98,47 @@ abstract contract CompoundLendingStrategyBase is
         _rewardTokenPriceFeed = rewardTokenPriceFeed_;
         _dEXRouter = dEXRouter_;
         _baseCurrency = baseCurrency_;
+        _underlyingDecimals = ERC20(_underlying).decimals();
+        _rewardTokenDecimals = ERC20(_rewardToken).decimals();
+        _priceFeedDecimals = PriceFeedLibrary._getDecimals(
+            rewardTokenPriceFeed_
+        );
+        _initializeStrategy(_fund, _underlying, _cToken, _rewardToken);
         creator = msg.sender;
-
-        // restricted tokens, can not be swept
-        canNotSweep[_underlying] = true;
-        canNotSweep[_cToken] = true;
-        canNotSweep[_rewardToken] = true;
-
-        investActivated = true;
-    }
-
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
     }
 
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
-    }
-
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
-    }
-
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
+    /**
+     * Initializes a clone of this strategy deployed by StrategyFactory.
+     */
+    function initialize(address _fund, address _creator) external override {
+        _initializeStrategy(_fund, underlying, cToken, rewardToken);
+        creator = _creator;
     }
 
-    modifier onlyFundOrGovernance() {
+    /**
+     * Sets the fund and the parameters, once. Called by the constructor, or by initialize for a clone.
+     * @dev Immutables cannot be read while the master is constructed, so they are passed in.
+     */
+    function _initializeStrategy(
+        address _fund,
+        address _underlying,
+        address _cToken,
+        address _rewardToken
+    ) internal {
+        _initializeFund(_fund);
         require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
+            _underlying == IFund(_fund).underlying(),
+            "Underlying do not match"
         );
-        _;
-    }
+        allowedSlippage = 500;
+        maxPriceAge = 1 days;
 
-    modifier onlyFundManagerOrGovernance() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
-        );
-        _;
-    }
+        // restricted tokens, can not be swept
+        canNotSweep[_underlying] = true;
+        canNotSweep[_cToken] = true;
+        canNotSweep[_rewardToken] = true;
 
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
+        investActivated = true;
     }
 
     /**
@@ -171,7 +171,7 @@ abstract contract CompoundLendingStrategyBase is
      * @notice Withdraws an underlying asset from the strategy to the fund in the specified amount.
      * It tries to withdraw from the strategy contract if this has enough balance.
      * Otherwise, we redeem cToken. Transfer the required underlying amount to fund.
-     * Reinvest any remaining underlying.
+     * Any remaining underlying stays in the strategy until the next hard work.
      * @param underlyingAmount Underlying amount to withdraw to fund
      */
     function withdrawToFund(uint256 underlyingAmount)
@@ -197,15 +197,13 @@ abstract contract CompoundLendingStrategyBase is
             "Error calling redeemUnderlying on Compound"
         );
 
-        // we can transfer the asset to the fund
+        // redeemUnderlying returns the exact amount, nothing is left to reinvest
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
-            } else {
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
-            }
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
         }
     }
 
@@ -216,8 +214,7 @@ abstract contract CompoundLendingStrategyBase is
         uint256 cTokenBalance = ICToken(cToken).balanceOf(address(this));
         uint256 redeemResult = ICToken(cToken).redeem(cTokenBalance);
         require(redeemResult == 0, "Error calling redeem on Compound");
-        _claimRewards();
-        _liquidateRewards();
+        _harvest(0);
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
             IERC20(underlying).safeTransfer(fund, underlyingBalance);
@@ -234,9 +231,7 @@ abstract contract CompoundLendingStrategyBase is
 
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            // approve amount per transaction
-            IERC20(underlying).safeApprove(cToken, 0);
-            IERC20(underlying).safeApprove(cToken, underlyingBalance);
+            _ensureAllowance(underlying, cToken, underlyingBalance);
             // deposits the entire balance to compound
             uint256 mintResult = ICToken(cToken).mint(underlyingBalance);
             require(mintResult == 0, "Error calling mint on Compound");
@@ -244,12 +239,14 @@ abstract contract CompoundLendingStrategyBase is
     }
 
     /**
-     * @notice This claims and liquidates all comp rewards.
+     * @notice This claims and liquidates all comp rewards, if the harvest policy says so.
      * Then invests all the underlying balance to Compound.
      */
     function doHardWork() external override onlyFund {
-        _claimRewards();
-        _liquidateRewards();
+        (bool harvestDue, uint256 rewardPrice) = _isHarvestDue();
+        if (harvestDue) {
+            _harvest(rewardPrice);
+        }
         _investAllUnderlying();
     }
 
@@ -316,7 +313,10 @@ abstract contract CompoundLendingStrategyBase is
     }
 
     function _getRewardPriceInUnderlying() internal view returns (uint256) {
-        return uint256(PriceFeedLibrary._getPrice(_rewardTokenPriceFeed));
+        return
+            uint256(
+                PriceFeedLibrary._getPrice(_rewardTokenPriceFeed, maxPriceAge)
+            );
     }
 
     /**
@@ -335,40 +335,121 @@ abstract contract CompoundLendingStrategyBase is
         allowedSlippage = newSlippage;
     }
 
+    /**
+     * @notice This sets how old the price of the reward token can be. This can be set by fund manager or governance.
+     * @param _maxPriceAge Seconds since the last update of the price feed
+     */
+    function setMaxPriceAge(uint64 _maxPriceAge)
+        external
+        onlyFundManagerOrGovernance
+    {
+        require(_maxPriceAge > 0, "The max price age should be greater than 0");
+        maxPriceAge = _maxPriceAge;
+    }
+
+    /**
+     * @notice This sets when the hard work harvests the rewards. This can be set by fund manager or governance.
+     * @param _minHarvestValue Minimum value of the rewards in underlying, 0 to harvest at every hard work
+     * @param _maxHarvestInterval Seconds after the last harvest when rewards are harvested whatever their value, 0 for never
+     */
+    function setHarvestPolicy(
+        uint128 _minHarvestValue,
+        uint64 _maxHarvestInterval
+    ) external onlyFundManagerOrGovernance {
+        minHarvestValue = _minHarvestValue;
+        maxHarvestInterval = _maxHarvestInterval;
+    }
+
+    /**
+     * @notice Checks if the rewards are worth claiming and liquidating in the hard work.
+     * @dev This only reads the accrued comp and the price feed, which costs far less than the claim and swap.
+     * @return Whether the harvest is due, and the reward price if it was read (0 otherwise), to be reused by the liquidation
+     */
+    function _isHarvestDue() internal view returns (bool, uint256) {
+        uint256 _minHarvestValue = minHarvestValue;
+        if (_minHarvestValue == 0) {
+            return (true, 0);
+        }
+        uint256 _maxHarvestInterval = maxHarvestInterval;
+        if (
+            _maxHarvestInterval != 0 &&
+            // solhint-disable-next-line not-rely-on-time
+            block.timestamp >= uint256(lastHarvest).add(_maxHarvestInterval)
+        ) {
+            return (true, 0);
+        }
+        uint256 rewardPrice = _getRewardPriceInUnderlying();
+        uint256 rewardAmount =
+            _getRewardsBalance().add(
+                IERC20(rewardToken).balanceOf(address(this))
+            );
+        return (
+            _rewardValueInUnderlying(rewardAmount, rewardPrice) >=
+                _minHarvestValue,
+            rewardPrice
+        );
+    }
+
+    /**
+     * @param rewardPrice Price of the reward token already read in this call, 0 if not
+     */
+    function _harvest(uint256 rewardPrice) internal {
+        _claimRewards();
+        _liquidateRewards(rewardPrice);
+        // solhint-disable-next-line not-rely-on-time
+        lastHarvest = uint64(block.timestamp);
+    }
+
     /**
      * @notice This uses price feed to get minimum balance of underlying expected during liquidation of rewards.
      * @dev The slippage can be set by fund manager or governance.
      * @return Minimum underlying expected when liquidating rewards.
      */
-    function _getMinUnderlyingExpectedFromRewards()
+    function _getMinUnderlyingExpectedFromRewards(uint256 rewardPrice)
         internal
         view
         returns (uint256)
     {
-        uint256 rewardPriceInUnderlying = _getRewardPriceInUnderlying();
         uint256 rewardAmount = IERC20(rewardToken).balanceOf(address(this));
-        uint256 minUnderlyingExpected =
-            rewardPriceInUnderlying
-                .mul(
-                rewardAmount.sub(rewardAmount.mul(allowedSlippage).div(MAX_BPS))
-            )
-                .mul(10**uint256(ERC20(underlying).decimals()))
-                .div(
-                10 **
-                    uint256(
-                        PriceFeedLibrary._getDecimals(_rewardTokenPriceFeed)
-                    )
-            )
-                .div(10**uint256(ERC20(rewardToken).decimals()));
-        return minUnderlyingExpected;
+        return
+            _rewardValueInUnderlying(
+                rewardAmount.sub(rewardAmount.mul(allowedSlippage).div(MAX_BPS)),
+                rewardPrice
+            );
+    }
+
+    /**
+     * @notice This gets the value of an amount of reward token in underlying, at the price of the price feed.
+     */
+    function _rewardValueInUnderlying(uint256 rewardAmount, uint256 rewardPrice)
+        internal
+        view
+        returns (uint256)
+    {
+        return
+            PriceFeedLibrary._valueInUnderlying(
+                rewardAmount,
+                rewardPrice,
+                _rewardTokenDecimals,
+                _priceFeedDecimals,
+                _underlyingDecimals
+            );
     }
 
     /**
      * @notice This liquidates all the reward token to underlying and reinvests.
      * @dev This does not claim the rewards.
+     * @param rewardPrice Price of the reward token already read in this call, 0 if not
      */
-    function _liquidateRewards() internal {
-        uint256 minUnderlyingExpected = _getMinUnderlyingExpectedFromRewards();
+    function _liquidateRewards(uint256 rewardPrice) internal {
+        if (_pushRewards(rewardToken)) {
+            return;
+        }
+        if (rewardPrice == 0) {
+            rewardPrice = _getRewardPriceInUnderlying();
+        }
+        uint256 minUnderlyingExpected =
+            _getMinUnderlyingExpectedFromRewards(rewardPrice);
         SwapTokensLibrary._liquidateRewards(
             rewardToken,
             underlying,
@@ -386,8 +467,7 @@ abstract contract CompoundLendingStrategyBase is
         external
         onlyFundManagerOrRelayer
     {
-        _claimRewards();
-        _liquidateRewards();
+        _harvest(0);
         _investAllUnderlying();
     }
 
@@ -430,15 +510,12 @@ abstract contract CompoundLendingStrategyBase is
         uint256 compPerUnderlyingPerBlock =
             compSpeed
                 .mul(PRECISION) // Scaling factor for exchangeRateStored
-                .mul(10**uint256(ERC20(underlying).decimals()))
+                .mul(10**uint256(_underlyingDecimals))
                 .div(cTokenSupply)
                 .div(ICToken(cToken).exchangeRateStored());
         uint256 rewardRatePerBlock =
             _getRewardPriceInUnderlying().mul(compPerUnderlyingPerBlock).div(
-                10 **
-                    uint256(
-                        PriceFeedLibrary._getDecimals(_rewardTokenPriceFeed)
-                    )
+                10**uint256(_priceFeedDecimals)
             );
         return (
             rewardRatePerBlock.mul(BLOCKS_PER_YEAR).mul(APR_BASE).div(PRECISION)
@@ -11,24 +11,32 @@ import "../../../interfaces/strategies/CurveStrategies/ICurveFi.sol";
 import "../../../interfaces/strategies/CurveStrategies/ICurveGauge.sol";
 import "../../../interfaces/uniswap/IUniswapV2Router02.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../../../interfaces/IStrategyInitializer.sol";
+import "../StrategyBase.sol";
 import "../../utils/SwapTokensLibrary.sol";
 import "../../utils/PriceFeedLibrary.sol";
 
 /**
  * This strategy takes an asset (DAI, USDC, USDT), lends to Curve Pool.
  */
-abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
+abstract contract CurveSingleAssetLendingStrategyBase is
+    StrategyBase,
+    IStrategyInitializer
+{
     using SafeERC20 for IERC20;
     using Address for address;
     using SafeMath for uint256;
     using SafeMath for int128;
     using SafeMath for uint8;
 
+    // Bisection steps searching the pool tokens to burn for a withdrawal, 0 to use the calc_token_amount estimate.
+    // Declared before the other storage, it shares the slot of fund and investActivated.
+    uint8 public exactWithdrawIterations;
+
+    // The pool configuration is immutable. A clone deployed by StrategyFactory runs the code of its
+    // master and so reads the same values, the master has to be for a fund of the same underlying.
     address public immutable override underlying;
-    address public immutable override fund;
-    address public immutable override creator;
+    address public override creator;
 
     // the curve pool corresponding to the underlying
     address public immutable crvPool;
@@ -56,7 +64,7 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
     address public immutable rewardTokenPriceFeed;
 
     // Gauge, for staking crvpool token, and claiming rewards
-    address public crvPoolGauge;
+    address public immutable crvPoolGauge;
 
     // Gauge type. Rewards: {1: Only CRV, 2: CRV + Reward, 3: Only Reward}
     uint8 public immutable crvPoolGaugeType;
@@ -67,7 +75,23 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
     // base currency serves as path to convert rewards to underlying
     address internal immutable _baseCurrency;
 
-    uint256 internal allowedSlippage = 500; // In BPS, can be changed
+    // Read once when the master is deployed, instead of calling the tokens and the price feed each time
+    uint8 internal immutable _underlyingDecimals;
+    uint8 internal immutable _rewardTokenDecimals;
+    uint8 internal immutable _priceFeedDecimals;
+
+    uint256 internal allowedSlippage; // In BPS, can be changed
+
+    uint64 public maxPriceAge; // In seconds
+
+    // Harvest policy of the hard work, in one slot. The rewards are harvested once worth minHarvestValue
+    // of underlying, or once maxHarvestInterval has passed since lastHarvest. The hard work does not harvest
+    // while neither is set, rewards are then harvested by claimLiquidateAndReinvestRewards.
+    // The policy covers rewardToken only (gauge types 2 and 3): CRV is not claimed by this strategy yet,
+    // so a pool without a reward token (gauge type 1) has nothing to harvest and cannot set a policy.
+    uint128 public minHarvestValue;
+    uint64 public maxHarvestInterval; // In seconds
+    uint64 public lastHarvest;
 
     uint256 internal constant MAX_BPS = 10000;
 
@@ -75,11 +99,17 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
 
     uint256 internal constant MAX_DECIMAL = 18;
 
+    uint256 internal constant MAX_EXACT_WITHDRAW_ITERATIONS = 64;
+
+    // Width of the search around the estimate, in BPS of the estimate
+    uint256 internal constant EXACT_WITHDRAW_RANGE = 100;
+
+    // The search stops once narrower than this, in BPS of the estimate
+    uint256 internal constant EXACT_WITHDRAW_TOLERANCE = 1;
+
     // these tokens cannot be claimed by the governance
     mapping(address => bool) public canNotSweep;
 
-    bool public investActivated;
-
     constructor(
         address _fund,
         address _crvPool,
@@ -105,31 +135,9 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
             _crvPoolGauge != address(0),
             "Curve Pool gauge cannot be empty"
         );
-        fund = _fund;
         address _underlying = IFund(_fund).underlying();
         underlying = _underlying;
-        uint8 _crvId = type(uint8).max;
-
-        if (!(_isWrappedPool) || (_isWrappedPool && !(_useUnderlying))) {
-            if (ICurveFi(_crvPool).coins(0) == _underlying) {
-                _crvId = 0;
-            } else if (ICurveFi(_crvPool).coins(1) == _underlying) {
-                _crvId = 1;
-            } else if (ICurveFi(_crvPool).coins(2) == _underlying) {
-                _crvId = 2;
-            }
-        } else {
-            if (ICurveFi(_crvPool).underlying_coins(0) == _underlying) {
-                _crvId = 0;
-            } else if (ICurveFi(_crvPool).underlying_coins(1) == _underlying) {
-                _crvId = 1;
-            } else if (ICurveFi(_crvPool).underlying_coins(2) == _underlying) {
-                _crvId = 2;
-            }
-        }
-
-        require(_crvId < 3, "Incorrect curve pool");
-        crvId = _crvId;
+        crvId = _crvIdOf(_crvPool, _underlying, _isWrappedPool, _useUnderlying);
         crvPool = _crvPool;
         crvPoolGaugeType = _crvPoolGaugeType;
         crvPoolToken = _crvPoolToken;
@@ -141,7 +149,61 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
         rewardTokenPriceFeed = _rewardTokenPriceFeed;
         _dEXRouter = dEXRouter_;
         _baseCurrency = baseCurrency_;
+        _underlyingDecimals = ERC20(_underlying).decimals();
+        // Pools without a reward token have no reward token price feed either
+        _rewardTokenDecimals = _rewardToken != address(0)
+            ? ERC20(_rewardToken).decimals()
+            : 0;
+        _priceFeedDecimals = _rewardTokenPriceFeed != address(0)
+            ? PriceFeedLibrary._getDecimals(_rewardTokenPriceFeed)
+            : 0;
+        _initializeStrategy(
+            _fund,
+            _underlying,
+            _crvPoolToken,
+            _crvPoolGauge,
+            _CRVToken,
+            _rewardToken
+        );
         creator = msg.sender;
+    }
+
+    /**
+     * Initializes a clone of this strategy deployed by StrategyFactory.
+     */
+    function initialize(address _fund, address _creator) external override {
+        _initializeStrategy(
+            _fund,
+            underlying,
+            crvPoolToken,
+            crvPoolGauge,
+            CRVToken,
+            rewardToken
+        );
+        creator = _creator;
+    }
+
+    /**
+     * Sets the fund and the parameters, once. Called by the constructor, or by initialize for a clone.
+     * @dev Takes the tokens as arguments, the constructor of the master cannot read its immutables.
+     */
+    function _initializeStrategy(
+        address _fund,
+        address _underlying,
+        address _crvPoolToken,
+        address _crvPoolGauge,
+        // solhint-disable-next-line var-name-mixedcase
+        address _CRVToken,
+        address _rewardToken
+    ) internal {
+        _initializeFund(_fund);
+        require(
+            _underlying == IFund(_fund).underlying(),
+            "Underlying do not match"
+        );
+        allowedSlippage = 500;
+        maxPriceAge = 1 days;
+        exactWithdrawIterations = 5;
 
         // restricted tokens, can not be swept
         canNotSweep[_underlying] = true;
@@ -153,45 +215,35 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
         investActivated = true;
     }
 
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
-    }
-
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
-    }
-
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
-    }
-
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
-    }
-
-    modifier onlyFundOrGovernance() {
-        require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
-        );
-        _;
-    }
-
-    modifier onlyFundManagerOrGovernance() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
-        );
-        _;
-    }
-
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
+    /**
+     * Returns the id of the underlying in the curve pool, reverts if it is not in the pool.
+     */
+    function _crvIdOf(
+        address _crvPool,
+        address _underlying,
+        bool _isWrappedPool,
+        bool _useUnderlying
+    ) internal view returns (uint8) {
+        uint8 _crvId = type(uint8).max;
+        if (!(_isWrappedPool) || (_isWrappedPool && !(_useUnderlying))) {
+            if (ICurveFi(_crvPool).coins(0) == _underlying) {
+                _crvId = 0;
+            } else if (ICurveFi(_crvPool).coins(1) == _underlying) {
+                _crvId = 1;
+            } else if (ICurveFi(_crvPool).coins(2) == _underlying) {
+                _crvId = 2;
+            }
+        } else {
+            if (ICurveFi(_crvPool).underlying_coins(0) == _underlying) {
+                _crvId = 0;
+            } else if (ICurveFi(_crvPool).underlying_coins(1) == _underlying) {
+                _crvId = 1;
+            } else if (ICurveFi(_crvPool).underlying_coins(2) == _underlying) {
+                _crvId = 2;
+            }
+        }
+        require(_crvId < 3, "Incorrect curve pool");
+        return _crvId;
     }
 
     function setInvestActivated(bool _investActivated)
@@ -258,30 +310,75 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
             return;
         }
 
+        _withdrawCrvPoolTokens(
+            _crvPoolTokensForUnderlying(
+                underlyingAmount.sub(underlyingBalanceBefore),
+                IERC20(crvPoolGauge).balanceOf(address(this))
+            )
+        );
+
+        // anything withdrawn over the amount stays idle until the next hard work
+        uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
+        if (underlyingBalance > 0) {
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
+        }
+    }
+
+    /**
+     * Returns the pool tokens to burn to get underlyingAmount out of the pool, at most _totalCrvPoolTokens.
+     * calc_token_amount leaves out the fee of a single coin removal, so the smallest amount which
+     * calc_withdraw_one_coin gives enough underlying for is searched around it.
+     * The bound of the search always gives enough, so stopping early only withdraws a little more,
+     * which stays idle until the next hard work. With the default 5 iterations, that is at most
+     * 2 * EXACT_WITHDRAW_RANGE / 2**5 (about 6 BPS) of the amount.
+     */
+    function _crvPoolTokensForUnderlying(
+        uint256 underlyingAmount,
+        uint256 _totalCrvPoolTokens
+    ) internal view returns (uint256) {
         uint256[3] memory amounts;
         amounts[crvId] = underlyingAmount;
-        uint256 _requiredCrvPoolTokens =
-            ICurveFi(crvPool).calc_token_amount(amounts, false);
-        uint256 _totalCrvPoolTokens =
-            IERC20(crvPoolGauge).balanceOf(address(this));
+        uint256 estimate = ICurveFi(crvPool).calc_token_amount(amounts, false);
+        uint256 iterations = exactWithdrawIterations;
 
-        if (_requiredCrvPoolTokens > _totalCrvPoolTokens) {
+        if (iterations == 0 || estimate >= _totalCrvPoolTokens) {
             //can't withdraw more than we have
-            _requiredCrvPoolTokens = _totalCrvPoolTokens;
+            return Math.min(estimate, _totalCrvPoolTokens);
         }
 
-        _withdrawCrvPoolTokens(_requiredCrvPoolTokens);
+        uint256 range = estimate.mul(EXACT_WITHDRAW_RANGE).div(MAX_BPS);
+        uint256 low = estimate.sub(range);
+        uint256 high = Math.min(estimate.add(range), _totalCrvPoolTokens);
+        if (_withdrawOneCoinOut(high) < underlyingAmount) {
+            return high;
+        }
 
-        // we can transfer the asset to the fund
-        uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
-        if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
+        uint256 tolerance =
+            Math.max(estimate.mul(EXACT_WITHDRAW_TOLERANCE).div(MAX_BPS), 1);
+        for (uint256 i = 0; i < iterations && high.sub(low) > tolerance; i++) {
+            uint256 middle = low.add(high).div(2);
+            if (_withdrawOneCoinOut(middle) >= underlyingAmount) {
+                high = middle;
             } else {
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
+                low = middle;
             }
         }
+        return high;
+    }
+
+    function _withdrawOneCoinOut(uint256 _crvPoolTokens)
+        internal
+        view
+        returns (uint256)
+    {
+        return
+            ICurveFi(crvPool).calc_withdraw_one_coin(
+                _crvPoolTokens,
+                int128(crvId)
+            );
     }
 
     /**
@@ -307,9 +404,7 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
 
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            // approve amount per transaction
-            IERC20(underlying).safeApprove(crvPool, 0);
-            IERC20(underlying).safeApprove(crvPool, underlyingBalance);
+            _ensureAllowance(underlying, crvPool, underlyingBalance);
             uint256[3] memory amounts;
             amounts[crvId] = underlyingBalance;
             uint256 expectedOut =
@@ -327,17 +422,19 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
         // deposit lptokens to the gauge
         uint256 crvPoolTokens = IERC20(crvPoolToken).balanceOf(address(this));
         if (crvPoolTokens > 0) {
-            // approve amount per transaction
-            IERC20(crvPoolToken).safeApprove(crvPoolGauge, 0);
-            IERC20(crvPoolToken).safeApprove(crvPoolGauge, crvPoolTokens);
+            _ensureAllowance(crvPoolToken, crvPoolGauge, crvPoolTokens);
             ICurveGauge(crvPoolGauge).deposit(crvPoolTokens);
         }
     }
 
     /**
-     * The hard work only invests all underlying assets
+     * The hard work harvests the rewards when the harvest policy says so, and invests all underlying assets
      */
     function doHardWork() external override onlyFund {
+        (bool harvestDue, uint256 rewardPrice) = _isHarvestDue();
+        if (harvestDue) {
+            _harvest(rewardPrice);
+        }
         _investAllUnderlying();
     }
 
@@ -405,7 +502,10 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
     }
 
     function _getRewardPriceInUnderlying() internal view returns (uint256) {
-        return uint256(PriceFeedLibrary._getPrice(rewardTokenPriceFeed));
+        return
+            uint256(
+                PriceFeedLibrary._getPrice(rewardTokenPriceFeed, maxPriceAge)
+            );
     }
 
     function updateSlippage(uint256 newSlippage)
@@ -420,28 +520,109 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
         allowedSlippage = newSlippage;
     }
 
-    function _getMinUnderlyingExpectedFromRewards()
+    /**
+     * More iterations withdraw closer to the amount asked, each one quotes the pool once more.
+     */
+    function setExactWithdrawIterations(uint8 _exactWithdrawIterations)
+        external
+        onlyFundManagerOrGovernance
+    {
+        require(
+            _exactWithdrawIterations <= MAX_EXACT_WITHDRAW_ITERATIONS,
+            "Too many iterations"
+        );
+        exactWithdrawIterations = _exactWithdrawIterations;
+    }
+
+    function setMaxPriceAge(uint64 _maxPriceAge)
+        external
+        onlyFundManagerOrGovernance
+    {
+        require(_maxPriceAge > 0, "The max price age should be greater than 0");
+        maxPriceAge = _maxPriceAge;
+    }
+
+    function setHarvestPolicy(
+        uint128 _minHarvestValue,
+        uint64 _maxHarvestInterval
+    ) external onlyFundManagerOrGovernance {
+        require(
+            rewardToken != address(0) && rewardTokenPriceFeed != address(0),
+            "No reward token to harvest"
+        );
+        minHarvestValue = _minHarvestValue;
+        maxHarvestInterval = _maxHarvestInterval;
+    }
+
+    // Reads the claimable rewards from the gauge, which is why it is not a view.
+    // Also returns the reward price when it was read (0 otherwise), so that the liquidation does not read it again.
+    function _isHarvestDue() internal returns (bool, uint256) {
+        uint256 _minHarvestValue = minHarvestValue;
+        uint256 _maxHarvestInterval = maxHarvestInterval;
+        if (
+            _maxHarvestInterval != 0 &&
+            // solhint-disable-next-line not-rely-on-time
+            block.timestamp >= uint256(lastHarvest).add(_maxHarvestInterval)
+        ) {
+            return (true, 0);
+        }
+        if (_minHarvestValue == 0) {
+            return (false, 0);
+        }
+        uint256 rewardPrice = _getRewardPriceInUnderlying();
+        uint256 rewardAmount =
+            _getRewardsBalance().add(
+                IERC20(rewardToken).balanceOf(address(this))
+            );
+        return (
+            _rewardValueInUnderlying(rewardAmount, rewardPrice) >=
+                _minHarvestValue,
+            rewardPrice
+        );
+    }
+
+    // Without a reward token there is nothing to claim or liquidate
+    function _harvest(uint256 rewardPrice) internal {
+        if (rewardToken == address(0)) {
+            return;
+        }
+        _claimRewards();
+        _liquidateRewards(rewardPrice);
+        // solhint-disable-next-line not-rely-on-time
+        lastHarvest = uint64(block.timestamp);
+    }
+
+    function _getMinUnderlyingExpectedFromRewards(uint256 rewardPrice)
         internal
         view
         returns (uint256)
     {
-        uint256 rewardPriceInUnderlying = _getRewardPriceInUnderlying();
         uint256 rewardAmount = IERC20(rewardToken).balanceOf(address(this));
-        uint256 minUnderlyingExpected =
-            rewardPriceInUnderlying
-                .mul(
-                rewardAmount.sub(rewardAmount.mul(allowedSlippage).div(MAX_BPS))
-            )
-                .mul(10**uint256(ERC20(underlying).decimals()))
-                .div(
-                10**uint256(PriceFeedLibrary._getDecimals(rewardTokenPriceFeed))
-            )
-                .div(10**uint256(ERC20(rewardToken).decimals()));
-        return minUnderlyingExpected;
+        return
+            _rewardValueInUnderlying(
+                rewardAmount.sub(rewardAmount.mul(allowedSlippage).div(MAX_BPS)),
+                rewardPrice
+            );
+    }
+
+    function _rewardValueInUnderlying(uint256 rewardAmount, uint256 rewardPrice)
+        internal
+        view
+        returns (uint256)
+    {
+        return
+            PriceFeedLibrary._valueInUnderlying(
+                rewardAmount,
+                rewardPrice,
+                _rewardTokenDecimals,
+                _priceFeedDecimals,
+                _underlyingDecimals
+            );
     }
 
     function _liquidateCRVRewards() internal {
-        uint256 minUnderlyingExpected = _getMinUnderlyingExpectedFromRewards(); // TODO
+        uint256 minUnderlyingExpected =
+            _getMinUnderlyingExpectedFromRewards(_getRewardPriceInUnderlying()); // TODO
         SwapTokensLibrary._liquidateRewards(
             CRVToken,
             underlying,
@@ -451,8 +632,16 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
         );
     }
 
-    function _liquidateRewards() internal {
-        uint256 minUnderlyingExpected = _getMinUnderlyingExpectedFromRewards();
+    // rewardPrice is the price of the reward token if it was already read in this call, 0 otherwise
+    function _liquidateRewards(uint256 rewardPrice) internal {
+        if (_pushRewards(rewardToken)) {
+            return;
+        }
+        if (rewardPrice == 0) {
+            rewardPrice = _getRewardPriceInUnderlying();
+        }
+        uint256 minUnderlyingExpected =
+            _getMinUnderlyingExpectedFromRewards(rewardPrice);
         SwapTokensLibrary._liquidateRewards(
             rewardToken,
             underlying,
@@ -471,22 +660,16 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
     {
         // _claimCRVRewards();  // Not needed for polygon
         // _liquidateCRVRewards();  // Not needed for polygon
-        _claimRewards();
-        _liquidateRewards();
+        _harvest(0);
         _investAllUnderlying();
     }
 
     function _virtualPriceInUnderlying() internal view returns (uint256) {
-        if (ERC20(underlying).decimals() < MAX_DECIMAL) {
+        uint8 decimals = _underlyingDecimals;
+        if (decimals < MAX_DECIMAL) {
             return
                 ICurveFi(crvPool).get_virtual_price().div(
-                    10 **
-                        (
-                            uint256(
-                                uint8(MAX_DECIMAL) -
-                                    ERC20(underlying).decimals()
-                            )
-                        )
+                    10**(uint256(uint8(MAX_DECIMAL) - decimals))
                 );
         } else {
             return ICurveFi(crvPool).get_virtual_price();
@@ -506,7 +689,8 @@ abstract contract CurveSingleAssetLendingStrategyBase is IStrategy {
         uint256 _crvPoolTokens = IERC20(crvPoolGauge).balanceOf(address(this));
 
         if (_crvPoolTokens == 0) {
-            return 0;
+            // withdrawals can leave underlying idle here
+            return IERC20(underlying).balanceOf(address(this));
         }
 
         //we want to choose lower value of virtual price and amount we really get out
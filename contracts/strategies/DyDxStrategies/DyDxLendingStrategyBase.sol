@@ -13,15 +13,16 @@ import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC2
 import "../../../interfaces/strategies/DyDxStrategies/IDyDx.sol";
 import "../../../interfaces/strategies/DyDxStrategies/IInterestSetter.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
 import "../../../interfaces/IStrategyUnderOptimizer.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../../../interfaces/IStrategyInitializer.sol";
 import "../../../interfaces/strategies/DyDxStrategies/DyDxStructs.sol";
+import "../StrategyBase.sol";
 
 abstract contract DyDxLendingStrategyBase is
     DyDxStructs,
-    IStrategy,
-    IStrategyUnderOptimizer
+    StrategyBase,
+    IStrategyUnderOptimizer,
+    IStrategyInitializer
 {
     using SafeERC20 for IERC20;
     using Address for address;
@@ -31,87 +32,48 @@ abstract contract DyDxLendingStrategyBase is
 
     uint256 public constant secondsInAYear = 31536000;
 
+    /// underlying and marketId are immutable, a clone deployed by StrategyFactory shares them with its master
     address public immutable override underlying; /// underlying asset of the strategy
-    address public immutable override fund; /// fund which deployed this strategy
-    address public immutable override creator; /// creator of the strategy
+    address public override creator; /// creator of the strategy
 
     address public constant dydxAddressesProvider =
         address(0x1E0447b19BB6EcFdAe1e4AE1694b0C3659614e4e); /// solmargin contract from DyDx. This is where we lend assets.
-    IDyDx internal dydx = IDyDx(dydxAddressesProvider); /// Object to interact with above contract's functions
+    IDyDx internal constant dydx = IDyDx(dydxAddressesProvider); /// Object to interact with above contract's functions
     uint256 public immutable marketId; /// market id for DyDx pool 0 for ETH, 2 for USDC, 3 for DAI
 
     /// these tokens cannot be swept by the governance
     mapping(address => bool) public canNotSweep;
 
-    bool public investActivated; /// if false, this contract doesn't lend any new assets to DyDx
-
     /// @notice Deploys the lending strategy for DyDx for a particular fund and underlying asset
     /// @param _fund is the address of the fund adding this strategy
     /// @param _marketId decides which asset are we deploying this strategy for. 0 for ETH, 2 for USDC, 3 for DAI
     constructor(address _fund, uint256 _marketId) public {
-        require(_fund != address(0), "Fund cannot be empty");
-        fund = _fund;
-        address _underlying = IFund(_fund).underlying();
-        // the underlying asset of the strategy should match the underlying asset of the dydx market
-        require(
-            _underlying == dydx.getMarketTokenAddress(_marketId),
-            "Underlying do not match"
-        );
+        address _underlying = dydx.getMarketTokenAddress(_marketId);
         underlying = _underlying;
         marketId = _marketId;
+        _initializeStrategy(_fund, _underlying);
         creator = msg.sender;
-
-        // undelying asset of this strategy can not be swept by the governance
-        canNotSweep[_underlying] = true;
-        investActivated = true;
-    }
-
-    /// @return the ERC20 address of the governance
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
-    }
-
-    /// @return the ERC20 address of the fund manager
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
-    }
-
-    /// @return the ERC20 address of the Relayer
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
     }
 
-    /// used to restrict access of functions to only Fund
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
+    /// @notice Initializes a clone of this strategy deployed by StrategyFactory
+    function initialize(address _fund, address _creator) external override {
+        _initializeStrategy(_fund, underlying);
+        creator = _creator;
     }
 
-    /// used to restrict access of functions to either Fund or Governance
-    modifier onlyFundOrGovernance() {
-        require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
-        );
-        _;
-    }
-
-    /// used to restrict access of functions to either Fund Manager or Governance
-    modifier onlyFundManagerOrGovernance() {
+    /// @notice Sets the fund, once. Called by the constructor, or by initialize for a clone
+    /// @dev underlying is passed in, as the constructor cannot read immutables
+    function _initializeStrategy(address _fund, address _underlying) internal {
+        _initializeFund(_fund);
+        // the underlying asset of the strategy should match the underlying asset of the dydx market
         require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
+            _underlying == IFund(_fund).underlying(),
+            "Underlying do not match"
         );
-        _;
-    }
 
-    /// used to restrict access of functions to either Fund Manager or Relayer
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
+        // undelying asset of this strategy can not be swept by the governance
+        canNotSweep[_underlying] = true;
+        investActivated = true;
     }
 
     /**
@@ -204,16 +166,13 @@ abstract contract DyDxLendingStrategyBase is
         );
         dydx.operate(infos, actions);
 
-        // now we can transfer the assets to the fund
+        // the withdrawal is an exact Wei delta, so there is no surplus to redeposit
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
-            } else {
-                // if we are still short the balance that needs to be withdrawn, we just withdraw all the available balance to the fund
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
-            }
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
         }
     }
 
@@ -282,8 +241,8 @@ abstract contract DyDxLendingStrategyBase is
                 0,
                 emptyData
             );
-            IERC20(underlying).approve(dydxAddressesProvider, 0);
-            IERC20(underlying).approve(
+            _ensureAllowance(
+                underlying,
                 dydxAddressesProvider,
                 underlyingBalance
             );
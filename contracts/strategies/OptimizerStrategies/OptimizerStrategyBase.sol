@@ -7,11 +7,12 @@ import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/math/Math.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/math/SafeMath.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/IERC20.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/utils/Address.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/utils/SafeCast.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC20.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
 import "../../../interfaces/IStrategyUnderOptimizer.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../../../interfaces/IStrategyInitializer.sol";
+import "../StrategyBase.sol";
 
 /**
  * This strategy takes an asset, and invests into the best strategy
@@ -21,23 +22,28 @@ import "../../../interfaces/IGovernable.sol";
  * @author Mesh Finance
  * @notice This strategy takes an asset, and invests into the strategy with highest APR
  */
-contract OptimizerStrategyBase is IStrategy {
+contract OptimizerStrategyBase is StrategyBase, IStrategyInitializer {
     using SafeERC20 for IERC20;
     using Address for address;
     using SafeMath for uint256;
+    using SafeCast for uint256;
 
     event StrategyAddedOptimizer(address indexed strategy);
     event StrategyRemovedOptimizer(address indexed strategy);
     event ActiveStrategyChangedOptimizer(address indexed strategy);
+    event MultiAllocationUpdated(bool multiAllocation);
+    event StrategyAllocated(address indexed strategy, uint256 target);
+    event MigrationProgressed(address indexed strategy, uint256 remaining);
 
     address internal constant ZERO_ADDRESS = address(0);
 
     string public constant override name = "OptimizerStrategyBase";
     string public constant override version = "V1";
 
+    // Immutable like the configuration of the strategies, a clone deployed by StrategyFactory
+    // has the underlying of its master and can only be initialized for a fund of that underlying.
     address public immutable override underlying;
-    address public immutable override fund;
-    address public immutable deployer;
+    address public deployer;
 
     // these tokens cannot be claimed by the governance
     mapping(address => bool) public canNotSweep;
@@ -45,44 +51,62 @@ contract OptimizerStrategyBase is IStrategy {
     address[] public strategies;
 
     address public activeStrategy;
+    // When set, the capital is spread across the strategies instead of following activeStrategy alone
+    bool public multiAllocation;
+    uint8 public maxAllocationSteps; // most chunks the capital is split into when allocating
+    uint64 public activeSince; // when activeStrategy was selected
+
+    // Previous active strategy, drained by at most maxMigrationAmount per hard work
+    address public previousStrategy;
+    uint64 public minHoldingPeriod; // In seconds, before switching away from activeStrategy
+    uint256 public minAllocationChunk; // smallest amount allocated or moved at a time
+    uint256 public minAprAdvantage; // APR a strategy must beat the active one by, to replace it
+    uint256 public maxMigrationAmount; // most underlying moved between strategies per hard work, 0 for no cap
+
+    // Allocation of each strategy at the last hard work, in multi allocation
+    mapping(address => uint256) public targetAllocations;
+
+    // APR and balance of a strategy as of blockNumber, packed in a slot
+    struct AprSnapshot {
+        uint64 apr;
+        uint64 blockNumber;
+        uint128 investedUnderlyingBalance;
+    }
 
-    bool public investActivated;
+    // Taken at each hard work, so that the strategies can be listed without quoting their APR
+    mapping(address => AprSnapshot) public aprSnapshots;
 
     constructor(address _fund) public {
         require(_fund != address(0), "Fund cannot be empty");
-        fund = _fund;
         address _underlying = IFund(_fund).underlying();
         underlying = _underlying;
+        _initializeStrategy(_fund, _underlying);
         deployer = msg.sender;
-
-        // restricted tokens, can not be swept
-        canNotSweep[_underlying] = true;
-
-        investActivated = true;
     }
 
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
-    }
-
-    function governance() external view returns (address) {
-        return _governance();
-    }
-
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
+    /**
+     * Initializes a clone of this strategy deployed by StrategyFactory.
+     */
+    function initialize(address _fund, address _creator) external override {
+        _initializeStrategy(_fund, underlying);
+        deployer = _creator;
     }
 
-    function fundManager() external view returns (address) {
-        return _fundManager();
-    }
+    /**
+     * @dev The underlying is passed in, the constructor cannot read it from the immutable.
+     */
+    function _initializeStrategy(address _fund, address _underlying) internal {
+        _initializeFund(_fund);
+        require(
+            _underlying == IFund(_fund).underlying(),
+            "Underlying do not match"
+        );
 
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
-    }
+        // restricted tokens, can not be swept
+        canNotSweep[_underlying] = true;
 
-    function relayer() external view returns (address) {
-        return _relayer();
+        investActivated = true;
+        maxAllocationSteps = 10;
     }
 
     function creator() external view override returns (address) {
@@ -92,9 +116,16 @@ contract OptimizerStrategyBase is IStrategy {
         return deployer;
     }
 
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
+    /**
+     * @notice Reads the roles from the fund again, and passes them down to the strategies of the optimizer,
+     * which read their roles from this contract.
+     */
+    function syncRoles() public override {
+        super.syncRoles();
+        for (uint256 i = 0; i < strategies.length; i++) {
+            // a strategy that does not cache the roles has nothing to sync
+            try IStrategyRoles(strategies[i]).syncRoles() {} catch {}
+        }
     }
 
     modifier onlyFundManager() {
@@ -105,30 +136,6 @@ contract OptimizerStrategyBase is IStrategy {
         _;
     }
 
-    modifier onlyFundOrGovernance() {
-        require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
-        );
-        _;
-    }
-
-    modifier onlyFundManagerOrGovernance() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
-        );
-        _;
-    }
-
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
-    }
-
     /**
      * @notice Allows Governance/Fund Manager to stop/start investing from this strategy to active strategies
      * @dev Used for emergencies
@@ -141,6 +148,63 @@ contract OptimizerStrategyBase is IStrategy {
         investActivated = _investActivated;
     }
 
+    /**
+     * @notice Switches between investing everything in the active strategy, and spreading it across the strategies.
+     * @dev When switched off, the other strategies are emptied so that only the active strategy holds capital.
+     * @param _multiAllocation Spread the capital across the strategies or not
+     */
+    function setMultiAllocation(bool _multiAllocation)
+        external
+        onlyFundManagerOrGovernance
+    {
+        if (multiAllocation == _multiAllocation) {
+            return;
+        }
+        multiAllocation = _multiAllocation;
+        // each strategy is a position in multi allocation, and only the active one is afterwards
+        previousStrategy = ZERO_ADDRESS;
+        if (!_multiAllocation) {
+            for (uint256 i = 0; i < strategies.length; i++) {
+                delete targetAllocations[strategies[i]];
+                if (strategies[i] != activeStrategy) {
+                    _withdrawAllFromStrategy(strategies[i]);
+                }
+            }
+        }
+        emit MultiAllocationUpdated(_multiAllocation);
+    }
+
+    /**
+     * @notice Sets how finely the capital is split in multi allocation.
+     * More steps follow the APR curves more closely, at the cost of more APR reads in each hard work.
+     * @param _maxAllocationSteps Most chunks the capital is split into
+     * @param _minAllocationChunk Smallest amount allocated or moved at a time
+     */
+    function setAllocationParameters(
+        uint8 _maxAllocationSteps,
+        uint256 _minAllocationChunk
+    ) external onlyFundManagerOrGovernance {
+        require(_maxAllocationSteps > 0, "Steps cannot be zero");
+        maxAllocationSteps = _maxAllocationSteps;
+        minAllocationChunk = _minAllocationChunk;
+    }
+
+    /**
+     * @notice Sets when the active strategy is replaced, and how fast the capital moves to the new one.
+     * @param _minAprAdvantage APR (same base as the strategies) a strategy must beat the active one by
+     * @param _minHoldingPeriod Seconds a strategy stays active before it can be replaced
+     * @param _maxMigrationAmount Most underlying moved per hard work, 0 to move everything at once
+     */
+    function setSwitchingParameters(
+        uint256 _minAprAdvantage,
+        uint64 _minHoldingPeriod,
+        uint256 _maxMigrationAmount
+    ) external onlyFundManagerOrGovernance {
+        minAprAdvantage = _minAprAdvantage;
+        minHoldingPeriod = _minHoldingPeriod;
+        maxMigrationAmount = _maxMigrationAmount;
+    }
+
     /**
      * @notice Withdraws an underlying asset from the strategy to the fund in the specified amount.
      * It tries to withdraw from this optimizer contract if this has enough balance.
@@ -160,21 +224,23 @@ contract OptimizerStrategyBase is IStrategy {
             return;
         }
 
-        if (activeStrategy != ZERO_ADDRESS) {
-            IStrategy(activeStrategy).withdrawToFund(
+        if (multiAllocation) {
+            _withdrawFromStrategies(
+                underlyingAmount.sub(underlyingBalanceBefore)
+            );
+        } else {
+            _withdrawFromActiveStrategies(
                 underlyingAmount.sub(underlyingBalanceBefore)
             );
         }
 
-        // we can transfer the asset to the fund
+        // a surplus from the strategies stays here, and is invested at the next hard work
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
-            } else {
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
-            }
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
         }
     }
 
@@ -182,8 +248,18 @@ contract OptimizerStrategyBase is IStrategy {
      * @notice Withdraws all assets from the active strategy and transfers all underlying to fund.
      */
     function withdrawAllToFund() external override onlyFund {
-        if (activeStrategy != ZERO_ADDRESS) {
-            IStrategy(activeStrategy).withdrawAllToFund();
+        if (multiAllocation) {
+            for (uint256 i = 0; i < strategies.length; i++) {
+                _withdrawAllFromStrategy(strategies[i]);
+            }
+        } else {
+            if (previousStrategy != ZERO_ADDRESS) {
+                _withdrawAllFromStrategy(previousStrategy);
+                previousStrategy = ZERO_ADDRESS;
+            }
+            if (activeStrategy != ZERO_ADDRESS) {
+                IStrategy(activeStrategy).withdrawAllToFund();
+            }
         }
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
@@ -193,11 +269,13 @@ contract OptimizerStrategyBase is IStrategy {
 
     /**
      * @notice This selects new active strategy based on APR
-     * @dev If active strategy is changed, funds are withdrawn from current active strategy
+     * @dev The active strategy is only replaced by one with at least minAprAdvantage more APR,
+     * and not before minHoldingPeriod. The replaced strategy is drained over the next hard works.
      */
     function _selectActiveStrategy() internal {
         if (strategies.length > 0) {
             uint256 highestApr = 0;
+            uint256 activeApr = 0;
             address highestAprStrategy;
 
             uint256 underlyingBalance =
@@ -208,18 +286,23 @@ contract OptimizerStrategyBase is IStrategy {
                 apr = IStrategyUnderOptimizer(strategies[i]).aprAfterDeposit(
                     underlyingBalance
                 );
+                if (strategies[i] == activeStrategy) {
+                    activeApr = apr;
+                }
                 if (apr > highestApr) {
                     highestApr = apr;
                     highestAprStrategy = strategies[i];
                 }
             }
 
-            if (highestAprStrategy != activeStrategy) {
-                if (activeStrategy != ZERO_ADDRESS) {
-                    IStrategy(activeStrategy).withdrawAllToFund();
-                }
-                activeStrategy = highestAprStrategy;
-                emit ActiveStrategyChangedOptimizer(activeStrategy);
+            if (
+                highestAprStrategy != activeStrategy &&
+                (activeStrategy == ZERO_ADDRESS ||
+                    (highestApr >= activeApr.add(minAprAdvantage) &&
+                        block.timestamp >=
+                        uint256(activeSince).add(minHoldingPeriod)))
+            ) {
+                _switchActiveStrategy(highestAprStrategy);
             }
         } else {
             if (activeStrategy != ZERO_ADDRESS) {
@@ -227,6 +310,53 @@ contract OptimizerStrategyBase is IStrategy {
                 emit ActiveStrategyChangedOptimizer(activeStrategy);
             }
         }
+        _migrate();
+    }
+
+    /**
+     * @dev The active strategy becomes the previous one, to be drained by _migrate.
+     * A previous strategy that is still being drained is emptied at once, unless it becomes active again.
+     */
+    function _switchActiveStrategy(address newStrategy) internal {
+        address oldStrategy = activeStrategy;
+        if (oldStrategy != ZERO_ADDRESS) {
+            if (
+                previousStrategy != ZERO_ADDRESS &&
+                previousStrategy != newStrategy
+            ) {
+                _withdrawAllFromStrategy(previousStrategy);
+            }
+            previousStrategy = oldStrategy;
+        } else if (previousStrategy == newStrategy) {
+            previousStrategy = ZERO_ADDRESS;
+        }
+        activeStrategy = newStrategy;
+        activeSince = uint64(block.timestamp);
+        emit ActiveStrategyChangedOptimizer(newStrategy);
+    }
+
+    /**
+     * @dev Moves at most maxMigrationAmount out of the previous active strategy.
+     */
+    function _migrate() internal {
+        address from = previousStrategy;
+        if (from == ZERO_ADDRESS) {
+            return;
+        }
+        uint256 position = IStrategy(from).investedUnderlyingBalance();
+        if (maxMigrationAmount == 0 || position <= maxMigrationAmount) {
+            if (position > 0) {
+                IStrategy(from).withdrawAllToFund();
+            }
+            previousStrategy = ZERO_ADDRESS;
+            emit MigrationProgressed(from, 0);
+        } else {
+            IStrategy(from).withdrawToFund(maxMigrationAmount);
+            emit MigrationProgressed(
+                from,
+                IStrategy(from).investedUnderlyingBalance()
+            );
+        }
     }
 
     /**
@@ -237,6 +367,11 @@ contract OptimizerStrategyBase is IStrategy {
             return;
         }
 
+        if (multiAllocation) {
+            _allocate();
+            return;
+        }
+
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
 
         if (activeStrategy != ZERO_ADDRESS) {
@@ -256,8 +391,204 @@ contract OptimizerStrategyBase is IStrategy {
      * @dev If active strategy is changed, funds are first withdrawn from current active strategy
      */
     function doHardWork() external override onlyFund {
-        _selectActiveStrategy();
+        if (!multiAllocation) {
+            _selectActiveStrategy();
+        }
         _investAllUnderlying();
+        _refreshAprSnapshots();
+    }
+
+    /**
+     * @notice Takes the APR and balance snapshot of the strategies, as listed by getStrategiesCached.
+     * @dev Strategies already snapshotted in this block are skipped.
+     */
+    function refreshAprSnapshots() external {
+        _refreshAprSnapshots();
+    }
+
+    function _refreshAprSnapshots() internal {
+        for (uint256 i = 0; i < strategies.length; i++) {
+            address strategy = strategies[i];
+            if (aprSnapshots[strategy].blockNumber == block.number) {
+                continue;
+            }
+            aprSnapshots[strategy] = AprSnapshot({
+                apr: IStrategyUnderOptimizer(strategy).apr().toUint64(),
+                blockNumber: block.number.toUint64(),
+                investedUnderlyingBalance: IStrategy(strategy)
+                    .investedUnderlyingBalance()
+                    .toUint128()
+            });
+        }
+    }
+
+    /**
+     * @notice Spreads the capital across the strategies, so that the APR of the last chunk in each is about the same.
+     * Strategies above their allocation are drawn down first, then the idle balance is deposited
+     * in the strategies below theirs.
+     * @dev The strategy with the largest allocation is kept as activeStrategy.
+     */
+    function _allocate() internal {
+        uint256 count = strategies.length;
+        if (count == 0) {
+            return;
+        }
+
+        uint256[] memory positions = new uint256[](count);
+        uint256 total = IERC20(underlying).balanceOf(address(this));
+        for (uint256 i = 0; i < count; i++) {
+            positions[i] = IStrategy(strategies[i]).investedUnderlyingBalance();
+            total = total.add(positions[i]);
+        }
+
+        uint256[] memory targets = _waterFill(positions, total);
+
+        uint256 largest;
+        // draw-downs share the migration cap of the hard work
+        uint256 budget =
+            maxMigrationAmount == 0 ? uint256(-1) : maxMigrationAmount;
+        for (uint256 i = 0; i < count; i++) {
+            if (targets[i] > targets[largest]) {
+                largest = i;
+            }
+            if (
+                positions[i] > targets[i].add(minAllocationChunk) &&
+                budget > 0
+            ) {
+                uint256 amount = Math.min(positions[i].sub(targets[i]), budget);
+                budget = budget.sub(amount);
+                IStrategy(strategies[i]).withdrawToFund(amount);
+            }
+        }
+
+        for (uint256 i = 0; i < count; i++) {
+            address strategy = strategies[i];
+            uint256 idle = IERC20(underlying).balanceOf(address(this));
+            if (targets[i] > positions[i] && idle > 0) {
+                IERC20(underlying).safeTransfer(
+                    strategy,
+                    Math.min(targets[i].sub(positions[i]), idle)
+                );
+            }
+            if (targets[i] > 0 || positions[i] > 0) {
+                IStrategy(strategy).doHardWork();
+            }
+            targetAllocations[strategy] = targets[i];
+            emit StrategyAllocated(strategy, targets[i]);
+        }
+
+        if (strategies[largest] != activeStrategy) {
+            activeStrategy = strategies[largest];
+            emit ActiveStrategyChangedOptimizer(activeStrategy);
+        }
+    }
+
+    /**
+     * @notice Splits total in chunks, and gives each chunk to the strategy with the highest APR after receiving it.
+     * Only the APR of the strategy that received the last chunk changes, so it is the only one read again.
+     * @param positions Amount currently invested in each strategy
+     * @param total Capital to allocate, invested and idle
+     * @return targets Amount to hold in each strategy
+     */
+    function _waterFill(uint256[] memory positions, uint256 total)
+        internal
+        view
+        returns (uint256[] memory targets)
+    {
+        uint256 count = positions.length;
+        targets = new uint256[](count);
+        uint256 chunk =
+            Math.max(
+                total.add(maxAllocationSteps - 1).div(maxAllocationSteps),
+                minAllocationChunk
+            );
+        if (chunk == 0) {
+            return targets;
+        }
+
+        uint256[] memory nextAprs = new uint256[](count);
+        for (uint256 i = 0; i < count; i++) {
+            nextAprs[i] = _aprWithAllocation(i, positions[i], chunk);
+        }
+
+        uint256 allocated;
+        while (allocated < total) {
+            uint256 best;
+            for (uint256 i = 1; i < count; i++) {
+                if (nextAprs[i] > nextAprs[best]) {
+                    best = i;
+                }
+            }
+            uint256 amount = Math.min(chunk, total.sub(allocated));
+            targets[best] = targets[best].add(amount);
+            allocated = allocated.add(amount);
+            nextAprs[best] = _aprWithAllocation(
+                best,
+                positions[best],
+                targets[best].add(chunk)
+            );
+        }
+    }
+
+    /**
+     * @dev APR of the strategy at index if it held allocation. Below the current position,
+     * the current APR is used, as strategies only quote deposits.
+     */
+    function _aprWithAllocation(
+        uint256 index,
+        uint256 position,
+        uint256 allocation
+    ) internal view returns (uint256) {
+        return
+            IStrategyUnderOptimizer(strategies[index]).aprAfterDeposit(
+                allocation > position ? allocation.sub(position) : 0
+            );
+    }
+
+    /**
+     * @dev Withdraws amount to this contract, from the previous active strategy first, then the active one.
+     */
+    function _withdrawFromActiveStrategies(uint256 amount) internal {
+        address from = previousStrategy;
+        if (from != ZERO_ADDRESS) {
+            uint256 balanceBefore = IERC20(underlying).balanceOf(address(this));
+            IStrategy(from).withdrawToFund(
+                Math.min(IStrategy(from).investedUnderlyingBalance(), amount)
+            );
+            uint256 withdrawn =
+                IERC20(underlying).balanceOf(address(this)).sub(balanceBefore);
+            amount = amount > withdrawn ? amount.sub(withdrawn) : 0;
+        }
+        if (activeStrategy != ZERO_ADDRESS && amount > 0) {
+            IStrategy(activeStrategy).withdrawToFund(amount);
+        }
+    }
+
+    /**
+     * @dev Withdraws amount to this contract, from the strategies in order.
+     */
+    function _withdrawFromStrategies(uint256 amount) internal {
+        uint256 balanceBefore = IERC20(underlying).balanceOf(address(this));
+        for (uint256 i = 0; i < strategies.length; i++) {
+            uint256 withdrawn =
+                IERC20(underlying).balanceOf(address(this)).sub(balanceBefore);
+            if (withdrawn >= amount) {
+                return;
+            }
+            uint256 position =
+                IStrategy(strategies[i]).investedUnderlyingBalance();
+            if (position > 0) {
+                IStrategy(strategies[i]).withdrawToFund(
+                    Math.min(position, amount.sub(withdrawn))
+                );
+            }
+        }
+    }
+
+    function _withdrawAllFromStrategy(address strategy) internal {
+        if (IStrategy(strategy).investedUnderlyingBalance() > 0) {
+            IStrategy(strategy).withdrawAllToFund();
+        }
     }
 
     /**
@@ -301,9 +632,16 @@ contract OptimizerStrategyBase is IStrategy {
                     strategies[i] = strategies[strategies.length - 1];
                 }
                 strategies.pop();
+                delete targetAllocations[strategy];
+                delete aprSnapshots[strategy];
+                if (strategy == previousStrategy) {
+                    previousStrategy = ZERO_ADDRESS;
+                }
                 if (strategy == activeStrategy) {
                     activeStrategy = ZERO_ADDRESS;
-                    _selectActiveStrategy();
+                    if (!multiAllocation) {
+                        _selectActiveStrategy();
+                    }
                 }
                 _investAllUnderlying();
                 emit StrategyRemovedOptimizer(strategy);
@@ -341,6 +679,37 @@ contract OptimizerStrategyBase is IStrategy {
         return _strategies;
     }
 
+    struct CachedStrategy {
+        address strategy;
+        uint256 investedUnderlyingBalance;
+        uint256 apr;
+        uint256 blockNumber;
+    }
+
+    /**
+     * @notice Returns the strategies of the optimiser with their last snapshot, without calling them.
+     * @dev blockNumber is 0 for a strategy not snapshotted yet.
+     * @return Array of CachedStrategy struct
+     */
+    function getStrategiesCached()
+        external
+        view
+        returns (CachedStrategy[] memory)
+    {
+        CachedStrategy[] memory _strategies =
+            new CachedStrategy[](strategies.length);
+        for (uint256 i = 0; i < strategies.length; i++) {
+            AprSnapshot memory snapshot = aprSnapshots[strategies[i]];
+            _strategies[i] = CachedStrategy({
+                strategy: strategies[i],
+                investedUnderlyingBalance: snapshot.investedUnderlyingBalance,
+                apr: snapshot.apr,
+                blockNumber: snapshot.blockNumber
+            });
+        }
+        return _strategies;
+    }
+
     /**
      * @notice No tokens apart from underlying asset should ever be stored on this contract.
      * Any tokens that are sent here by mistake are recoverable by owner.
@@ -371,9 +740,20 @@ contract OptimizerStrategyBase is IStrategy {
     {
         uint256 underlyingBalanceinActiveStrategy;
 
-        if (activeStrategy != ZERO_ADDRESS) {
-            underlyingBalanceinActiveStrategy = IStrategy(activeStrategy)
-                .investedUnderlyingBalance();
+        if (multiAllocation) {
+            for (uint256 i = 0; i < strategies.length; i++) {
+                underlyingBalanceinActiveStrategy = underlyingBalanceinActiveStrategy
+                    .add(IStrategy(strategies[i]).investedUnderlyingBalance());
+            }
+        } else {
+            if (activeStrategy != ZERO_ADDRESS) {
+                underlyingBalanceinActiveStrategy = IStrategy(activeStrategy)
+                    .investedUnderlyingBalance();
+            }
+            if (previousStrategy != ZERO_ADDRESS) {
+                underlyingBalanceinActiveStrategy = underlyingBalanceinActiveStrategy
+                    .add(IStrategy(previousStrategy).investedUnderlyingBalance());
+            }
         }
 
         return
@@ -0,0 +1,394 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/math/SafeMath.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/IERC20.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC20.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/ERC20.sol";
+import "../../interfaces/IFund.sol";
+import "../../interfaces/IGovernable.sol";
+import "../../interfaces/IStrategy.sol";
+import "../../interfaces/IRewardLiquidator.sol";
+import "../utils/SwapTokensLibrary.sol";
+import "../utils/PriceFeedLibrary.sol";
+
+/**
+ * @title Reward liquidator of a fund
+ * @author Mesh Finance
+ * @notice The strategies of a fund push their reward tokens here instead of each swapping its own.
+ * The rewards pushed during a cycle are swapped to underlying in a single swap per reward token,
+ * and the proceeds are paid back to the strategies pro rata to the rewards they pushed.
+ * The route of each reward token is the best quoted one across the candidate routers and intermediate tokens,
+ * cached and evaluated again once routeRefreshInterval has passed.
+ */
+contract RewardLiquidator is IRewardLiquidator {
+    using SafeERC20 for IERC20;
+    using SafeMath for uint256;
+
+    event RewardsDeposited(
+        address indexed strategy,
+        address indexed rewardToken,
+        uint256 amount
+    );
+    event RewardsLiquidated(
+        address indexed rewardToken,
+        uint256 rewardAmount,
+        uint256 underlyingAmount
+    );
+    event RouteSelected(
+        address indexed rewardToken,
+        address dEXRouter,
+        address intermediate,
+        uint256 quotedAmountOut
+    );
+
+    // How a reward token is priced and swapped to underlying
+    struct RewardTokenConfig {
+        address priceFeed;
+        address dEXRouter;
+        address baseCurrency; // serves as path between the reward token and underlying
+        uint8 rewardTokenDecimals;
+        uint8 priceFeedDecimals;
+    }
+
+    // Route of a reward token to underlying, the intermediate is zero for a direct swap
+    struct Route {
+        address dEXRouter;
+        address intermediate;
+        uint64 evaluatedAt;
+    }
+
+    uint256 internal constant MAX_BPS = 10000;
+
+    address public immutable fund;
+    address public immutable override underlying;
+    uint8 internal immutable underlyingDecimals;
+
+    uint256 internal allowedSlippage; // In BPS, can be changed
+
+    uint64 public routeRefreshInterval; // In seconds
+    uint64 public routeGasBudget; // gas which can be spent quoting routes
+    uint64 public maxPriceAge; // In seconds, older prices are not used
+
+    // routers and intermediate tokens tried for every reward token, besides those of its config
+    address[] public candidateRouters;
+    address[] public candidateIntermediates;
+
+    mapping(address => Route) public routes;
+
+    // strategies allowed to push rewards
+    mapping(address => bool) public isStrategy;
+
+    mapping(address => RewardTokenConfig) public rewardTokenConfigs;
+
+    // rewards pushed since the last liquidation of each reward token
+    mapping(address => address[]) internal depositors;
+    mapping(address => mapping(address => uint256)) public pendingRewards;
+    mapping(address => uint256) public totalPendingRewards;
+
+    constructor(address _fund) public {
+        require(_fund != address(0), "Fund cannot be empty");
+        fund = _fund;
+        address _underlying = IFund(_fund).underlying();
+        underlying = _underlying;
+        underlyingDecimals = ERC20(_underlying).decimals();
+        allowedSlippage = 500;
+        maxPriceAge = 1 days;
+        routeRefreshInterval = 1 days;
+        routeGasBudget = 500000;
+    }
+
+    modifier onlyFundManagerOrGovernance() {
+        require(
+            msg.sender == IFund(fund).fundManager() ||
+                msg.sender == IGovernable(fund).governance(),
+            "The sender has to be the governance or fund manager"
+        );
+        _;
+    }
+
+    modifier onlyFundManagerOrRelayer() {
+        require(
+            msg.sender == IFund(fund).fundManager() ||
+                msg.sender == IFund(fund).relayer(),
+            "The sender has to be the relayer or fund manager"
+        );
+        _;
+    }
+
+    function setStrategy(address strategy, bool allowed)
+        external
+        onlyFundManagerOrGovernance
+    {
+        if (allowed) {
+            require(
+                IStrategy(strategy).underlying() == underlying,
+                "Underlying do not match"
+            );
+        }
+        isStrategy[strategy] = allowed;
+    }
+
+    function setRewardTokenConfig(
+        address rewardToken,
+        address priceFeed,
+        address dEXRouter,
+        address baseCurrency
+    ) external onlyFundManagerOrGovernance {
+        require(priceFeed != address(0), "Price feed cannot be empty");
+        require(dEXRouter != address(0), "DEX router cannot be empty");
+        rewardTokenConfigs[rewardToken] = RewardTokenConfig({
+            priceFeed: priceFeed,
+            dEXRouter: dEXRouter,
+            baseCurrency: baseCurrency,
+            rewardTokenDecimals: ERC20(rewardToken).decimals(),
+            priceFeedDecimals: PriceFeedLibrary._getDecimals(priceFeed)
+        });
+        delete routes[rewardToken];
+    }
+
+    function setCandidateRouters(address[] calldata _candidateRouters)
+        external
+        onlyFundManagerOrGovernance
+    {
+        candidateRouters = _candidateRouters;
+    }
+
+    function setCandidateIntermediates(
+        address[] calldata _candidateIntermediates
+    ) external onlyFundManagerOrGovernance {
+        candidateIntermediates = _candidateIntermediates;
+    }
+
+    /**
+     * Candidates and routing parameters apply to a reward token when its route is evaluated again.
+     */
+    function setRouteParameters(
+        uint64 _routeRefreshInterval,
+        uint64 _routeGasBudget
+    ) external onlyFundManagerOrGovernance {
+        routeRefreshInterval = _routeRefreshInterval;
+        routeGasBudget = _routeGasBudget;
+    }
+
+    /**
+     * Forgets the cached route of a reward token, it is evaluated again at the next liquidation.
+     */
+    function resetRoute(address rewardToken)
+        external
+        onlyFundManagerOrGovernance
+    {
+        delete routes[rewardToken];
+    }
+
+    function updateSlippage(uint256 newSlippage)
+        external
+        onlyFundManagerOrGovernance
+    {
+        require(newSlippage > 0, "The slippage should be greater than 0");
+        require(
+            newSlippage < MAX_BPS,
+            "The slippage should be less than 10000"
+        );
+        allowedSlippage = newSlippage;
+    }
+
+    function setMaxPriceAge(uint64 _maxPriceAge)
+        external
+        onlyFundManagerOrGovernance
+    {
+        require(_maxPriceAge > 0, "The max price age should be greater than 0");
+        maxPriceAge = _maxPriceAge;
+    }
+
+    /**
+     * Takes the rewards of the calling strategy, to be liquidated with the rewards of the other strategies.
+     */
+    function depositRewards(address rewardToken, uint256 amount)
+        external
+        override
+    {
+        require(isStrategy[msg.sender], "Not a strategy of the fund");
+        require(
+            rewardTokenConfigs[rewardToken].dEXRouter != address(0),
+            "Reward token not supported"
+        );
+        if (amount == 0) {
+            return;
+        }
+        IERC20(rewardToken).safeTransferFrom(msg.sender, address(this), amount);
+        if (pendingRewards[rewardToken][msg.sender] == 0) {
+            depositors[rewardToken].push(msg.sender);
+        }
+        pendingRewards[rewardToken][msg.sender] = pendingRewards[rewardToken][
+            msg.sender
+        ]
+            .add(amount);
+        totalPendingRewards[rewardToken] = totalPendingRewards[rewardToken]
+            .add(amount);
+
+        emit RewardsDeposited(msg.sender, rewardToken, amount);
+    }
+
+    /**
+     * Swaps the pending rewards of each token to underlying, and pays the strategies back.
+     * Usually called by the relayer after the hard work of the fund.
+     */
+    function liquidate(address[] calldata rewardTokens)
+        external
+        onlyFundManagerOrRelayer
+    {
+        for (uint256 i = 0; i < rewardTokens.length; i++) {
+            _liquidate(rewardTokens[i]);
+        }
+    }
+
+    function _liquidate(address rewardToken) internal {
+        uint256 rewardAmount = totalPendingRewards[rewardToken];
+        if (rewardAmount == 0) {
+            return;
+        }
+        RewardTokenConfig memory config = rewardTokenConfigs[rewardToken];
+        (address dEXRouter, address intermediate) =
+            _route(rewardToken, config, rewardAmount);
+        uint256 underlyingBalanceBefore =
+            IERC20(underlying).balanceOf(address(this));
+        SwapTokensLibrary._liquidateRewards(
+            rewardToken,
+            underlying,
+            dEXRouter,
+            intermediate,
+            _getMinUnderlyingExpected(config, rewardAmount)
+        );
+        uint256 proceeds =
+            IERC20(underlying).balanceOf(address(this)).sub(
+                underlyingBalanceBefore
+            );
+        if (proceeds == 0) {
+            // nothing could be swapped, the rewards wait for the next cycle
+            return;
+        }
+        _payBack(rewardToken, rewardAmount, proceeds);
+
+        emit RewardsLiquidated(rewardToken, rewardAmount, proceeds);
+    }
+
+    /**
+     * Returns the cached route of the reward token, or selects and caches the best one
+     * if it was not evaluated in the last routeRefreshInterval.
+     * The route of the config is used if no route can be quoted.
+     */
+    function _route(
+        address rewardToken,
+        RewardTokenConfig memory config,
+        uint256 rewardAmount
+    ) internal returns (address, address) {
+        {
+            Route memory route = routes[rewardToken];
+            if (
+                route.dEXRouter != address(0) &&
+                // solhint-disable-next-line not-rely-on-time
+                block.timestamp <
+                uint256(route.evaluatedAt).add(routeRefreshInterval)
+            ) {
+                return (route.dEXRouter, route.intermediate);
+            }
+        }
+
+        (
+            address bestRouter,
+            address bestIntermediate,
+            uint256 quotedAmountOut
+        ) =
+            SwapTokensLibrary._bestRoute(
+                rewardToken,
+                underlying,
+                rewardAmount,
+                _withFirst(config.dEXRouter, candidateRouters, false),
+                _withFirst(
+                    config.baseCurrency,
+                    candidateIntermediates,
+                    true
+                ),
+                routeGasBudget
+            );
+        if (quotedAmountOut == 0) {
+            return (config.dEXRouter, config.baseCurrency);
+        }
+        routes[rewardToken] = Route({
+            dEXRouter: bestRouter,
+            intermediate: bestIntermediate,
+            // solhint-disable-next-line not-rely-on-time
+            evaluatedAt: uint64(block.timestamp)
+        });
+        emit RouteSelected(
+            rewardToken,
+            bestRouter,
+            bestIntermediate,
+            quotedAmountOut
+        );
+        return (bestRouter, bestIntermediate);
+    }
+
+    /**
+     * Returns the candidates with first in front, so that it is quoted even if the gas budget runs out.
+     * For intermediates, the direct path (zero address) comes next.
+     */
+    function _withFirst(
+        address first,
+        address[] storage candidates,
+        bool withDirect
+    ) internal view returns (address[] memory) {
+        uint256 offset = withDirect ? 2 : 1;
+        address[] memory list = new address[](candidates.length + offset);
+        list[0] = first;
+        // with the direct path, list[1] is left zero
+        for (uint256 i = 0; i < candidates.length; i++) {
+            list[i + offset] = candidates[i];
+        }
+        return list;
+    }
+
+    /**
+     * Pays the proceeds to the depositors pro rata to their rewards, and starts a new cycle.
+     * The last depositor gets the rounding dust.
+     */
+    function _payBack(
+        address rewardToken,
+        uint256 rewardAmount,
+        uint256 proceeds
+    ) internal {
+        address[] memory list = depositors[rewardToken];
+        uint256 remaining = proceeds;
+        for (uint256 i = 0; i < list.length; i++) {
+            uint256 share =
+                i == list.length - 1
+                    ? remaining
+                    : proceeds.mul(pendingRewards[rewardToken][list[i]]).div(
+                        rewardAmount
+                    );
+            remaining = remaining.sub(share);
+            delete pendingRewards[rewardToken][list[i]];
+            IERC20(underlying).safeTransfer(list[i], share);
+        }
+        delete depositors[rewardToken];
+        totalPendingRewards[rewardToken] = 0;
+    }
+
+    /**
+     * Uses the price feed to get the minimum underlying expected for the rewards, less the allowed slippage.
+     */
+    function _getMinUnderlyingExpected(
+        RewardTokenConfig memory config,
+        uint256 rewardAmount
+    ) internal view returns (uint256) {
+        return
+            PriceFeedLibrary._valueInUnderlying(
+                rewardAmount.sub(rewardAmount.mul(allowedSlippage).div(MAX_BPS)),
+                uint256(PriceFeedLibrary._getPrice(config.priceFeed, maxPriceAge)),
+                config.rewardTokenDecimals,
+                config.priceFeedDecimals,
+                underlyingDecimals
+            );
+    }
+}
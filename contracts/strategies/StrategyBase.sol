@@ -0,0 +1,180 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/IERC20.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC20.sol";
+import "../../interfaces/IFund.sol";
+import "../../interfaces/IStrategy.sol";
+import "../../interfaces/IStrategyRoles.sol";
+import "../../interfaces/IGovernable.sol";
+import "../../interfaces/IRewardLiquidator.sol";
+
+/**
+ * @title Base of the strategies
+ * @author Mesh Finance
+ * @notice Holds the fund of a strategy, and the access control based on the roles of the fund.
+ * The governance, fund manager and relayer of the fund are cached in the strategy,
+ * so that an access check is a storage read instead of calls into the fund (or, under an optimizer,
+ * into the optimizer and then the fund). The cache is refreshed by syncRoles, which anyone can call,
+ * and which the fund calls on its strategies when a role changes.
+ * The protocols a strategy deposits into are given a standing allowance, granted once and topped up when it runs low.
+ * When a reward liquidator is set, rewards are pushed to it and swapped together with those of the other strategies.
+ */
+abstract contract StrategyBase is IStrategy, IStrategyRoles {
+    using SafeERC20 for IERC20;
+
+    event RolesSynced(
+        address governance,
+        address fundManager,
+        address relayer
+    );
+    event ApprovalRevoked(address indexed token, address indexed spender);
+
+    address internal cachedGovernance;
+    address internal cachedFundManager;
+    address internal cachedRelayer;
+
+    // shared liquidator of the rewards, if any
+    address public rewardLiquidator;
+
+    // fund and investActivated are packed in a single slot, which the small
+    // parameters of a strategy declared first can also share
+    address public override fund;
+    bool public investActivated;
+
+    /**
+     * Sets the fund, once, and caches its roles.
+     */
+    function _initializeFund(address _fund) internal {
+        require(fund == address(0), "Strategy already initialized");
+        require(_fund != address(0), "Fund cannot be empty");
+        fund = _fund;
+        syncRoles();
+    }
+
+    /**
+     * Reads the roles from the fund again.
+     */
+    function syncRoles() public virtual override {
+        address _fund = fund;
+        address governance_ = IGovernable(_fund).governance();
+        address fundManager_ = IFund(_fund).fundManager();
+        address relayer_ = IFund(_fund).relayer();
+        cachedGovernance = governance_;
+        cachedFundManager = fundManager_;
+        cachedRelayer = relayer_;
+        emit RolesSynced(governance_, fundManager_, relayer_);
+    }
+
+    function _governance() internal view returns (address) {
+        return cachedGovernance;
+    }
+
+    function governance() external view returns (address) {
+        return cachedGovernance;
+    }
+
+    function _fundManager() internal view returns (address) {
+        return cachedFundManager;
+    }
+
+    function fundManager() external view returns (address) {
+        return cachedFundManager;
+    }
+
+    function _relayer() internal view returns (address) {
+        return cachedRelayer;
+    }
+
+    function relayer() external view returns (address) {
+        return cachedRelayer;
+    }
+
+    /**
+     * Makes sure that spender can take amount of token. The allowance is set to the max
+     * when it is below amount, so most invests don't approve at all.
+     */
+    function _ensureAllowance(
+        address token,
+        address spender,
+        uint256 amount
+    ) internal {
+        uint256 allowance = IERC20(token).allowance(address(this), spender);
+        if (allowance >= amount) {
+            return;
+        }
+        if (allowance > 0) {
+            IERC20(token).safeApprove(spender, 0);
+        }
+        IERC20(token).safeApprove(spender, uint256(-1));
+    }
+
+    function _revokeAllowance(address token, address spender) internal {
+        IERC20(token).safeApprove(spender, 0);
+        emit ApprovalRevoked(token, spender);
+    }
+
+    /**
+     * Allows governance to revoke the standing allowance given to a protocol.
+     * Investing is left as it is: the next invest grants the allowance of the deposit protocol again,
+     * so that one should be revoked together with setInvestActivated(false).
+     */
+    function revokeApproval(address token, address spender) external {
+        require(_governance() == msg.sender, "Not governance");
+        _revokeAllowance(token, spender);
+    }
+
+    function setRewardLiquidator(address _rewardLiquidator) external {
+        require(_governance() == msg.sender, "Not governance");
+        rewardLiquidator = _rewardLiquidator;
+    }
+
+    /**
+     * Pushes the whole balance of rewardToken to the reward liquidator.
+     * Returns false if there is no liquidator, the strategy then swaps its rewards itself.
+     */
+    function _pushRewards(address rewardToken) internal returns (bool) {
+        address _rewardLiquidator = rewardLiquidator;
+        if (_rewardLiquidator == address(0)) {
+            return false;
+        }
+        uint256 rewardAmount = IERC20(rewardToken).balanceOf(address(this));
+        if (rewardAmount > 0) {
+            _ensureAllowance(rewardToken, _rewardLiquidator, rewardAmount);
+            IRewardLiquidator(_rewardLiquidator).depositRewards(
+                rewardToken,
+                rewardAmount
+            );
+        }
+        return true;
+    }
+
+    modifier onlyFund() {
+        require(msg.sender == fund, "The sender has to be the fund");
+        _;
+    }
+
+    modifier onlyFundOrGovernance() {
+        require(
+            msg.sender == fund || msg.sender == _governance(),
+            "The sender has to be the governance or fund"
+        );
+        _;
+    }
+
+    modifier onlyFundManagerOrGovernance() {
+        require(
+            msg.sender == _fundManager() || msg.sender == _governance(),
+            "The sender has to be the governance or fund manager"
+        );
+        _;
+    }
+
+    modifier onlyFundManagerOrRelayer() {
+        require(
+            msg.sender == _fundManager() || msg.sender == _relayer(),
+            "The sender has to be the relayer or fund manager"
+        );
+        _;
+    }
+}
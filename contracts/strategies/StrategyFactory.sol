@@ -0,0 +1,68 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/proxy/Clones.sol";
+import "../../interfaces/IStrategyInitializer.sol";
+
+/**
+ * Deploys strategies as minimal proxies (EIP-1167) of deployed strategies (masters),
+ * instead of deploying the full bytecode of a strategy for every fund.
+ * Any deployed strategy of a family can be used as the master. The clones share its code, and so its
+ * immutable configuration and underlying: a clone can only be created for a fund of the same underlying.
+ */
+contract StrategyFactory {
+    event NewStrategy(
+        address indexed master,
+        address indexed fund,
+        address strategy
+    );
+
+    /**
+     * Deploys a strategy like master for the fund (or optimizer). The caller is the creator of the strategy.
+     */
+    function createStrategy(address _master, address _fund)
+        public
+        returns (address)
+    {
+        require(_master != address(0), "master cannot be empty");
+        address strategy = Clones.clone(_master);
+        IStrategyInitializer(strategy).initialize(_fund, msg.sender);
+        emit NewStrategy(_master, _fund, strategy);
+        return strategy;
+    }
+
+    /**
+     * Deploys a strategy like each of the masters for the fund.
+     */
+    function createStrategies(address[] calldata _masters, address _fund)
+        external
+        returns (address[] memory)
+    {
+        return _createStrategies(_masters, _fund);
+    }
+
+    /**
+     * Deploys the whole strategy set of a new fund: an optimizer for the fund,
+     * and a strategy like each of the masters under this optimizer.
+     * The strategies still have to be added to the optimizer by the fund manager.
+     */
+    function createOptimizerWithStrategies(
+        address _optimizerMaster,
+        address[] calldata _masters,
+        address _fund
+    ) external returns (address optimizer, address[] memory strategies) {
+        optimizer = createStrategy(_optimizerMaster, _fund);
+        strategies = _createStrategies(_masters, optimizer);
+    }
+
+    function _createStrategies(address[] calldata _masters, address _fund)
+        internal
+        returns (address[] memory)
+    {
+        address[] memory strategies = new address[](_masters.length);
+        for (uint256 i; i < _masters.length; i++) {
+            strategies[i] = createStrategy(_masters[i], _fund);
+        }
+        return strategies;
+    }
+}
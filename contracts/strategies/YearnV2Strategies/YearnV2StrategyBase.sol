@@ -8,20 +8,21 @@ import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/utils/Address.sol";
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/token/ERC20/SafeERC20.sol";
 import "../../../interfaces/strategies/YearnV2Strategies/IYVaultV2.sol";
 import "../../../interfaces/IFund.sol";
-import "../../../interfaces/IStrategy.sol";
-import "../../../interfaces/IGovernable.sol";
+import "../../../interfaces/IStrategyInitializer.sol";
+import "../StrategyBase.sol";
 
 /**
  * This strategy takes an asset (DAI, USDC), deposits into yv2 vault. Currently building only for DAI.
  */
-abstract contract YearnV2StrategyBase is IStrategy {
+abstract contract YearnV2StrategyBase is StrategyBase, IStrategyInitializer {
     using SafeERC20 for IERC20;
     using Address for address;
     using SafeMath for uint256;
 
+    // The vault and its token stay immutable. A clone deployed by StrategyFactory reads
+    // them from the code of its master, so it has to be for a fund of the same underlying.
     address public immutable override underlying;
-    address public immutable override fund;
-    address public immutable override creator;
+    address public override creator;
 
     // the y-vault corresponding to the underlying asset
     address public immutable yVault;
@@ -29,67 +30,42 @@ abstract contract YearnV2StrategyBase is IStrategy {
     // these tokens cannot be claimed by the governance
     mapping(address => bool) public canNotSweep;
 
-    bool public investActivated;
-
     constructor(address _fund, address _yVault) public {
-        require(_fund != address(0), "Fund cannot be empty");
         require(_yVault != address(0), "Yearn Vault cannot be empty");
-        fund = _fund;
-        address _underlying = IFund(_fund).underlying();
-        require(
-            _underlying == IYVaultV2(_yVault).token(),
-            "Underlying do not match"
-        );
+        address _underlying = IYVaultV2(_yVault).token();
         underlying = _underlying;
         yVault = _yVault;
+        _initializeStrategy(_fund, _underlying, _yVault);
         creator = msg.sender;
-
-        // restricted tokens, can not be swept
-        canNotSweep[_underlying] = true;
-        canNotSweep[_yVault] = true;
-
-        investActivated = true;
-    }
-
-    function _governance() internal view returns (address) {
-        return IGovernable(fund).governance();
-    }
-
-    function _fundManager() internal view returns (address) {
-        return IFund(fund).fundManager();
     }
 
-    function _relayer() internal view returns (address) {
-        return IFund(fund).relayer();
-    }
-
-    modifier onlyFund() {
-        require(msg.sender == fund, "The sender has to be the fund");
-        _;
+    /**
+     * Initializes a clone of this strategy deployed by StrategyFactory.
+     */
+    function initialize(address _fund, address _creator) external override {
+        _initializeStrategy(_fund, underlying, yVault);
+        creator = _creator;
     }
 
-    modifier onlyFundOrGovernance() {
+    /**
+     * Sets the fund, once. Called by the constructor (which cannot read the immutables yet), or by initialize for a clone.
+     */
+    function _initializeStrategy(
+        address _fund,
+        address _underlying,
+        address _yVault
+    ) internal {
+        _initializeFund(_fund);
         require(
-            msg.sender == fund || msg.sender == _governance(),
-            "The sender has to be the governance or fund"
+            _underlying == IFund(_fund).underlying(),
+            "Underlying do not match"
         );
-        _;
-    }
 
-    modifier onlyFundManagerOrGovernance() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _governance(),
-            "The sender has to be the governance or fund manager"
-        );
-        _;
-    }
+        // restricted tokens, can not be swept
+        canNotSweep[_underlying] = true;
+        canNotSweep[_yVault] = true;
 
-    modifier onlyFundManagerOrRelayer() {
-        require(
-            msg.sender == _fundManager() || msg.sender == _relayer(),
-            "The sender has to be the relayer or fund manager"
-        );
-        _;
+        investActivated = true;
     }
 
     /**
@@ -113,8 +89,8 @@ abstract contract YearnV2StrategyBase is IStrategy {
     /**
      * Withdraws an underlying asset from the strategy to the fund in the specified amount.
      * It tries to withdraw from the strategy contract if this has enough balance.
-     * Otherwise, we withdraw shares from the yv2 vault. Transfer the required underlying amount to fund,
-     * and reinvest the rest. We can make it better by calculating the correct amount and withdrawing only that much.
+     * Otherwise, we withdraw the shares worth the missing amount from the yv2 vault (rounded up), and transfer
+     * the required underlying amount to fund. Any surplus of the rounding stays idle until the next hard work.
      */
     function withdrawToFund(uint256 underlyingAmount)
         external
@@ -141,15 +117,13 @@ abstract contract YearnV2StrategyBase is IStrategy {
         }
         IYVaultV2(yVault).withdraw(shares);
 
-        // we can transfer the asset to the fund
+        // shares are rounded up, the few wei over the amount stay idle until the next hard work
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            if (underlyingAmount < underlyingBalance) {
-                IERC20(underlying).safeTransfer(fund, underlyingAmount);
-                _investAllUnderlying();
-            } else {
-                IERC20(underlying).safeTransfer(fund, underlyingBalance);
-            }
+            IERC20(underlying).safeTransfer(
+                fund,
+                Math.min(underlyingAmount, underlyingBalance)
+            );
         }
     }
 
@@ -180,9 +154,7 @@ abstract contract YearnV2StrategyBase is IStrategy {
 
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         if (underlyingBalance > 0) {
-            // approve amount per transaction
-            IERC20(underlying).safeApprove(yVault, 0);
-            IERC20(underlying).safeApprove(yVault, underlyingBalance);
+            _ensureAllowance(underlying, yVault, underlyingBalance);
             // deposits the entire balance to yv2 vault
             IYVaultV2(yVault).deposit(underlyingBalance);
         }
@@ -235,9 +207,8 @@ abstract contract YearnV2StrategyBase is IStrategy {
         returns (uint256)
     {
         uint256 precision = 10**(IYVaultV2(yVault).decimals());
-        return
-            underlyingAmount.mul(precision).div(
-                IYVaultV2(yVault).pricePerShare()
-            );
+        uint256 price = IYVaultV2(yVault).pricePerShare();
+        // rounded up, so that the shares withdrawn are never worth less than underlyingAmount
+        return underlyingAmount.mul(precision).add(price).sub(1).div(price);
     }
 }
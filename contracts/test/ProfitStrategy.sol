@@ -31,6 +31,8 @@ contract ProfitStrategy is IStrategy, IStrategyUnderOptimizer {
 
     uint256 internal accountedBalance;
     uint256 internal profitPerc;
+    bool public failing; // to test failing integrations
+    bool public failingBalance; // to test a protocol whose balance can not be read
 
     // These tokens cannot be claimed by the controller
     mapping(address => bool) public unsalvagableTokens;
@@ -70,6 +72,7 @@ contract ProfitStrategy is IStrategy, IStrategyUnderOptimizer {
         override
         returns (uint256)
     {
+        require(!failingBalance, "Balance is failing");
         // for real strategies, need to calculate the invested balance
         return IERC20(underlying).balanceOf(address(this));
     }
@@ -104,6 +107,7 @@ contract ProfitStrategy is IStrategy, IStrategyUnderOptimizer {
      * Cashes some amount out and withdraws to the fund
      */
     function withdrawToFund(uint256 amount) external override onlyFund {
+        require(!failing, "Strategy is failing");
         uint256 underlyingBalance = IERC20(underlying).balanceOf(address(this));
         uint256 amountTowithdraw = Math.min(underlyingBalance, amount);
         IERC20(underlying).safeTransfer(fund, amountTowithdraw);
@@ -113,11 +117,19 @@ contract ProfitStrategy is IStrategy, IStrategyUnderOptimizer {
     /*
      * Honest harvesting. It's not much, but it pays off
      */
-    // solhint-disable-next-line no-empty-blocks
     function doHardWork() external override onlyFundOrGovernance {
+        require(!failing, "Strategy is failing");
         // investAllUnderlying();   // call this externally for testing as profit geeneration should be after invesment
     }
 
+    function setFailing(bool _failing) external {
+        failing = _failing;
+    }
+
+    function setFailingBalance(bool _failingBalance) external {
+        failingBalance = _failingBalance;
+    }
+
     // solhint-disable-next-line no-unused-vars
     function aprAfterDeposit(uint256 depositAmount)
         external
@@ -63,8 +63,14 @@ contract Governable is Initializable, SetGetAssembly {
         address oldGovernance = _governance();
         _setGovernance(msg.sender);
         emit GovernanceUpdated(msg.sender, oldGovernance);
+        _afterGovernanceUpdate();
     }
 
+    /**
+     * Called when the new governance is accepted, for the contracts that keep track of it.
+     */
+    function _afterGovernanceUpdate() internal virtual {}
+
     function _governance() internal view returns (address str) {
         return getAddress(_GOVERNANCE_SLOT);
     }
@@ -2,10 +2,12 @@
 pragma solidity 0.6.12;
 
 import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/utils/Address.sol";
+import "OpenZeppelin/openzeppelin-contracts@3.4.0/contracts/math/SafeMath.sol";
 import "../../../interfaces/chainlink/AggregatorV3Interface.sol";
 
 library PriceFeedLibrary {
     using Address for address;
+    using SafeMath for uint256;
 
     function _getDecimals(address priceFeed) internal view returns (uint8) {
         return AggregatorV3Interface(priceFeed).decimals();
@@ -23,5 +25,49 @@ library PriceFeedLibrary {
         require(answeredInRound >= roundID, "Stale data from price feed");
         return price;
     }
+
+    /**
+     * Same as _getPrice, and the price must have been updated in the last maxAge seconds.
+     */
+    function _getPrice(address priceFeed, uint256 maxAge)
+        internal
+        view
+        returns (int256)
+    {
+        (
+            uint80 roundID,
+            int256 price,
+            uint256 startedAt,
+            uint256 timeStamp,
+            uint80 answeredInRound
+        ) = AggregatorV3Interface(priceFeed).latestRoundData();
+        require(answeredInRound >= roundID, "Stale data from price feed");
+        require(
+            // solhint-disable-next-line not-rely-on-time
+            timeStamp.add(maxAge) >= block.timestamp,
+            "Price feed not updated recently"
+        );
+        return price;
+    }
+
     /* solhint-enable no-unused-vars */
+
+    /**
+     * Value in underlying of an amount of token, from the price of the token in underlying given by a price feed.
+     * The decimals are passed in, so that they can be read once and stored by the caller.
+     */
+    function _valueInUnderlying(
+        uint256 amount,
+        uint256 price,
+        uint8 tokenDecimals,
+        uint8 priceFeedDecimals,
+        uint8 underlyingDecimals
+    ) internal pure returns (uint256) {
+        return
+            price
+                .mul(amount)
+                .mul(10**uint256(underlyingDecimals))
+                .div(10**uint256(priceFeedDecimals))
+                .div(10**uint256(tokenDecimals));
+    }
 }
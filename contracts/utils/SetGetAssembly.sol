@@ -34,6 +34,28 @@ contract SetGetAssembly {
         return (getUint256(slot) == 1);
     }
 
+    /*
+     * Sets a value of `size` bits at `offset` bits in the slot, keeping the other bits.
+     */
+    function setPacked(
+        bytes32 slot,
+        uint256 offset,
+        uint256 size,
+        uint256 _value
+    ) internal {
+        require((_value >> size) == 0, "Packed value too large");
+        uint256 mask = ((1 << size) - 1) << offset;
+        setUint256(slot, (getUint256(slot) & ~mask) | (_value << offset));
+    }
+
+    function getPacked(
+        bytes32 slot,
+        uint256 offset,
+        uint256 size
+    ) internal view returns (uint256) {
+        return (getUint256(slot) >> offset) & ((1 << size) - 1);
+    }
+
     function getAddress(bytes32 slot) internal view returns (address str) {
         // solhint-disable-next-line no-inline-assembly
         assembly {
@@ -16,7 +16,11 @@ library SwapTokensLibrary {
         address _baseCurrency
     ) internal pure returns (address[] memory) {
         address[] memory path;
-        if (_from == _baseCurrency || _to == _baseCurrency) {
+        if (
+            _from == _baseCurrency ||
+            _to == _baseCurrency ||
+            _baseCurrency == address(0)
+        ) {
             path = new address[](2);
             path[0] = _from;
             path[1] = _to;
@@ -29,6 +33,68 @@ library SwapTokensLibrary {
         return path;
     }
 
+    /**
+     * Returns the amount out of a swap on a router, or 0 if the router can not quote it (e.g. no pair).
+     */
+    function _quote(
+        address _dEXRouter,
+        address[] memory path,
+        uint256 amountIn
+    ) internal view returns (uint256) {
+        if (!_dEXRouter.isContract()) {
+            return 0;
+        }
+        try
+            IUniswapV2Router02(_dEXRouter).getAmountsOut(amountIn, path)
+        returns (uint256[] memory amounts) {
+            return amounts[amounts.length - 1];
+        } catch {
+            return 0;
+        }
+    }
+
+    /**
+     * Quotes the swap on each router (Uniswap V2 forks), directly and through each intermediate token,
+     * and returns the route with the most out. A zero intermediate is the direct path.
+     * Quoting stops once gasBudget is spent, the best route found by then is returned.
+     */
+    function _bestRoute(
+        address _from,
+        address _to,
+        uint256 amountIn,
+        address[] memory _dEXRouters,
+        address[] memory _intermediates,
+        uint256 gasBudget
+    )
+        internal
+        view
+        returns (
+            address bestRouter,
+            address bestIntermediate,
+            uint256 bestAmountOut
+        )
+    {
+        uint256 gasStart = gasleft();
+        for (uint256 i = 0; i < _dEXRouters.length; i++) {
+            for (uint256 j = 0; j < _intermediates.length; j++) {
+                if (gasStart.sub(gasleft()) > gasBudget) {
+                    return (bestRouter, bestIntermediate, bestAmountOut);
+                }
+                uint256 amountOut =
+                    _quote(
+                        _dEXRouters[i],
+                        _getPath(_from, _to, _intermediates[j]),
+                        amountIn
+                    );
+                if (amountOut > bestAmountOut) {
+                    bestRouter = _dEXRouters[i];
+                    bestIntermediate = _intermediates[j];
+                    bestAmountOut = amountOut;
+                }
+            }
+        }
+    }
+
     function _liquidateRewards(
         address rewardToken,
         address underlying,
@@ -0,0 +1,8 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+interface IRewardLiquidator {
+    function underlying() external view returns (address);
+
+    function depositRewards(address rewardToken, uint256 amount) external;
+}
@@ -0,0 +1,6 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.6.12;
+
+interface IStrategyInitializer {
+    function initialize(address _fund, address _creator) external;
+}
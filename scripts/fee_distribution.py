@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Builds the merkle tree of the fees accrued to a fee distributor in a period.
+
+Streams the StrategyRewards and PlatformRewards events of the fund from the block after
+the previous period, sums the fee shares of each strategy creator and of platform,
+and writes the root with the proof of each claim. The tree is built on disk by merkle_tree,
+so that proofs are read one node per level instead of keeping the tree in memory. The root is then published with
+MerkleDistributor.publishRoot by governance.
+
+    brownie run fee_distribution main <fund> <platform_rewards> [to_block] --network mainnet
+"""
+
+import json
+import os
+
+from brownie import Fund, interface, web3
+
+from scripts.merkle_tree import MerkleTreeFile, build
+
+STATE_FILE = "fee_distribution_{}.json"
+BLOCKS_PER_QUERY = 5000
+
+
+def stream_fee_events(fund, from_block, to_block):
+    """Yields (event name, args) of the fee events, a block range at a time."""
+    contract = web3.eth.contract(address=fund, abi=Fund.abi)
+    for start in range(from_block, to_block + 1, BLOCKS_PER_QUERY):
+        end = min(start + BLOCKS_PER_QUERY - 1, to_block)
+        logs = []
+        for event in (contract.events.StrategyRewards, contract.events.PlatformRewards):
+            logs.extend(event.getLogs(fromBlock=start, toBlock=end))
+        logs.sort(key=lambda log: (log.blockNumber, log.logIndex))
+        for log in logs:
+            yield log.event, log.args
+
+
+def accrued_fees(fund, platform_rewards, from_block, to_block):
+    """Sums the fee shares accrued to each beneficiary in the block range."""
+    balances = {}
+    creators = {}
+    for name, args in stream_fee_events(fund, from_block, to_block):
+        if name == "StrategyRewards":
+            strategy = args["strategy"]
+            if strategy not in creators:
+                creators[strategy] = interface.IStrategy(strategy).creator()
+            account, amount = creators[strategy], args["strategyCreatorFee"]
+        else:
+            account, amount = platform_rewards, args["platformFee"]
+        if amount > 0:
+            balances[account] = balances.get(account, 0) + amount
+    return balances
+
+
+def write_distribution(balances, tree_path, output_file):
+    """Builds the tree of the balances, sorted by account, and writes the claims one at a time.
+    Returns the root."""
+    accounts = sorted(balances)
+    root = build(((account, balances[account]) for account in accounts), tree_path)
+    with MerkleTreeFile(tree_path) as tree, open(output_file, "w") as f:
+        f.write('{{\n  "merkleRoot": "0x{}",\n  "total": {},\n  "claims": {{'.format(
+            root.hex(), sum(balances.values())
+        ))
+        for i, account in enumerate(accounts):
+            claim = {
+                "index": i,
+                "amount": balances[account],
+                "proof": ["0x" + node.hex() for node in tree.proof(i)],
+            }
+            f.write("{}\n    {}: {}".format("," if i else "", json.dumps(account), json.dumps(claim)))
+        f.write("\n  }\n}\n")
+    return root
+
+
+def main(fund, platform_rewards, to_block=None):
+    state_file = STATE_FILE.format(fund)
+    state = {"lastBlock": -1, "period": 0}
+    if os.path.exists(state_file):
+        with open(state_file) as f:
+            state = json.load(f)
+
+    to_block = int(to_block) if to_block is not None else web3.eth.block_number
+    balances = accrued_fees(fund, platform_rewards, state["lastBlock"] + 1, to_block)
+    if not balances:
+        print("No fees accrued since block", state["lastBlock"])
+        return
+
+    output_file = "fee_distribution_{}_{}.json".format(fund, state["period"])
+    tree_file = "fee_distribution_{}_{}.tree".format(fund, state["period"])
+    root = write_distribution(balances, tree_file, output_file)
+
+    with open(state_file, "w") as f:
+        json.dump({"lastBlock": to_block, "period": state["period"] + 1}, f)
+
+    print("Period", state["period"], "root", "0x" + root.hex(), "written to", output_file)
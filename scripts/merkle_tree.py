@@ -0,0 +1,184 @@
+#!/usr/bin/python3
+"""
+Builds the merkle tree of a MerkleDistributor claim list with bounded memory.
+
+Claims are streamed from a CSV (account,amount) or JSONL ({"account": ..., "amount": ...}) file,
+in the order of their index. Leaves are hashed in batches and written to the tree file,
+then each level is hashed from the previous one through a memory-mapped view of the file.
+Proofs are read from the tree file, one node per level.
+
+Leaves and pairs are hashed as in MerkleDistributor (OpenZeppelin MerkleProof):
+leaf = keccak256(abi.encodePacked(index, account, amount)), pairs are sorted before hashing,
+and an odd node at the end of a level is moved up as is.
+
+    python scripts/merkle_tree.py build claims.csv tree.bin
+    python scripts/merkle_tree.py proof tree.bin 42
+
+Tree file: 8 bytes magic, 8 bytes number of leaves, then every level from the leaves to the root,
+32 bytes per node.
+"""
+
+import csv
+import json
+import mmap
+import struct
+import sys
+
+from eth_utils import keccak
+
+MAGIC = b"MESHMRKL"
+HEADER = struct.Struct(">8sQ")
+NODE_SIZE = 32
+BATCH_SIZE = 65536  # nodes hashed and written at a time
+
+
+def read_claims(path):
+    """Yields (account, amount) of each claim, without loading the whole file."""
+    with open(path, newline="") as f:
+        if path.endswith(".jsonl"):
+            for line in f:
+                if line.strip():
+                    claim = json.loads(line)
+                    yield claim["account"], int(claim["amount"])
+        else:
+            for row in csv.reader(f):
+                if row and row[0] != "account":  # skip the header
+                    yield row[0], int(row[1])
+
+
+def leaf_hash(index, account, amount):
+    return keccak(
+        index.to_bytes(32, "big") + bytes.fromhex(account[2:]) + amount.to_bytes(32, "big")
+    )
+
+
+def hash_pair(a, b):
+    return keccak(a + b if a <= b else b + a)
+
+
+def level_sizes(leaves):
+    sizes = [leaves]
+    while sizes[-1] > 1:
+        sizes.append((sizes[-1] + 1) // 2)
+    return sizes
+
+
+def _hash_level(nodes, size, out):
+    """Hashes the level of given size in nodes (a buffer) into its parents, written to out."""
+    for start in range(0, size, 2 * BATCH_SIZE):
+        end = min(start + 2 * BATCH_SIZE, size)
+        parents = []
+        for i in range(start, end - 1, 2):
+            offset = i * NODE_SIZE
+            parents.append(
+                hash_pair(
+                    bytes(nodes[offset : offset + NODE_SIZE]),
+                    bytes(nodes[offset + NODE_SIZE : offset + 2 * NODE_SIZE]),
+                )
+            )
+        if (end - start) % 2 == 1:
+            parents.append(bytes(nodes[(end - 1) * NODE_SIZE : end * NODE_SIZE]))
+        out.write(b"".join(parents))
+
+
+def build(claims, tree_path):
+    """Writes the tree of the claims to tree_path and returns the root."""
+    with open(tree_path, "w+b") as f:
+        f.write(HEADER.pack(MAGIC, 0))
+        leaves = 0
+        batch = []
+        for account, amount in claims:
+            batch.append(leaf_hash(leaves, account, amount))
+            leaves += 1
+            if len(batch) == BATCH_SIZE:
+                f.write(b"".join(batch))
+                batch = []
+        f.write(b"".join(batch))
+        if leaves == 0:
+            raise ValueError("No claims")
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, leaves))
+        f.seek(0, 2)
+
+        offset = HEADER.size
+        sizes = level_sizes(leaves)
+        for size in sizes[:-1]:
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                with memoryview(m) as view:
+                    _hash_level(view[offset : offset + size * NODE_SIZE], size, f)
+            offset += size * NODE_SIZE
+        f.flush()
+    with MerkleTreeFile(tree_path) as tree:
+        return tree.root
+
+
+class MerkleTreeFile:
+    """Read only view of a tree file written by build."""
+
+    def __init__(self, tree_path):
+        self._file = open(tree_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, leaves = HEADER.unpack(self._map[: HEADER.size])
+        if magic != MAGIC:
+            raise ValueError("Not a merkle tree file")
+        self.leaves = leaves
+        self._sizes = level_sizes(leaves)
+        self._offsets = []
+        offset = HEADER.size
+        for size in self._sizes:
+            self._offsets.append(offset)
+            offset += size * NODE_SIZE
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def node(self, level, index):
+        offset = self._offsets[level] + index * NODE_SIZE
+        return self._map[offset : offset + NODE_SIZE]
+
+    @property
+    def root(self):
+        return self.node(len(self._sizes) - 1, 0)
+
+    def proof(self, index):
+        """Returns the proof of the leaf at index, reading one node per level."""
+        if index >= self.leaves:
+            raise IndexError("Leaf index out of range")
+        path = []
+        for level, size in enumerate(self._sizes[:-1]):
+            sibling = index ^ 1
+            if sibling < size:
+                path.append(self.node(level, sibling))
+            index //= 2
+        return path
+
+
+def verify(proof, root, leaf):
+    node = leaf
+    for sibling in proof:
+        node = hash_pair(node, sibling)
+    return node == root
+
+
+def main(args):
+    if len(args) == 3 and args[0] == "build":
+        root = build(read_claims(args[1]), args[2])
+        print("0x" + root.hex())
+    elif len(args) == 3 and args[0] == "proof":
+        with MerkleTreeFile(args[1]) as tree:
+            print(json.dumps(["0x" + node.hex() for node in tree.proof(int(args[2]))]))
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -244,3 +244,27 @@ def test_claim_reward_token(fund_through_proxy_usdc_after_hardwork, aavev2strat,
     reward_token_balance_after = interface.ERC20(reward_token_address).balanceOf(aavev2strat)
     assert reward_token_balance_before == 0
     assert reward_token_balance_after != 0
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_withdraw_to_fund_leaves_surplus_idle(fund_through_proxy_usdc_after_hardwork, aavev2strat, usdc, test_usdc_account, accounts):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+    fund_account = accounts.at(required_fund.address, force=True)
+    amount = 100 * (10 ** usdc.decimals())
+
+    ## the idle underlying covers the amount, the rest of it stays in the strategy
+    usdc.transfer(aavev2strat, 2 * amount, {'from': test_usdc_account})
+    fund_balance_before = usdc.balanceOf(required_fund)
+    aavev2strat.withdrawToFund(amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == amount
+    assert usdc.balanceOf(aavev2strat) == amount
+
+    ## withdrawn from Aave, only the amount asked goes to the fund
+    invested_before = aavev2strat.investedUnderlyingBalance()
+    fund_balance_before = usdc.balanceOf(required_fund)
+    aavev2strat.withdrawToFund(3 * amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == 3 * amount
+    ## aTokens are redeemed 1:1, nothing is left over
+    assert usdc.balanceOf(aavev2strat) == 0
+    assert float(invested_before - aavev2strat.investedUnderlyingBalance()) == pytest.approx(3 * amount, rel=1e-4)
@@ -256,3 +256,59 @@ def test_liquidate_without_claim_reward_tokens(fund_through_proxy_usdc_after_har
     underlying_balance_after = compound_strat.investedUnderlyingBalance()
 
     assert underlying_balance_after > underlying_balance_before
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_hard_work_skips_harvest_below_threshold(fund_through_proxy_usdc_after_hardwork, compound_strat, accounts, chain):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+    harvested_at = compound_strat.lastHarvest()
+
+    with brownie.reverts("The sender has to be the governance or fund manager"):
+        compound_strat.setHarvestPolicy(10 ** 12, 0, {'from': accounts[5]})
+    compound_strat.setHarvestPolicy(10 ** 12, 86400, {'from': accounts[1]})
+
+    chain.sleep(3600)
+    required_fund.doHardWork({'from': accounts[1]})
+    assert compound_strat.lastHarvest() == harvested_at
+
+    chain.sleep(86400)
+    tx = required_fund.doHardWork({'from': accounts[1]})
+    assert compound_strat.lastHarvest() == tx.timestamp
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_stale_reward_price(fund_through_proxy_usdc_after_hardwork, compound_strat, accounts, chain):
+    with brownie.reverts("The sender has to be the governance or fund manager"):
+        compound_strat.setMaxPriceAge(3600, {'from': accounts[5]})
+    with brownie.reverts("The max price age should be greater than 0"):
+        compound_strat.setMaxPriceAge(0, {'from': accounts[1]})
+
+    compound_strat.setMaxPriceAge(1, {'from': accounts[1]})
+    chain.sleep(10)
+
+    with brownie.reverts("Price feed not updated recently"):
+        compound_strat.claimLiquidateAndReinvestRewards({'from': accounts[1]})
+    with brownie.reverts("Price feed not updated recently"):
+        compound_strat.apr()
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_withdraw_to_fund_leaves_surplus_idle(fund_through_proxy_usdc_after_hardwork, compound_strat, usdc, test_usdc_account, accounts):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+    fund_account = accounts.at(required_fund.address, force=True)
+    amount = 100 * (10 ** usdc.decimals())
+
+    ## the idle underlying covers the amount, the rest of it stays in the strategy
+    usdc.transfer(compound_strat, 2 * amount, {'from': test_usdc_account})
+    fund_balance_before = usdc.balanceOf(required_fund)
+    compound_strat.withdrawToFund(amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == amount
+    assert usdc.balanceOf(compound_strat) == amount
+
+    ## withdrawn from Compound, only the amount asked goes to the fund
+    invested_before = compound_strat.investedUnderlyingBalance()
+    fund_balance_before = usdc.balanceOf(required_fund)
+    compound_strat.withdrawToFund(3 * amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == 3 * amount
+    ## redeemUnderlying gives the exact amount, nothing is left over
+    assert usdc.balanceOf(compound_strat) == 0
+    assert float(invested_before - compound_strat.investedUnderlyingBalance()) == pytest.approx(3 * amount, rel=1e-4)
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+strategy_weightage = 8000
+
+@pytest.fixture
+def curvestrat(CurveSingleAssetLendingStrategyMainnet3Pool, fund_through_proxy_usdc, usdc, accounts):
+    return CurveSingleAssetLendingStrategyMainnet3Pool.deploy(fund_through_proxy_usdc, {'from': accounts[0]})
+
+@pytest.fixture
+def fund_through_proxy_usdc_after_hardwork(fund_through_proxy_usdc, curvestrat, usdc, test_usdc_account, accounts):
+    fund_through_proxy_usdc.addStrategy(curvestrat, strategy_weightage, 0, {'from': accounts[0]})
+
+    amount_to_deposit = 1000 * (10 ** usdc.decimals())
+    usdc.approve(fund_through_proxy_usdc, amount_to_deposit, {'from': test_usdc_account})
+    fund_through_proxy_usdc.deposit(amount_to_deposit, {'from': test_usdc_account})
+    fund_through_proxy_usdc.doHardWork({'from': accounts[0]})
+
+    return fund_through_proxy_usdc
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_harvest_policy_needs_reward_token(fund_through_proxy_usdc_after_hardwork, curvestrat, usdc, accounts):
+    assert curvestrat.rewardToken() == brownie.ZERO_ADDRESS
+
+    with brownie.reverts("No reward token to harvest"):
+        curvestrat.setHarvestPolicy(10 ** 12, 86400, {'from': accounts[1]})
+
+    ## nothing to harvest, the rewards call only invests
+    strategy_balance_before = curvestrat.investedUnderlyingBalance()
+    curvestrat.claimLiquidateAndReinvestRewards({'from': accounts[1]})
+
+    assert curvestrat.lastHarvest() == 0
+    assert float(curvestrat.investedUnderlyingBalance()) == pytest.approx(strategy_balance_before)
+    assert float(strategy_balance_before) == pytest.approx(1000 * (10 ** usdc.decimals()) * strategy_weightage / 10000, rel=1e-3)
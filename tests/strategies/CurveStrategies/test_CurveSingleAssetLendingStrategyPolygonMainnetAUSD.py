@@ -154,3 +154,53 @@ def test_remove_strategy(fund_through_proxy_usdc_after_hardwork, curvestrat, int
     assert tx.events["StrategyRemoved"].values() == [curvestrat]
     assert float(total_value_locked_before) == pytest.approx(total_value_locked_after)
     assert strategy_balance_after == 0
+
+
+@pytest.mark.require_network("matic-fork")
+def test_hard_work_harvest_policy(fund_through_proxy_usdc_after_hardwork, curvestrat, interface, accounts, chain):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+
+    ## without a policy the hard work does not harvest
+    assert curvestrat.lastHarvest() == 0
+
+    with brownie.reverts("The sender has to be the governance or fund manager"):
+        curvestrat.setHarvestPolicy(10 ** 12, 0, {'from': accounts[5]})
+    curvestrat.setHarvestPolicy(10 ** 12, 86400, {'from': accounts[1]})
+
+    chain.sleep(3600)
+    required_fund.doHardWork({'from': accounts[1]})
+    assert curvestrat.lastHarvest() == 0
+
+    chain.sleep(86400)
+    tx = required_fund.doHardWork({'from': accounts[1]})
+    assert curvestrat.lastHarvest() == tx.timestamp
+    ## the claimed MATIC is swapped to underlying and invested
+    assert interface.IERC20(curvestrat.rewardToken()).balanceOf(curvestrat) == 0
+
+
+@pytest.mark.require_network("matic-fork")
+def test_exact_withdraw(fund_through_proxy_usdc_after_hardwork, curvestrat, usdc, accounts):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+    fund_account = accounts.at(required_fund.address, force=True)
+
+    assert curvestrat.exactWithdrawIterations() == 5
+    with brownie.reverts("The sender has to be the governance or fund manager"):
+        curvestrat.setExactWithdrawIterations(32, {'from': accounts[5]})
+    with brownie.reverts("Too many iterations"):
+        curvestrat.setExactWithdrawIterations(65, {'from': accounts[0]})
+
+    amount_to_withdraw = 500 * (10 ** usdc.decimals())
+    fund_balance_before = usdc.balanceOf(required_fund)
+
+    curvestrat.withdrawToFund(amount_to_withdraw, {'from': fund_account})
+
+    ## the fund gets exactly the amount, the pool tokens burnt over it give at most about 6 BPS more
+    assert usdc.balanceOf(required_fund) - fund_balance_before == amount_to_withdraw
+    leftover = usdc.balanceOf(curvestrat)
+    assert leftover <= amount_to_withdraw * 8 // 10000
+
+    ## more iterations stop at the tolerance of the search, with a leftover of about 1 BPS at most
+    curvestrat.setExactWithdrawIterations(32, {'from': accounts[0]})
+    curvestrat.withdrawToFund(leftover + amount_to_withdraw // 5, {'from': fund_account})
+
+    assert usdc.balanceOf(curvestrat) <= amount_to_withdraw // 5 * 2 // 10000 + 1
@@ -209,3 +209,27 @@ def test_sweep_with_uni_tokens(fund_through_proxy_usdc_after_hardwork, dydxstrat
 #     reward_token_balance = interface.ERC20(reward_token_address).balanceOf(dydxstrat)
 #     with brownie.reverts("The sender has to be the governance or fund"):
 #         dydxstrat.liquidateRewardsAndReinvest(reward_token_balance, {'from':accounts[7]})
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_withdraw_to_fund_leaves_surplus_idle(fund_through_proxy_usdc_after_hardwork, dydxstrat, usdc, test_usdc_account, accounts):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+    fund_account = accounts.at(required_fund.address, force=True)
+    amount = 100 * (10 ** usdc.decimals())
+
+    ## the idle underlying covers the amount, the rest of it stays in the strategy
+    usdc.transfer(dydxstrat, 2 * amount, {'from': test_usdc_account})
+    fund_balance_before = usdc.balanceOf(required_fund)
+    dydxstrat.withdrawToFund(amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == amount
+    assert usdc.balanceOf(dydxstrat) == amount
+
+    ## withdrawn from DyDx, only the amount asked goes to the fund
+    invested_before = dydxstrat.investedUnderlyingBalance()
+    fund_balance_before = usdc.balanceOf(required_fund)
+    dydxstrat.withdrawToFund(3 * amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == 3 * amount
+    ## at most a few wei of rounding stay idle
+    assert usdc.balanceOf(dydxstrat) <= 10
+    assert float(invested_before - dydxstrat.investedUnderlyingBalance()) == pytest.approx(3 * amount, rel=1e-4)
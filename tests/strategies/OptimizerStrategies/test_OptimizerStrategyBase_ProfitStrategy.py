@@ -92,7 +92,7 @@ def test_hard_work_single_strategy(fund_through_proxy_with_strategy_and_deposit,
     assert tx.events["StrategyRewards"].values()[0] == optimizer_strat
     assert tx.events["StrategyRewards"].values()[1] == expected_profit
     assert float(tx.events["StrategyRewards"].values()[2]) == pytest.approx(expected_strategy_creator_fee)
-    assert float(required_fund.balanceOf(accounts[0])) == pytest.approx(expected_strategy_creator_fee)
+    assert float(required_fund.claimableFeeShares(accounts[0])) == pytest.approx(expected_strategy_creator_fee)
 
 @pytest.fixture
 def fund_through_proxy_with_strategy_and_deposit_after_hardwork(fund_through_proxy_with_strategy_and_deposit, profitstrat_10_optimizer, accounts):
@@ -144,7 +144,7 @@ def test_hard_work_2_strategies_updated_active_strategy(fund_through_proxy_with_
     assert tx.events["StrategyRewards"].values()[0] == optimizer_strat
     assert tx.events["StrategyRewards"].values()[1] == expected_profit
     assert float(tx.events["StrategyRewards"].values()[2]) == pytest.approx(expected_strategy_creator_fee)
-    assert float(required_fund.balanceOf(accounts[0])) == pytest.approx(expected_strategy_creator_fee)
+    assert float(required_fund.claimableFeeShares(accounts[0])) == pytest.approx(expected_strategy_creator_fee)
 
 @pytest.fixture
 def fund_through_proxy_with_2_strategies_and_hardworks(fund_through_proxy_with_2_strategies_deposit_and_hardwork, accounts):
@@ -238,3 +238,120 @@ def test_remove_strategy_from_fund(fund_through_proxy_with_2_strategies_and_hard
     assert tx.events["StrategyRemoved"].values() == [optimizer_strat]
     assert float(total_value_locked_before) == pytest.approx(total_value_locked_after)
     assert strategy_balance_after == 0
+
+def test_roles_synced_on_fund_manager_change(OptimizerStrategyBase, optimizer_strat, fund_through_proxy, accounts):
+    inner_optimizer = OptimizerStrategyBase.deploy(optimizer_strat, {'from': accounts[0]})
+    optimizer_strat.addStrategy(inner_optimizer, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(optimizer_strat, strategy_weightage, 500, {'from': accounts[1]})
+    assert inner_optimizer.fundManager() == accounts[1]
+
+    fund_through_proxy.setFundManager(accounts[4], {'from': accounts[0]})
+
+    assert optimizer_strat.fundManager() == accounts[4]
+    assert inner_optimizer.fundManager() == accounts[4]
+    assert inner_optimizer.governance() == accounts[0]
+    with brownie.reverts("The sender has to be the governance or fund manager"):
+        inner_optimizer.setInvestActivated(False, {'from': accounts[1]})
+
+def test_sync_roles_by_anyone(optimizer_strat, fund_through_proxy, accounts):
+    ## not in the fund, so the change of relayer is not pushed to the strategy
+    fund_through_proxy.setRelayer(accounts[5], {'from': accounts[1]})
+    assert optimizer_strat.relayer() == accounts[3]
+
+    tx = optimizer_strat.syncRoles({'from': accounts[6]})
+
+    assert optimizer_strat.relayer() == accounts[5]
+    assert tx.events["RolesSynced"].values() == [accounts[0], accounts[1], accounts[5]]
+
+def test_revoke_approval(optimizer_strat, token, accounts):
+    with brownie.reverts("Not governance"):
+        optimizer_strat.revokeApproval(token, accounts[5], {'from': accounts[1]})
+
+    tx = optimizer_strat.revokeApproval(token, accounts[5], {'from': accounts[0]})
+
+    assert tx.events["ApprovalRevoked"].values() == [token, accounts[5]]
+    assert token.allowance(optimizer_strat, accounts[5]) == 0
+    ## revoking the allowance of another spender does not stop investing
+    assert optimizer_strat.investActivated()
+
+def test_multi_allocation(fund_through_proxy_with_2_strategies_deposit_and_hardwork, optimizer_strat, profitstrat_10_optimizer, profitstrat_50_optimizer, accounts):
+
+    required_fund = fund_through_proxy_with_2_strategies_deposit_and_hardwork
+
+    with brownie.reverts("The sender has to be the governance or fund manager"):
+        optimizer_strat.setMultiAllocation(True, {'from': accounts[3]})
+    with brownie.reverts("Steps cannot be zero"):
+        optimizer_strat.setAllocationParameters(0, 0, {'from': accounts[1]})
+
+    tx = optimizer_strat.setMultiAllocation(True, {'from': accounts[1]})
+    assert tx.events["MultiAllocationUpdated"].values() == [True]
+    assert optimizer_strat.maxAllocationSteps() == 10
+
+    tx = required_fund.doHardWork({'from': accounts[1]})
+
+    ## constant APRs, so every chunk goes to the strategy with the higher APR
+    assert profitstrat_10_optimizer.investedUnderlyingBalance() == 0
+    assert optimizer_strat.targetAllocations(profitstrat_10_optimizer) == 0
+    assert optimizer_strat.targetAllocations(profitstrat_50_optimizer) == profitstrat_50_optimizer.investedUnderlyingBalance()
+    assert optimizer_strat.investedUnderlyingBalance() == profitstrat_50_optimizer.investedUnderlyingBalance()
+    assert optimizer_strat.activeStrategy() == profitstrat_50_optimizer
+    assert len(tx.events["StrategyAllocated"]) == 2
+
+    tx = optimizer_strat.setMultiAllocation(False, {'from': accounts[1]})
+    assert tx.events["MultiAllocationUpdated"].values() == [False]
+    assert optimizer_strat.targetAllocations(profitstrat_50_optimizer) == 0
+    assert optimizer_strat.investedUnderlyingBalance() == profitstrat_50_optimizer.investedUnderlyingBalance()
+
+def test_switching_hysteresis_and_migration_cap(fund_through_proxy_with_2_strategies_deposit_and_hardwork, optimizer_strat, profitstrat_10_optimizer, profitstrat_50_optimizer, token, zero_account, accounts):
+
+    required_fund = fund_through_proxy_with_2_strategies_deposit_and_hardwork
+    position = profitstrat_10_optimizer.investedUnderlyingBalance()
+
+    ## APR advantage of 400000 is below the threshold
+    optimizer_strat.setSwitchingParameters(400001, 0, 0, {'from': accounts[1]})
+    required_fund.doHardWork({'from': accounts[1]})
+    assert optimizer_strat.activeStrategy() == profitstrat_10_optimizer
+
+    optimizer_strat.setSwitchingParameters(0, 0, position // 4, {'from': accounts[1]})
+    tx = required_fund.doHardWork({'from': accounts[1]})
+
+    assert optimizer_strat.activeStrategy() == profitstrat_50_optimizer
+    assert optimizer_strat.previousStrategy() == profitstrat_10_optimizer
+    assert profitstrat_10_optimizer.investedUnderlyingBalance() > 0
+    assert tx.events["MigrationProgressed"].values() == [profitstrat_10_optimizer, profitstrat_10_optimizer.investedUnderlyingBalance()]
+    assert optimizer_strat.investedUnderlyingBalance() == profitstrat_10_optimizer.investedUnderlyingBalance() + profitstrat_50_optimizer.investedUnderlyingBalance() + token.balanceOf(optimizer_strat)
+
+    for _ in range(5):
+        required_fund.doHardWork({'from': accounts[1]})
+    assert optimizer_strat.previousStrategy() == zero_account
+    assert profitstrat_10_optimizer.investedUnderlyingBalance() == 0
+
+def test_min_holding_period(fund_through_proxy_with_2_strategies_deposit_and_hardwork, optimizer_strat, profitstrat_10_optimizer, profitstrat_50_optimizer, accounts):
+
+    required_fund = fund_through_proxy_with_2_strategies_deposit_and_hardwork
+    optimizer_strat.setSwitchingParameters(0, 86400, 0, {'from': accounts[1]})
+
+    required_fund.doHardWork({'from': accounts[1]})
+    assert optimizer_strat.activeStrategy() == profitstrat_10_optimizer
+
+    brownie.chain.sleep(86400)
+    required_fund.doHardWork({'from': accounts[1]})
+    assert optimizer_strat.activeStrategy() == profitstrat_50_optimizer
+    assert profitstrat_10_optimizer.investedUnderlyingBalance() == 0
+
+def test_get_strategies_cached(fund_through_proxy_with_2_strategies_deposit_and_hardwork, optimizer_strat, profitstrat_10_optimizer, profitstrat_50_optimizer, accounts):
+
+    ## added after the last hard work
+    assert optimizer_strat.getStrategiesCached()[1] == [profitstrat_50_optimizer, 0, 0, 0]
+
+    tx = fund_through_proxy_with_2_strategies_deposit_and_hardwork.doHardWork({'from': accounts[1]})
+
+    assert optimizer_strat.getStrategiesCached() == [
+        [profitstrat_10_optimizer, profitstrat_10_optimizer.investedUnderlyingBalance(), 100000, tx.block_number],
+        [profitstrat_50_optimizer, profitstrat_50_optimizer.investedUnderlyingBalance(), 500000, tx.block_number],
+    ]
+
+    profitstrat_50_optimizer.investAllUnderlying({'from': accounts[0]})
+    tx = optimizer_strat.refreshAprSnapshots({'from': accounts[6]})
+
+    assert optimizer_strat.aprSnapshots(profitstrat_50_optimizer) == [500000, tx.block_number, profitstrat_50_optimizer.investedUnderlyingBalance()]
@@ -129,3 +129,27 @@ def test_remove_strategy(fund_through_proxy_usdc_after_hardwork, yearnv2strat, i
     assert tx.events["StrategyRemoved"].values() == [yearnv2strat]
     assert float(total_value_locked_before) == pytest.approx(total_value_locked_after)
     assert strategy_balance_after == 0
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_withdraw_to_fund_leaves_surplus_idle(fund_through_proxy_usdc_after_hardwork, yearnv2strat, usdc, test_usdc_account, accounts):
+    required_fund = fund_through_proxy_usdc_after_hardwork
+    fund_account = accounts.at(required_fund.address, force=True)
+    amount = 100 * (10 ** usdc.decimals())
+
+    ## the idle underlying covers the amount, the rest of it stays in the strategy
+    usdc.transfer(yearnv2strat, 2 * amount, {'from': test_usdc_account})
+    fund_balance_before = usdc.balanceOf(required_fund)
+    yearnv2strat.withdrawToFund(amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == amount
+    assert usdc.balanceOf(yearnv2strat) == amount
+
+    ## withdrawn from the vault, only the amount asked goes to the fund
+    invested_before = yearnv2strat.investedUnderlyingBalance()
+    fund_balance_before = usdc.balanceOf(required_fund)
+    yearnv2strat.withdrawToFund(3 * amount, {'from': fund_account})
+
+    assert usdc.balanceOf(required_fund) - fund_balance_before == 3 * amount
+    ## the shares are rounded up, only their few wei of surplus stay idle
+    assert usdc.balanceOf(yearnv2strat) <= 10
+    assert float(invested_before - yearnv2strat.investedUnderlyingBalance()) == pytest.approx(3 * amount, rel=1e-4)
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+comp_address = "0xc00e94Cb662C3520282E6f5717214004A7f26888"
+comp_price_feed = "0xdbd020CAeF83eFd542f4De03e3cF0C28A4428bd5"
+uniswap_router = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+weth = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+comp_holder = "0xD3F03984a90fd15E909B2E9467E98cADeA181da3"
+
+@pytest.fixture
+def reward_liquidator(RewardLiquidator, fund_through_proxy_usdc, accounts):
+    liquidator = RewardLiquidator.deploy(fund_through_proxy_usdc, {'from': accounts[0]})
+    liquidator.setRewardTokenConfig(comp_address, comp_price_feed, uniswap_router, weth, {'from': accounts[1]})
+    return liquidator
+
+@pytest.fixture
+def compound_strats(CompoundLendingStrategyMainnetUSDC, fund_through_proxy_usdc, reward_liquidator, accounts):
+    strats = [CompoundLendingStrategyMainnetUSDC.deploy(fund_through_proxy_usdc, {'from': accounts[0]}) for _ in range(2)]
+    for strat in strats:
+        reward_liquidator.setStrategy(strat, True, {'from': accounts[1]})
+        strat.setRewardLiquidator(reward_liquidator, {'from': accounts[0]})
+    return strats
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_deposit_rewards_by_random_address(reward_liquidator, accounts):
+    with brownie.reverts("Not a strategy of the fund"):
+        reward_liquidator.depositRewards(comp_address, 100, {'from': accounts[5]})
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_liquidate_by_random_address(reward_liquidator, accounts):
+    with brownie.reverts("The sender has to be the relayer or fund manager"):
+        reward_liquidator.liquidate([comp_address], {'from': accounts[5]})
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_rewards_liquidated_together(reward_liquidator, compound_strats, usdc, interface, accounts):
+    comp = interface.ERC20(comp_address)
+    for strat, amount in zip(compound_strats, [100, 300]):
+        comp.transfer(strat, amount * 10 ** comp.decimals(), {'from': comp_holder})
+        strat.claimLiquidateAndReinvestRewards({'from': accounts[1]})
+        assert comp.balanceOf(strat) == 0
+
+    total = reward_liquidator.totalPendingRewards(comp_address)
+    assert total >= 400 * 10 ** comp.decimals()
+
+    tx = reward_liquidator.liquidate([comp_address], {'from': accounts[3]})
+
+    proceeds = tx.events["RewardsLiquidated"]["underlyingAmount"]
+    assert proceeds > 0
+    assert reward_liquidator.totalPendingRewards(comp_address) == 0
+    assert usdc.balanceOf(reward_liquidator) == 0
+    ## the strategies invest the proceeds at their next hard work
+    balances = [strat.investedUnderlyingBalance() for strat in compound_strats]
+    assert sum(balances) == proceeds
+    assert balances[1] > 2 * balances[0]
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_liquidate_with_stale_price(reward_liquidator, compound_strats, interface, accounts, chain):
+    with brownie.reverts("The max price age should be greater than 0"):
+        reward_liquidator.setMaxPriceAge(0, {'from': accounts[1]})
+
+    comp = interface.ERC20(comp_address)
+    comp.transfer(compound_strats[0], 100 * 10 ** comp.decimals(), {'from': comp_holder})
+    compound_strats[0].claimLiquidateAndReinvestRewards({'from': accounts[1]})
+
+    reward_liquidator.setMaxPriceAge(1, {'from': accounts[1]})
+    chain.sleep(10)
+    with brownie.reverts("Price feed not updated recently"):
+        reward_liquidator.liquidate([comp_address], {'from': accounts[3]})
+
+@pytest.mark.require_network("mainnet-fork", "hardhat-fork")
+def test_best_route_cached(reward_liquidator, compound_strats, interface, accounts, chain):
+    sushiswap_router = "0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"
+    dai = "0x6B175474E89094C44Da98b954EedeAC495271d0F"
+    reward_liquidator.setCandidateRouters([sushiswap_router], {'from': accounts[1]})
+    reward_liquidator.setCandidateIntermediates([dai], {'from': accounts[1]})
+
+    comp = interface.ERC20(comp_address)
+    comp.transfer(compound_strats[0], 100 * 10 ** comp.decimals(), {'from': comp_holder})
+    compound_strats[0].claimLiquidateAndReinvestRewards({'from': accounts[1]})
+    tx = reward_liquidator.liquidate([comp_address], {'from': accounts[1]})
+
+    selected = tx.events["RouteSelected"]
+    assert selected["dEXRouter"] in [uniswap_router, sushiswap_router]
+    assert reward_liquidator.routes(comp_address)[0] == selected["dEXRouter"]
+
+    ## the cached route is used until it is evaluated again
+    comp.transfer(compound_strats[0], 100 * 10 ** comp.decimals(), {'from': comp_holder})
+    compound_strats[0].claimLiquidateAndReinvestRewards({'from': accounts[1]})
+    tx = reward_liquidator.liquidate([comp_address], {'from': accounts[1]})
+    assert "RouteSelected" not in tx.events
+    assert "RewardsLiquidated" in tx.events
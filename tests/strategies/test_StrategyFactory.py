@@ -0,0 +1,51 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+from brownie import OptimizerStrategyBase
+
+@pytest.fixture
+def strategy_factory(StrategyFactory, accounts):
+    return StrategyFactory.deploy({'from': accounts[0]})
+
+@pytest.fixture
+def optimizer_master(fund_through_proxy, accounts):
+    return OptimizerStrategyBase.deploy(fund_through_proxy, {'from': accounts[0]})
+
+@pytest.fixture
+def new_fund(fund_factory, fund, token, accounts):
+    tx = fund_factory.createFund(fund, token, "Mudrex Generic Fund 2", "MDXGF2", {'from': accounts[0]})
+    return brownie.Fund.at(tx.new_contracts[0])
+
+@pytest.fixture
+def other_underlying_fund(fund_factory, fund, token_2, accounts):
+    tx = fund_factory.createFund(fund, token_2, "Mudrex Generic Fund 3", "MDXGF3", {'from': accounts[0]})
+    return brownie.Fund.at(tx.new_contracts[0])
+
+def test_master_can_not_be_initialized_again(optimizer_master, new_fund, accounts):
+    with brownie.reverts("Strategy already initialized"):
+        optimizer_master.initialize(new_fund, accounts[5], {'from': accounts[5]})
+
+def test_create_strategy(strategy_factory, optimizer_master, new_fund, token, accounts):
+    tx = strategy_factory.createStrategy(optimizer_master, new_fund, {'from': accounts[4]})
+    strategy = OptimizerStrategyBase.at(tx.return_value)
+
+    assert tx.events["NewStrategy"].values() == [optimizer_master, new_fund, strategy]
+    assert strategy.fund() == new_fund
+    assert strategy.underlying() == token
+    assert strategy.deployer() == accounts[4]
+    assert strategy.investActivated()
+    assert optimizer_master.deployer() == accounts[0]
+
+    with brownie.reverts("Strategy already initialized"):
+        strategy.initialize(new_fund, accounts[5], {'from': accounts[5]})
+
+def test_create_strategy_other_underlying(strategy_factory, optimizer_master, other_underlying_fund, accounts):
+    with brownie.reverts("Underlying do not match"):
+        strategy_factory.createStrategy(optimizer_master, other_underlying_fund, {'from': accounts[4]})
+
+def test_create_optimizer_with_strategies(strategy_factory, optimizer_master, new_fund, accounts):
+    tx = strategy_factory.createOptimizerWithStrategies(optimizer_master, [optimizer_master], new_fund, {'from': accounts[4]})
+    optimizer, strategies = tx.return_value
+
+    assert OptimizerStrategyBase.at(optimizer).fund() == new_fund
+    assert OptimizerStrategyBase.at(strategies[0]).fund() == optimizer
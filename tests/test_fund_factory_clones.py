@@ -0,0 +1,64 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+from brownie import FundCloneableProxy, Fund
+
+fund_name = "Mudrex Generic Fund"
+fund_symbol = "MDXGF"
+change_delay_in_sec = 12 * 60 * 60
+salt = brownie.web3.keccak(text="STAB")
+
+def test_create_fund_deterministic_from_non_governance_account(fund_factory, accounts, fund, token):
+    with brownie.reverts("Not governance"):
+        fund_factory.createFundDeterministic(fund, token, fund_name, fund_symbol, salt, {'from': accounts[1]})
+
+def test_create_fund_deterministic(fund_factory, accounts, fund, token):
+    predicted = fund_factory.predictFundAddress(salt)
+    tx = fund_factory.createFundDeterministic(fund, token, fund_name, fund_symbol, salt, {'from': accounts[0]})
+
+    assert tx.events["NewFund"].values() == [predicted]
+    assert FundCloneableProxy.at(predicted).implementation() == fund
+    fund_through_proxy = Fund.at(predicted)
+    assert fund_through_proxy.name() == fund_name
+    assert fund_through_proxy.governance() == accounts[0]
+
+def test_create_fund_deterministic_same_salt(fund_factory, accounts, fund, token):
+    fund_factory.createFundDeterministic(fund, token, fund_name, fund_symbol, salt, {'from': accounts[0]})
+    with brownie.reverts():
+        fund_factory.createFundDeterministic(fund, token, fund_name, fund_symbol, salt, {'from': accounts[0]})
+
+def test_cloned_proxy_initialized_once(fund_factory, accounts, fund, fund_2, token):
+    tx = fund_factory.createFundDeterministic(fund, token, fund_name, fund_symbol, salt, {'from': accounts[0]})
+    with brownie.reverts("Proxy already initialized"):
+        FundCloneableProxy.at(tx.return_value).initializeProxy(fund_2, {'from': accounts[1]})
+
+def test_create_funds(fund_factory, accounts, fund, token, token_2):
+    salts = [brownie.web3.keccak(text="STAB"), brownie.web3.keccak(text="STAB2")]
+    tx = fund_factory.createFunds(fund, [token, token_2], [fund_name, fund_name + " 2"], [fund_symbol, fund_symbol + "2"], salts, {'from': accounts[0]})
+
+    assert tx.return_value == [fund_factory.predictFundAddress(s) for s in salts]
+    assert Fund.at(tx.return_value[1]).underlying() == token_2
+    assert Fund.at(tx.return_value[1]).symbol() == fund_symbol + "2"
+
+def test_create_funds_lengths_do_not_match(fund_factory, accounts, fund, token, token_2):
+    with brownie.reverts("Lengths do not match"):
+        fund_factory.createFunds(fund, [token, token_2], [fund_name], [fund_symbol], [salt], {'from': accounts[0]})
+
+def test_upgrade_cloned_fund(chain, fund_factory, accounts, fund, fund_2, token):
+    tx = fund_factory.createFundDeterministic(fund, token, fund_name, fund_symbol, salt, {'from': accounts[0]})
+    fund_address = tx.return_value
+    fund_through_proxy = Fund.at(fund_address)
+    fund_through_proxy.scheduleUpgrade(fund_2, {'from': accounts[0]})
+    fund_through_proxy.setDepositLimit(10, {'from': accounts[0]})
+    Fund.remove(fund_through_proxy)
+
+    fund_proxy = FundCloneableProxy.at(fund_address)
+    with brownie.reverts("Upgrade not scheduled"):
+        fund_proxy.upgrade(fund_2, {'from': accounts[0]})
+
+    chain.sleep(change_delay_in_sec + 1)
+    fund_proxy.upgrade(fund_2, {'from': accounts[0]})
+
+    assert fund_proxy.implementation() == fund_2
+    FundCloneableProxy.remove(fund_proxy)
+    assert Fund.at(fund_address).depositLimit() == 10
@@ -84,6 +84,40 @@ def test_changed_deposit_limit_after_upgrade(chain, fund_proxy, accounts, fund_2
     
     assert fund_through_proxy.depositLimit() == 10
 
+def test_partial_hard_work_after_upgrade(chain, fund_proxy, accounts, fund_2, token, ProfitStrategy):
+    fund_proxy_address = fund_proxy.address
+    FundProxy.remove(fund_proxy)
+    fund_through_proxy = Fund.at(fund_proxy_address)
+    fund_through_proxy.setFundManager(accounts[1], {'from': accounts[0]})
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+    profit_strategy = ProfitStrategy.deploy(fund_through_proxy, 1000, {'from': accounts[0]})
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    fund_through_proxy.doHardWorkFor(profit_strategy, {'from': accounts[1]})
+    fund_through_proxy.scheduleUpgrade(fund_2, {'from': accounts[0]})
+
+    Fund.remove(fund_through_proxy)
+    fund_proxy = FundProxy.at(fund_proxy_address)
+
+    chain.sleep(change_delay_in_sec + 1)
+
+    fund_proxy.upgrade(fund_2, {'from': accounts[0]})
+
+    FundProxy.remove(fund_proxy)
+    fund_through_proxy = Fund.at(fund_proxy_address)
+
+    ## the last balances are only trusted again after a full hard work
+    with brownie.reverts("Full hard work required first"):
+        fund_through_proxy.doHardWorkFor(profit_strategy, {'from': accounts[1]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    tx = fund_through_proxy.doHardWorkFor(profit_strategy, {'from': accounts[1]})
+
+    assert tx.events["HardWorkRangeDone"]["start"] == 0
+
 def test_schedule_upgrade_for_zero_address(fund_proxy, zero_account, accounts):
     fund_proxy_address = fund_proxy.address
     # FundProxy.remove(fund_proxy)
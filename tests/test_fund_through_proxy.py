@@ -52,6 +52,17 @@ def test_set_deposit_limit(fund_through_proxy, accounts):
     
     assert fund_through_proxy.depositLimit() == 10
 
+def test_set_deposit_limit_too_large(fund_through_proxy, accounts):
+    fund_through_proxy.setDepositLimit(2**128 - 1, {'from': accounts[1]})
+    assert fund_through_proxy.depositLimit() == 2**128 - 1
+
+    with brownie.reverts("Limit too large"):
+        fund_through_proxy.setDepositLimit(2**128, {'from': accounts[1]})
+    with brownie.reverts("Limit too large"):
+        fund_through_proxy.setDepositLimitTxMax(2**128, {'from': accounts[1]})
+    with brownie.reverts("Limit too large"):
+        fund_through_proxy.setDepositLimitTxMin(2**128, {'from': accounts[1]})
+
 def test_set_deposit_limit_with_random_account(fund_through_proxy, accounts):
     
     with brownie.reverts("Not fund manager"):
@@ -114,3 +125,23 @@ def test_set_platform_fee_fund_greater_than_max(fund_through_proxy, accounts):
 def test_set_platform_fee_with_random_account(fund_through_proxy, accounts):
     with brownie.reverts("Not governance"):
         fund_through_proxy.setPlatformFee(100, {'from': accounts[1]})
+
+def test_packed_config_values_are_independent(fund_through_proxy, accounts, token):
+    fund_through_proxy.setDepositLimit(2**100, {'from': accounts[1]})
+    fund_through_proxy.setDepositLimitTxMax(2**90, {'from': accounts[1]})
+    fund_through_proxy.setDepositLimitTxMin(2**80, {'from': accounts[1]})
+    fund_through_proxy.setPerformanceFeeFund(1000, {'from': accounts[1]})
+    fund_through_proxy.setPlatformFee(500, {'from': accounts[0]})
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+
+    assert fund_through_proxy.depositLimit() == 2**100
+    assert fund_through_proxy.depositLimitTxMax() == 2**90
+    assert fund_through_proxy.depositLimitTxMin() == 2**80
+    assert fund_through_proxy.performanceFeeFund() == 1000
+    assert fund_through_proxy.platformFee() == 500
+    assert fund_through_proxy.navCacheEnabled() == True
+    assert fund_through_proxy.decimals() == token.decimals()
+
+def test_set_deposit_limit_too_large(fund_through_proxy, accounts):
+    with brownie.reverts("Packed value too large"):
+        fund_through_proxy.setDepositLimit(2**128, {'from': accounts[1]})
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def test_buffer_policy_by_non_fund_manager(fund_through_proxy, accounts):
+    with brownie.reverts("Not fund manager"):
+        fund_through_proxy.setBufferPolicy(2000, 500, {'from': accounts[0]})
+
+def test_buffer_band_greater_than_target(fund_through_proxy, accounts):
+    with brownie.reverts("Buffer band greater than target"):
+        fund_through_proxy.setBufferPolicy(2000, 2500, {'from': accounts[1]})
+
+def test_buffer_kept_idle_at_hard_work(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setBufferPolicy(2000, 500, {'from': accounts[1]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## capital above the buffer is split by relative weightage
+    assert profit_strategy_10.investedUnderlyingBalance() == 80/100 * 50000000
+    assert token.balanceOf(fund_through_proxy) == 20/100 * 50000000
+    assert tx.events["BufferStatus"]["idleBalance"] == 20/100 * 50000000
+    assert tx.events["BufferStatus"]["targetBalance"] == 20/100 * 50000000
+
+def test_withdraw_served_from_buffer(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setBufferPolicy(2000, 500, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.withdraw(1000000, {'from': accounts[3]})
+
+    assert profit_strategy_10.investedUnderlyingBalance() == 80/100 * 50000000
+
+    ## buffer is still within the band, so no capital is moved
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert profit_strategy_10.investedUnderlyingBalance() == 80/100 * 50000000
+    assert tx.events["BufferStatus"]["withdrawalsFromBuffer"] == 1
+    assert tx.events["BufferStatus"]["withdrawalsFromStrategies"] == 0
+
+def test_buffer_refilled_outside_band(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setBufferPolicy(2000, 500, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.withdraw(5000000, {'from': accounts[3]})
+    fund_through_proxy.withdraw(10000000, {'from': accounts[3]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert tx.events["BufferStatus"]["withdrawalsFromBuffer"] == 1
+    assert tx.events["BufferStatus"]["withdrawalsFromStrategies"] == 1
+    assert profit_strategy_10.investedUnderlyingBalance() == 80/100 * 35000000
+    assert token.balanceOf(fund_through_proxy) == 20/100 * 35000000
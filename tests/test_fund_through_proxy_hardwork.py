@@ -85,6 +85,26 @@ def test_hard_work_multiple_strategies(fund_through_proxy, accounts, token, prof
     assert profit_strategy_50.investedUnderlyingBalance() == (20/100 * 50000000) * (1 + 50/100)
     assert fund_through_proxy.getPricePerShare() == fund_through_proxy.underlyingUnit() * (((50/100 * 50000000) * (1 + 10/100)) + ((20/100 * 50000000) * (1 + 50/100)) + (30/100 * 50000000)) / 50000000
 
+def test_hard_work_done_event_matches_tvl_multiple_strategies(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 500, {'from': accounts[1]})
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_50, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 2000, 500, {'from': accounts[1]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    profit_strategy_50.investAllUnderlying({'from': accounts[0]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})   ## fees are processed from the balance snapshot
+
+    assert tx.events["HardWorkDone"].values() == [fund_through_proxy.totalValueLocked(), fund_through_proxy.getPricePerShare()]
+    assert fund_through_proxy.getStrategy(profit_strategy_10)[3] == profit_strategy_10.investedUnderlyingBalance()
+    assert fund_through_proxy.getStrategy(profit_strategy_50)[3] == profit_strategy_50.investedUnderlyingBalance()
+
 def test_remove_strategy_after_hard_work_multiple_strategies(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
     token.mint(accounts[3], 100000000, {'from': accounts[0]})
     token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
@@ -150,7 +170,7 @@ def test_hard_work_single_strategy_creator_fee_to_account(fund_through_proxy, ac
     tx = fund_through_proxy.doHardWork({'from': accounts[1]})   ## zero profit for first hard work, run again to test
     expected_profit = (50/100 * 50000000) * (10/100)
     expected_strategy_creator_fee = expected_profit * (500/10000) / price_per_share
-    assert fund_through_proxy.balanceOf(accounts[0]) == expected_strategy_creator_fee
+    assert fund_through_proxy.claimableFeeShares(accounts[0]) == expected_strategy_creator_fee
 
 def test_hard_work_single_strategy_creator_fee_fund_fee_to_account(fund_through_proxy, accounts, token, profit_strategy_10):
     token.mint(accounts[3], 100000000, {'from': accounts[0]})
@@ -174,7 +194,7 @@ def test_hard_work_single_strategy_creator_fee_fund_fee_to_account(fund_through_
     expected_strategy_creator_fee_in_underlying = expected_profit * (500/10000)
     expected_strategy_creator_fee = expected_strategy_creator_fee_in_underlying / price_per_share
     expected_fund_performance_fee = (expected_profit - expected_strategy_creator_fee_in_underlying) * (500/10000) / price_per_share
-    assert float(fund_through_proxy.balanceOf(accounts[0])) == pytest.approx(expected_strategy_creator_fee, rel=1e-5)
+    assert float(fund_through_proxy.claimableFeeShares(accounts[0])) == pytest.approx(expected_strategy_creator_fee, rel=1e-5)
     assert [float(i) for i in tx.events["FundManagerRewards"].values()] == pytest.approx([expected_profit - expected_strategy_creator_fee_in_underlying, expected_fund_performance_fee], rel=1e-4)
 
 def test_hard_work_single_strategy_creator_fee_fund_fee_platform_fee_to_account(chain, fund_through_proxy, accounts, token, profit_strategy_10):
@@ -202,7 +222,7 @@ def test_hard_work_single_strategy_creator_fee_fund_fee_platform_fee_to_account(
     expected_strategy_creator_fee = expected_strategy_creator_fee_in_underlying / price_per_share
     expected_fund_performance_fee = (expected_profit - expected_strategy_creator_fee_in_underlying) * (500/10000) / price_per_share  ## goes to fund manager
     expected_platform_fee = 7 / price_per_share
-    assert float(fund_through_proxy.balanceOf(accounts[0])) == pytest.approx(expected_strategy_creator_fee + expected_platform_fee, rel=1e-5)
+    assert float(fund_through_proxy.claimableFeeShares(accounts[0])) == pytest.approx(expected_strategy_creator_fee + expected_platform_fee, rel=1e-5)
     assert [float(v) for v in tx.events["PlatformRewards"].values()] == [50/100 * 50000000, pytest.approx(1000, abs=5), pytest.approx(7, abs=1)]
 
 
@@ -231,10 +251,10 @@ def test_hard_work_single_strategy_creator_fee_fund_fee_platform_fee_to_new_rewa
     expected_strategy_creator_fee_in_underlying = expected_profit * (500/10000)
     expected_strategy_creator_fee = expected_strategy_creator_fee_in_underlying / price_per_share
     expected_fund_performance_fee = (expected_profit - expected_strategy_creator_fee_in_underlying) * (500/10000) / price_per_share
-    assert fund_through_proxy.balanceOf(accounts[0]) == expected_strategy_creator_fee
-    assert float(fund_through_proxy.balanceOf(accounts[1])) == pytest.approx(expected_fund_performance_fee, rel=1e-4)
+    assert fund_through_proxy.claimableFeeShares(accounts[0]) == expected_strategy_creator_fee
+    assert float(fund_through_proxy.claimableFeeShares(accounts[1])) == pytest.approx(expected_fund_performance_fee, rel=1e-4)
     expected_platform_fee = 7 / price_per_share
-    assert fund_through_proxy.balanceOf(accounts[5]) >= expected_platform_fee  ## Accounts for any dust
+    assert fund_through_proxy.claimableFeeShares(accounts[5]) >= expected_platform_fee  ## Accounts for any dust
 
 
 def test_rebalance_single_strategy_weight_change(fund_through_proxy, accounts, token, profit_strategy_10):
@@ -288,3 +308,34 @@ def test_rebalance_single_strategy_manual(fund_through_proxy, accounts, token, p
 
 #     assert profit_strategy_10.investedUnderlyingBalance() == (70/100 * 50000000)
 #     assert profit_strategy_50.investedUnderlyingBalance() == (10/100 * 50000000)
+
+def test_claim_fees(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 500, {'from': accounts[1]})
+    fund_through_proxy.setPerformanceFeeFund(500, {'from': accounts[1]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## fee shares stay in the fund until claimed
+    creator_fee = tx.events["StrategyRewards"]["strategyCreatorFee"]
+    fund_manager_fee = tx.events["FundManagerRewards"]["fundManagerFee"]
+    claimable = fund_through_proxy.claimableFeeShares(accounts[0])   ## creator fee and any dust to platform
+    assert claimable >= creator_fee
+    assert fund_through_proxy.balanceOf(accounts[0]) == 0
+    assert fund_through_proxy.balanceOf(fund_through_proxy) == claimable + fund_manager_fee
+    assert fund_through_proxy.unclaimedFeeShares() == claimable + fund_manager_fee
+
+    fund_through_proxy.claimFees({'from': accounts[0]})
+    tx = fund_through_proxy.claimFeesFor([accounts[1], accounts[4]], {'from': accounts[4]})
+
+    assert tx.events["FeesClaimed"].values() == [accounts[1], fund_manager_fee]
+    assert fund_through_proxy.balanceOf(accounts[0]) == claimable
+    assert fund_through_proxy.balanceOf(accounts[1]) == fund_manager_fee
+    assert fund_through_proxy.claimableFeeShares(accounts[0]) == 0
+    assert fund_through_proxy.unclaimedFeeShares() == 0
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def test_hard_work_range_invalid(fund_through_proxy, accounts, profit_strategy_10):
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    with brownie.reverts("Invalid strategy range"):
+        fund_through_proxy.doHardWorkRange(0, 2, {'from': accounts[1]})
+
+def test_hard_work_range_by_random_account(fund_through_proxy, accounts, profit_strategy_10):
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    with brownie.reverts("Not fund manager or relayer"):
+        fund_through_proxy.doHardWorkRange(0, 1, {'from': accounts[4]})
+
+def test_hard_work_range_without_strategies(fund_through_proxy, accounts):
+    with brownie.reverts("Strategies must be defined"):
+        fund_through_proxy.doHardWorkRange(0, 0, {'from': accounts[1]})
+
+def test_hard_work_for_inactive_strategy(fund_through_proxy, accounts, profit_strategy_10, profit_strategy_50):
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    with brownie.reverts("This strategy is not active in this fund"):
+        fund_through_proxy.doHardWorkFor(profit_strategy_10, {'from': accounts[1]})
+
+def test_hard_work_for_before_full_hard_work(fund_through_proxy, accounts, profit_strategy_10):
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    with brownie.reverts("Full hard work required first"):
+        fund_through_proxy.doHardWorkFor(profit_strategy_10, {'from': accounts[1]})
+
+def test_hard_work_for_single_strategy(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_50, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 1000, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 1000, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    profit_strategy_50.investAllUnderlying({'from': accounts[0]})
+
+    tx = fund_through_proxy.doHardWorkFor(profit_strategy_10, {'from': accounts[3]})
+
+    ## only the profit of this strategy is processed, the other strategy is valued at its last balance
+    assert len(tx.events["StrategyRewards"]) == 1
+    assert tx.events["StrategyRewards"]["strategy"] == profit_strategy_10
+    assert tx.events["StrategyRewards"]["profit"] == (40/100 * 50000000) * (10/100)
+    assert tx.events["HardWorkRangeDone"]["totalValueLocked"] == 52000000
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 52000000
+    assert profit_strategy_50.investedUnderlyingBalance() == (40/100 * 50000000) * (1 + 50/100)
+
+def test_hard_work_range_all_strategies(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_50, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    profit_strategy_50.investAllUnderlying({'from': accounts[0]})
+
+    fund_through_proxy.doHardWorkRange(0, 1, {'from': accounts[3]})
+    tx = fund_through_proxy.doHardWorkRange(1, 2, {'from': accounts[3]})
+
+    assert tx.events["HardWorkRangeDone"]["totalValueLocked"] == 62000000
+    assert fund_through_proxy.totalValueLocked() == 62000000
+    assert profit_strategy_50.investedUnderlyingBalance() == 40/100 * 62000000
+
+def test_hard_work_for_after_withdrawal_from_strategies(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## beyond the idle underlying, so each strategy returns 10000000
+    fund_through_proxy.withdraw(30000000, {'from': accounts[3]})
+    assert fund_through_proxy.getStrategy(profit_strategy_50)[3] == 10000000
+
+    tx = fund_through_proxy.doHardWorkFor(profit_strategy_10, {'from': accounts[1]})
+
+    ## the other strategy is valued without the capital it returned
+    live_balance = profit_strategy_10.investedUnderlyingBalance() + profit_strategy_50.investedUnderlyingBalance() + token.balanceOf(fund_through_proxy)
+    assert tx.events["HardWorkRangeDone"]["totalValueLocked"] == live_balance
+    assert live_balance == 20000000
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def test_nav_cache_enabled_by_non_governance(fund_through_proxy, accounts):
+    with brownie.reverts("Not governance"):
+        fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[1]})
+
+def test_nav_cache_max_age_above_limit(fund_through_proxy, accounts):
+    with brownie.reverts("Max age greater than max limit"):
+        fund_through_proxy.setNavCacheMaxAge(8 * 24 * 60 * 60, {'from': accounts[0]})
+
+def test_nav_cache_not_valid_before_hard_work(fund_through_proxy, accounts):
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+
+    assert fund_through_proxy.navCacheEnabled() == True
+    assert fund_through_proxy.isNavCacheValid() == False
+
+def test_nav_cache_updated_on_hard_work(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert fund_through_proxy.isNavCacheValid() == True
+    assert fund_through_proxy.cachedStrategiesBalance() == 50/100 * 50000000
+    assert tx.events["NavCacheUpdated"]["strategiesBalance"] == 50/100 * 50000000
+
+def test_nav_cache_prices_shares_until_next_hard_work(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+
+    ## profit is not part of the cached valuation yet
+    assert fund_through_proxy.getPricePerShare() == fund_through_proxy.underlyingUnit()
+    assert fund_through_proxy.totalValueLocked() == ((50/100 * 50000000) * (1 + 10/100)) + (50/100 * 50000000)
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert fund_through_proxy.getPricePerShare() == fund_through_proxy.underlyingUnit() * (((50/100 * 50000000) * (1 + 10/100)) + (50/100 * 50000000)) / 50000000
+
+def test_nav_cache_falls_back_to_live_when_stale(chain, fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+    fund_through_proxy.setNavCacheMaxAge(1000, {'from': accounts[0]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    chain.mine(timedelta=1001)
+
+    assert fund_through_proxy.isNavCacheValid() == False
+    assert fund_through_proxy.getPricePerShare() == fund_through_proxy.underlyingUnit() * (((50/100 * 50000000) * (1 + 10/100)) + (50/100 * 50000000)) / 50000000
+
+def test_nav_cache_reduced_on_withdrawal_from_strategies(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    fund_through_proxy.withdraw(40000000, {'from': accounts[3]})
+
+    assert fund_through_proxy.cachedStrategiesBalance() == profit_strategy_10.investedUnderlyingBalance()
+    assert token.balanceOf(accounts[3]) == 90000000
+
+def test_nav_cache_reset_on_strategy_removal(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.setNavCacheEnabled(True, {'from': accounts[0]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    fund_through_proxy.removeStrategy(profit_strategy_10, {'from': accounts[1]})
+
+    assert fund_through_proxy.isNavCacheValid() == False
+    assert fund_through_proxy.getPricePerShare() == fund_through_proxy.underlyingUnit()
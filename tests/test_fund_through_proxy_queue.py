@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def test_queue_mode_enabled_by_non_fund_manager(fund_through_proxy, accounts):
+    with brownie.reverts("Not governance or fund manager"):
+        fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[3]})
+
+def test_request_deposit_when_queue_mode_not_active(fund_through_proxy, accounts, token):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    with brownie.reverts("Queue mode is not active"):
+        fund_through_proxy.requestDeposit(50000000, {'from': accounts[3]})
+
+def test_instant_deposit_and_withdraw_when_queue_mode_active(fund_through_proxy, accounts, token):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(25000000, {'from': accounts[3]})
+    fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[1]})
+
+    with brownie.reverts("Queue mode is active"):
+        fund_through_proxy.deposit(25000000, {'from': accounts[3]})
+    with brownie.reverts("Queue mode is active"):
+        fund_through_proxy.withdraw(25000000, {'from': accounts[3]})
+
+def test_queued_deposit_not_part_of_fund_value(fund_through_proxy, accounts, token):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[1]})
+
+    tx = fund_through_proxy.requestDeposit(50000000, {'from': accounts[3]})
+
+    assert tx.events["DepositQueued"]["epoch"] == 0
+    assert fund_through_proxy.pendingDeposits() == 50000000
+    assert fund_through_proxy.totalValueLocked() == 0
+    assert fund_through_proxy.balanceOf(accounts[3]) == 0
+
+def test_queued_deposit_settled_at_hard_work(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[1]})
+    fund_through_proxy.requestDeposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert tx.events["QueueSettled"]["epoch"] == 0
+    assert tx.events["QueueSettled"]["sharesMinted"] == 50000000
+    assert fund_through_proxy.currentEpoch() == 1
+    assert fund_through_proxy.pendingDeposits() == 0
+    assert fund_through_proxy.totalValueLocked() == 50000000
+    assert profit_strategy_10.investedUnderlyingBalance() == 50/100 * 50000000
+
+    fund_through_proxy.claimQueued({'from': accounts[3]})
+
+    assert fund_through_proxy.balanceOf(accounts[3]) == 50000000
+    assert fund_through_proxy.balanceOf(fund_through_proxy) == 0
+
+def test_queued_withdrawal_settled_at_hard_work(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[1]})
+    tx = fund_through_proxy.requestWithdraw(40000000, {'from': accounts[3]})
+
+    assert tx.events["WithdrawalQueued"]["numberOfShares"] == 40000000
+    assert fund_through_proxy.pendingWithdrawShares() == 40000000
+    assert fund_through_proxy.balanceOf(accounts[3]) == 10000000
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert tx.events["QueueSettled"]["sharesBurned"] == 40000000
+    assert fund_through_proxy.reservedWithdrawals() == 40000000
+    assert fund_through_proxy.totalValueLocked() == 10000000
+    assert fund_through_proxy.totalSupply() == 10000000
+
+    fund_through_proxy.claimQueued({'from': accounts[3]})
+
+    assert token.balanceOf(accounts[3]) == 90000000
+    assert fund_through_proxy.reservedWithdrawals() == 0
+
+def test_queued_requests_netted_in_same_epoch(fund_through_proxy, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.mint(accounts[4], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    token.approve(fund_through_proxy, 20000000, {'from': accounts[4]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[1]})
+    fund_through_proxy.requestWithdraw(20000000, {'from': accounts[3]})
+    fund_through_proxy.requestDeposit(20000000, {'from': accounts[4]})
+
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    fund_through_proxy.claimQueued({'from': accounts[3]})
+    fund_through_proxy.claimQueued({'from': accounts[4]})
+
+    assert token.balanceOf(accounts[3]) == 70000000
+    assert fund_through_proxy.balanceOf(accounts[4]) == 20000000
+    assert fund_through_proxy.totalValueLocked() == 50000000
+
+def test_claim_before_settlement_keeps_request_queued(fund_through_proxy, accounts, token):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.setQueueModeEnabled(True, {'from': accounts[1]})
+    fund_through_proxy.requestDeposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.claimQueued({'from': accounts[3]})
+
+    assert fund_through_proxy.queuedRequests(accounts[3])["depositAmount"] == 50000000
+    assert fund_through_proxy.balanceOf(accounts[3]) == 0
+
+def test_sweep_fund_shares(fund_through_proxy, accounts):
+    with brownie.reverts("can not sweep fund shares"):
+        fund_through_proxy.sweep(fund_through_proxy, accounts[0], {'from': accounts[0]})
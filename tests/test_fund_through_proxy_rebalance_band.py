@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def test_rebalance_tolerance_by_non_fund_manager(fund_through_proxy, accounts):
+    with brownie.reverts("Not fund manager"):
+        fund_through_proxy.setRebalanceTolerance(200, {'from': accounts[0]})
+
+def test_movement_cost_for_inactive_strategy(fund_through_proxy, accounts, profit_strategy_10):
+    with brownie.reverts("This strategy is not active in this fund"):
+        fund_through_proxy.updateStrategyMovementCost(profit_strategy_10, 100, {'from': accounts[1]})
+
+def test_rebalance_skips_strategies_within_tolerance(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_50, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    fund_through_proxy.setRebalanceTolerance(200, {'from': accounts[1]})
+    fund_through_proxy.setShouldRebalance(True, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## drift of 1.2M is above the 2% band (1.04M), drift of 0.8M is within it
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 52000000
+    assert profit_strategy_50.investedUnderlyingBalance() == 40/100 * 50000000
+
+def test_capped_rebalance_moves_cheapest_first(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 60000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_50, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.deposit(10000000, {'from': accounts[3]})
+    fund_through_proxy.updateStrategyMovementCost(profit_strategy_10, 100, {'from': accounts[1]})
+    fund_through_proxy.updateStrategyMovementCost(profit_strategy_50, 10, {'from': accounts[1]})
+    fund_through_proxy.setRebalanceMaxMovement(5000000, {'from': accounts[1]})
+    fund_through_proxy.setShouldRebalance(True, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert profit_strategy_50.investedUnderlyingBalance() == 40/100 * 60000000
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 50000000 + 1000000
+
+    ## the rest is moved in the next hard work
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 60000000
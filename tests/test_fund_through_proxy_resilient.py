@@ -0,0 +1,83 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def test_resilient_hard_work_by_random_account(fund_through_proxy, accounts):
+    with brownie.reverts("Not governance or fund manager"):
+        fund_through_proxy.setResilientHardWork(True, {'from': accounts[3]})
+
+def test_failing_strategy_reverts_hard_work(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    profit_strategy_50.setFailing(True, {'from': accounts[0]})
+
+    with brownie.reverts("Strategy is failing"):
+        fund_through_proxy.doHardWork({'from': accounts[1]})
+
+def test_failing_hard_work_skipped_in_resilient_mode(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.setResilientHardWork(True, {'from': accounts[1]})
+    profit_strategy_50.setFailing(True, {'from': accounts[0]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert tx.events["StrategyHardWorkFailed"][0]["strategy"] == profit_strategy_50
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 50000000
+    assert fund_through_proxy.totalValueLocked() == 50000000
+    assert "HardWorkDone" in tx.events
+
+def test_failing_withdrawal_skipped_in_resilient_mode(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.setResilientHardWork(True, {'from': accounts[1]})
+    fund_through_proxy.updateStrategyWeightage(profit_strategy_50, 2000, {'from': accounts[1]})
+    profit_strategy_50.setFailing(True, {'from': accounts[0]})
+
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## capital of the failing strategy is not moved in this cycle
+    assert tx.events["StrategyHardWorkFailed"][0]["strategy"] == profit_strategy_50
+    assert profit_strategy_50.investedUnderlyingBalance() == 40/100 * 50000000
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 50000000
+
+    profit_strategy_50.setFailing(False, {'from': accounts[0]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    assert profit_strategy_50.investedUnderlyingBalance() == 20/100 * 50000000
+
+def test_failing_balance_skipped_in_resilient_mode(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.addStrategy(profit_strategy_10, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 4000, 0, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    profit_strategy_50.setFailingBalance(True, {'from': accounts[0]})
+    with brownie.reverts("Balance is failing"):
+        fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    fund_through_proxy.setResilientHardWork(True, {'from': accounts[1]})
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## valued at its last balance instead of reverting the hard work
+    assert tx.events["StrategyHardWorkFailed"][0]["strategy"] == profit_strategy_50
+    assert "HardWorkDone" in tx.events
+    assert profit_strategy_10.investedUnderlyingBalance() == 40/100 * 50000000
+    assert fund_through_proxy.strategies(profit_strategy_50)[3] == 40/100 * 50000000
@@ -166,4 +166,20 @@ def test_update_strategy_performance_fee(fund_through_proxy, accounts, profit_st
     tx = fund_through_proxy.updateStrategyPerformanceFee(profit_strategy_10, 200, {'from': accounts[1]})
 
     assert fund_through_proxy.getStrategy(profit_strategy_10)[1] == 200
-    assert tx.events["StrategyPerformanceFeeUpdated"].values() == [profit_strategy_10, 200]
\ No newline at end of file
+    assert tx.events["StrategyPerformanceFeeUpdated"].values() == [profit_strategy_10, 200]
+
+def test_strategy_params_after_remove_and_hard_work(fund_through_proxy, accounts, token, profit_strategy_10, profit_strategy_50, profit_strategy_80):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 500, {'from': accounts[1]})
+    fund_through_proxy.addStrategy(profit_strategy_50, 2000, 500, {'from': accounts[1]})
+    tx = fund_through_proxy.addStrategy(profit_strategy_80, 1000, 300, {'from': accounts[1]})
+    fund_through_proxy.removeStrategy(profit_strategy_10, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## last strategy moves to the index of the removed one
+    assert fund_through_proxy.getStrategy(profit_strategy_80) == (1000, 300, tx.timestamp, 10/100 * 50000000, 0)
+    assert fund_through_proxy.strategies(profit_strategy_80) == fund_through_proxy.getStrategy(profit_strategy_80)
+    assert fund_through_proxy.getStrategy(profit_strategy_10) == (0, 0, 0, 0, 0)
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+
+import pytest, brownie
+
+def leaf(index, account, amount):
+    return brownie.web3.keccak(index.to_bytes(32, "big") + bytes.fromhex(str(account)[2:]) + amount.to_bytes(32, "big"))
+
+def hash_pair(a, b):
+    return brownie.web3.keccak(a + b if a <= b else b + a)
+
+@pytest.fixture
+def distributor(MerkleDistributor, fund_through_proxy, accounts):
+    distributor = MerkleDistributor.deploy(fund_through_proxy, {'from': accounts[0]})
+    fund_through_proxy.setFeeDistributor(distributor, {'from': accounts[0]})
+    return distributor
+
+def test_set_fee_distributor_by_non_governance(fund_through_proxy, accounts):
+    with brownie.reverts("Not governance"):
+        fund_through_proxy.setFeeDistributor(accounts[5], {'from': accounts[1]})
+
+def test_publish_root_by_non_governance(distributor, accounts):
+    with brownie.reverts("Not governance"):
+        distributor.publishRoot(brownie.web3.keccak(text="root"), {'from': accounts[1]})
+
+def test_fees_claimed_from_distributor(fund_through_proxy, distributor, accounts, token, profit_strategy_10):
+    token.mint(accounts[3], 100000000, {'from': accounts[0]})
+    token.approve(fund_through_proxy, 50000000, {'from': accounts[3]})
+    fund_through_proxy.deposit(50000000, {'from': accounts[3]})
+
+    token.grantRole(brownie.web3.keccak(text="MINTER_ROLE"), profit_strategy_10, {'from': accounts[0]})
+    fund_through_proxy.addStrategy(profit_strategy_10, 5000, 500, {'from': accounts[1]})
+    fund_through_proxy.doHardWork({'from': accounts[1]})
+    profit_strategy_10.investAllUnderlying({'from': accounts[0]})
+    tx = fund_through_proxy.doHardWork({'from': accounts[1]})
+
+    ## creator fee is accrued to the distributor instead of the creator
+    creator_fee = tx.events["StrategyRewards"]["strategyCreatorFee"]
+    pot = fund_through_proxy.claimableFeeShares(distributor)
+    assert pot >= creator_fee
+    assert fund_through_proxy.claimableFeeShares(accounts[0]) == 0
+
+    leaves = [leaf(0, accounts[0], creator_fee), leaf(1, accounts[5], pot - creator_fee)]
+    root = hash_pair(leaves[0], leaves[1])
+    tx = distributor.publishRoot(root, {'from': accounts[0]})
+
+    assert tx.events["RootPublished"].values() == [0, root.hex()]
+    assert fund_through_proxy.balanceOf(distributor) == pot
+    assert distributor.merkleRoot() == root.hex()
+
+    with brownie.reverts("Invalid proof"):
+        distributor.claim(0, accounts[0], creator_fee + 1, [leaves[1]], {'from': accounts[0]})
+
+    tx = distributor.claim(0, accounts[0], creator_fee, [leaves[1]], {'from': accounts[4]})
+
+    assert tx.events["Claimed"].values() == [0, accounts[0], creator_fee]
+    assert fund_through_proxy.balanceOf(accounts[0]) == creator_fee
+    assert distributor.isClaimed(0)
+    assert not distributor.isClaimed(1)
+
+    with brownie.reverts("Drop already claimed"):
+        distributor.claim(0, accounts[0], creator_fee, [leaves[1]], {'from': accounts[0]})
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+
+import pytest
+
+from scripts import merkle_tree
+
+
+def naive_root(leaves):
+    level = leaves
+    while len(level) > 1:
+        parents = [merkle_tree.hash_pair(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2 == 1:
+            parents.append(level[-1])
+        level = parents
+    return level[0]
+
+
+def claims(n):
+    return [("0x" + (i + 1).to_bytes(20, "big").hex(), (i + 1) * 10 ** 18) for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 8, 33])
+def test_root_and_proofs(tmp_path, monkeypatch, n):
+    monkeypatch.setattr(merkle_tree, "BATCH_SIZE", 4)   ## several batches per level
+    root = merkle_tree.build(iter(claims(n)), str(tmp_path / "tree.bin"))
+    leaves = [merkle_tree.leaf_hash(i, account, amount) for i, (account, amount) in enumerate(claims(n))]
+
+    assert root == naive_root(leaves)
+    with merkle_tree.MerkleTreeFile(str(tmp_path / "tree.bin")) as tree:
+        for i, leaf in enumerate(leaves):
+            assert merkle_tree.verify(tree.proof(i), root, leaf)
+        with pytest.raises(IndexError):
+            tree.proof(n)
+
+
+def test_read_claims_csv_and_jsonl(tmp_path):
+    (tmp_path / "claims.csv").write_text("account,amount\n0x0000000000000000000000000000000000000001,5\n")
+    (tmp_path / "claims.jsonl").write_text('{"account": "0x0000000000000000000000000000000000000001", "amount": "5"}\n')
+
+    assert list(merkle_tree.read_claims(str(tmp_path / "claims.csv"))) == [("0x0000000000000000000000000000000000000001", 5)]
+    assert list(merkle_tree.read_claims(str(tmp_path / "claims.jsonl"))) == [("0x0000000000000000000000000000000000000001", 5)]